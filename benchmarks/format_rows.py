@@ -0,0 +1,72 @@
+"""Benchmark formatting of found books for display.
+
+Run from the project root with: `python -m benchmarks.format_rows`
+"""
+
+import sys
+import timeit
+
+from src.console_core.utils.coollors_text import FormatterColorText
+from src.console_core.utils.storage import BookStorage
+from src.models.book import Book
+
+ROWS = 100_000
+REPEAT = 5
+
+
+def make_records(count: int) -> list[dict]:
+    """Return stored book records."""
+    return [
+        {
+            "id": number,
+            "title": f"Title of the book {number}",
+            "author": f"Author {number % 1000}",
+            "year": str(1900 + number % 120),
+            "status": "в наличии.",
+        }
+        for number in range(1, count + 1)
+    ]
+
+
+def validated_view(records: list[dict]) -> str:
+    """Format rows through validated Book and one color call per row."""
+    printer = FormatterColorText()
+    books = (
+        Book(
+            _id=book["id"],
+            title=book["title"],
+            author=book["author"],
+            year=book["year"],
+            status=book["status"],
+        ).__str__()
+        for book in records
+    )
+    return "\n".join(
+        printer(book).bright_green().build_text() for book in books
+    )
+
+
+def template_view(records: list[dict]) -> str:
+    """Format rows with the template and colors applied once."""
+    books = map(BookStorage._book_view, records)
+    return FormatterColorText().bright_green().build_lines(books)
+
+
+def main() -> None:
+    """Print best time of every formatting path."""
+    records = make_records(ROWS)
+    if validated_view(records) != template_view(records):
+        sys.exit("Formatted output differs.")
+
+    for view in (validated_view, template_view):
+        seconds = min(
+            timeit.repeat(lambda: view(records), number=1, repeat=REPEAT)
+        )
+        print(
+            f"{view.__name__:<16}{seconds * 1000:8.1f} ms"
+            f"{ROWS / seconds:12.0f} rows/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
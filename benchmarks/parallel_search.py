@@ -0,0 +1,93 @@
+"""Benchmark search of the sharded catalog in parallel processes.
+
+Run from the project root with: `python -m benchmarks.parallel_search`
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterable
+from functools import partial
+from pathlib import Path
+
+from src.console_core.utils.crud import BookCRUD
+from src.console_core.utils.sharded_crud import ShardedBookCRUD, _search_shard
+
+ROWS = 1_000_000
+SHARD_ROWS = 125_000
+QUERIES = ("Author 7", "title of the book 99", "2019")
+
+
+def make_catalog(dir_path: Path, count: int) -> list[int]:
+    """Write shards of consecutive book IDs, return their first IDs."""
+    starts = list(range(1, count + 1, SHARD_ROWS))
+    for start in starts:
+        stop = min(start + SHARD_ROWS, count + 1)
+        BookCRUD(file_path=dir_path / f"books-{start}.json").replace_books(
+            {
+                "id": number,
+                "title": f"Title of the book {number}",
+                "author": f"Author {number % 1000}",
+                "year": str(1900 + number % 120),
+                "status": "в наличии.",
+            }
+            for number in range(start, stop)
+        )
+    with open(dir_path / ShardedBookCRUD.MANIFEST_NAME, "w") as file:
+        json.dump({"next_id": count + 1, "starts": starts}, file)
+    return starts
+
+
+def serial_search(dir_path: Path, query: str, starts: list[int]) -> list:
+    """Scan shards one by one in this process as workers scan them."""
+    found = []
+    for start, stop in zip(starts, starts[1:] + [2**63]):
+        path = str(dir_path / f"books-{start}.json")
+        found.extend(_search_shard(path, start, stop, query))
+    return found
+
+
+def best_time(search: Callable[[], Iterable]) -> tuple[float, int]:
+    """Return best time of three searches and count of found books."""
+    times, found = [], 0
+    for _ in range(3):
+        started = time.perf_counter()
+        found = sum(1 for _ in search())
+        times.append(time.perf_counter() - started)
+    return min(times), found
+
+
+def main() -> None:
+    """Print time of serial and parallel scans of every query."""
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else ROWS
+    workers = max(os.cpu_count() or 1, 2)
+    with tempfile.TemporaryDirectory() as tmp:
+        dir_path = Path(tmp)
+        starts = make_catalog(dir_path, rows)
+        parallel = ShardedBookCRUD(dir_path, search_workers=workers)
+        parallel.PARALLEL_MIN_BYTES = 0
+        print(f"{rows} rows, {len(starts)} shards, {workers} workers")
+        try:
+            for query in QUERIES:
+                serial_time, serial_found = best_time(
+                    partial(serial_search, dir_path, query, starts)
+                )
+                parallel_time, parallel_found = best_time(
+                    partial(parallel.find_books, query)
+                )
+                if serial_found != parallel_found:
+                    sys.exit(f"Found books differ for {query!r}.")
+                print(
+                    f"{query!r:<24}{serial_found:8} found"
+                    f"{serial_time * 1000:10.1f} ms serial"
+                    f"{parallel_time * 1000:10.1f} ms parallel"
+                    f"{serial_time / parallel_time:8.2f}x"
+                )
+        finally:
+            parallel.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Benchmark drawing console screens through the frame renderer.
+
+Run from the project root with: `python -m benchmarks.render_frames`
+"""
+
+import io
+import os
+import timeit
+
+from src.console_core.utils.coollors_text import FormatterColorText
+from src.console_core.utils.ioconsole import ConsoleOutput
+from src.console_core.utils.renderer import FrameRenderer
+
+FRAMES = 2_000
+SHELL_CLEARS = 20
+
+
+def draw(diff: bool) -> FrameRenderer:
+    """Draw main menu and search screens in turn, return the renderer."""
+    renderer = FrameRenderer(stream=io.StringIO(), diff=diff)
+    screener = ConsoleOutput(FormatterColorText(), renderer=renderer)
+    for number in range(FRAMES):
+        if number % 2:
+            screener.find_book_screen()
+        else:
+            screener.main_menu_screen()
+        renderer.flush()
+    return renderer
+
+
+def main() -> None:
+    """Print frames per second and bytes per frame of every mode."""
+    for diff in (False, True):
+        stats = draw(diff).stats()
+        print(
+            f"{'diff' if diff else 'full':<8}"
+            f"{stats.frames_per_second:10.0f} frames/s"
+            f"{stats.bytes_per_frame:8.0f} bytes/frame"
+        )
+    seconds = timeit.timeit(
+        lambda: os.system("clear > /dev/null"), number=SHELL_CLEARS
+    )
+    print(f"{'shell':<8}{SHELL_CLEARS / seconds:10.0f} clears/s")
+
+
+if __name__ == "__main__":
+    main()
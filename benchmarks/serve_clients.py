@@ -0,0 +1,72 @@
+"""Benchmark concurrent clients of the HTTP books service.
+
+Run from the project root with: `python -m benchmarks.serve_clients`
+"""
+
+import asyncio
+import json
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from src.console_core.server import BookServer
+from src.console_core.utils.crud import BookCRUD
+
+CLIENTS = (1, 10, 50)
+REQUESTS = 200
+WRITE_EVERY = 10
+
+
+async def request(reader, writer, method: str, path: str, data=None) -> int:
+    """Send a request on the connection, return the response status."""
+    body = b"" if data is None else json.dumps(data).encode()
+    head = f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n"
+    writer.write(head.encode() + b"\r\n" + body)
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while (line := await reader.readline()) != b"\r\n":
+        name, _, value = line.decode().partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def client(port: int) -> None:
+    """Find books, adding a book on every WRITE_EVERY request."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    book = {"title": "Poems", "author": "Esenin", "year": "1918"}
+    for number in range(REQUESTS):
+        if number % WRITE_EVERY:
+            await request(reader, writer, "GET", "/books?find=Esenin")
+        else:
+            await request(reader, writer, "POST", "/books", book)
+    writer.close()
+    await writer.wait_closed()
+
+
+async def run(path: Path, clients: int) -> float:
+    """Return requests per second served to the clients."""
+    server = BookServer(path=path, port=0)
+    await server.start()
+    try:
+        started = time.perf_counter()
+        await asyncio.gather(*(client(server.port) for _ in range(clients)))
+        return clients * REQUESTS / (time.perf_counter() - started)
+    finally:
+        await server.close()
+
+
+def main() -> None:
+    """Print requests per second of every count of clients."""
+    for clients in CLIENTS:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "books.json"
+            shutil.copy(BookCRUD.OUT_PATH / "books.json", path)
+            rate = asyncio.run(run(path, clients))
+        print(f"{clients:4} clients{rate:10.0f} requests/s")
+
+
+if __name__ == "__main__":
+    main()
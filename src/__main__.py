@@ -2,12 +2,16 @@
 # -*- coding: utf-8 -*-
 """Program entry point."""
 import os
+import sys
 
+from src.console_core import commands
 from src.main import main
 
 
 def run() -> None:
-    """Run the main function."""
+    """Run the console, or the command given in arguments."""
+    if sys.argv[1:]:
+        sys.exit(commands.main(sys.argv[1:]))
     os.environ["TERM"] = "xterm"
     main()
 
@@ -0,0 +1,372 @@
+"""Command line commands of the book utility."""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any
+
+from src.console_core.console import ConsoleRunner
+from src.console_core.replay import read_script, recording_reader, replay
+from src.console_core.server import HOST, PORT, serve
+from src.console_core.utils.backends import STORAGES, make_storage
+from src.console_core.utils.binary_crud import (
+    convert_binary_to_json,
+    convert_json_to_binary,
+)
+from src.console_core.utils.console_navigator import PointMenuPositions
+from src.console_core.utils.exporter import export_file, write_books
+from src.console_core.utils.front import make_front_console, parse_book_ids
+from src.console_core.utils.importer import (
+    FORMATS,
+    import_books,
+    import_file,
+    parse_json_lines,
+)
+from src.console_core.utils.sqlite_crud import migrate_json_to_sqlite
+from src.console_core.utils.storage import BookStorage
+
+logger = logging.getLogger(__name__)
+
+ERROR_EXIT = 2
+
+
+@contextmanager
+def open_storage(args: argparse.Namespace) -> Iterator[BookStorage]:
+    """Open the storage selected by the options and close it at exit."""
+    storage = make_storage(kind=args.storage, path=args.path)
+    try:
+        yield storage
+    finally:
+        storage.close()
+
+
+def print_json(data: Any) -> None:
+    """Print the result as one line of JSON."""
+    print(json.dumps(data, ensure_ascii=False))
+
+
+def read_book_ids(values: list[str]) -> list[int]:
+    """Return IDs of the arguments, of standard input if there are none.
+
+    Raises:
+        ValueError: If the values are not IDs or ranges of IDs.
+    """
+    return parse_book_ids(",".join(values or sys.stdin.read().split()))
+
+
+def migrate(args: argparse.Namespace) -> int:
+    """Copy the JSON catalog to the SQLite database."""
+    count = migrate_json_to_sqlite(json_path=args.source, db_path=args.target)
+    print(f"Migrated {count} books.")
+    return 0
+
+
+def convert(args: argparse.Namespace) -> int:
+    """Convert the catalog between JSON and binary formats."""
+    if args.to == "binary":
+        count = convert_json_to_binary(args.source, args.target)
+    else:
+        count = convert_binary_to_json(args.source, args.target)
+    print(f"Converted {count} books.")
+    return 0
+
+
+def import_catalog(args: argparse.Namespace) -> int:
+    """Import books of the CSV or JSON Lines file to the storage."""
+    with open_storage(args) as storage:
+        report = import_file(storage, args.file, file_format=args.format)
+    for reject in report.rejects:
+        print(f"Line {reject.line}: {reject.error}")
+    print(
+        f"Imported {report.imported} books, rejected {len(report.rejects)}"
+        f" rows, {report.rows_per_second:.0f} rows/s."
+    )
+    return 0
+
+
+def export_catalog(args: argparse.Namespace) -> int:
+    """Export books of the storage to the CSV or JSON Lines file."""
+    with open_storage(args) as storage:
+        count = export_file(
+            storage,
+            args.file,
+            file_format=args.format,
+            look_for_data=args.find,
+        )
+    if args.file != "-":
+        print(f"Exported {count} books.")
+    return 0
+
+
+def add_books(args: argparse.Namespace) -> int:
+    """Add the book of the options or books of JSON Lines on stdin.
+
+    Prints IDs given to the added books and the rejected rows.
+    """
+    if args.title is None and args.author is None and args.year is None:
+        rows = parse_json_lines(sys.stdin)
+    else:
+        book = {"title": args.title, "author": args.author, "year": args.year}
+        rows = iter([(1, book)])
+    with open_storage(args) as storage:
+        report = import_books(storage, rows)
+    print_json(
+        {
+            "ids": list(report.ids),
+            "rejects": [reject._asdict() for reject in report.rejects],
+        }
+    )
+    return ERROR_EXIT if report.rejects else 0
+
+
+def delete_books(args: argparse.Namespace) -> int:
+    """Delete books by IDs, prints count of deleted and missing IDs."""
+    try:
+        book_ids = read_book_ids(args.ids)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return ERROR_EXIT
+    with open_storage(args) as storage:
+        missing = storage.delete_books(book_ids)
+    print_json(
+        {"deleted": len(set(book_ids)) - len(missing), "missing": missing}
+    )
+    return ERROR_EXIT if missing else 0
+
+
+def set_status(args: argparse.Namespace) -> int:
+    """Set status of books by IDs, prints count of updated and missing."""
+    try:
+        book_ids = read_book_ids(args.ids)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return ERROR_EXIT
+    with open_storage(args) as storage:
+        missing = storage.update_status_books(book_ids, args.status)
+    print_json(
+        {"updated": len(set(book_ids)) - len(missing), "missing": missing}
+    )
+    return ERROR_EXIT if missing else 0
+
+
+def find_books(args: argparse.Namespace) -> int:
+    """Print books found by part of title, author or year."""
+    with open_storage(args) as storage:
+        write_books(sys.stdout, storage.find_books(args.query), args.format)
+    return 0
+
+
+def list_books(args: argparse.Namespace) -> int:
+    """Print all books of the storage."""
+    with open_storage(args) as storage:
+        write_books(sys.stdout, storage.iter_books(), args.format)
+    return 0
+
+
+def replay_session(args: argparse.Namespace) -> int:
+    """Replay keys of the script without drawing, print throughput."""
+    report = replay(
+        read_script(args.script), storage=args.storage, path=args.path
+    )
+    print(
+        f"Replayed {report.operations} keys in {report.seconds:.2f} s,"
+        f" {report.operations_per_second:.0f} keys/s."
+    )
+    for screen in report.screens():
+        print(
+            f"{screen.screen:<16}{screen.keys:8} keys"
+            f"{screen.mean_seconds * 1000:10.3f} ms mean"
+            f"{screen.max_seconds * 1000:10.3f} ms max"
+        )
+    return 0
+
+
+def record_session(args: argparse.Namespace) -> int:
+    """Run the console, writing entered keys to the script."""
+    with open(args.script, "w", encoding="utf-8") as script:
+        front = make_front_console(
+            storage=args.storage,
+            path=args.path,
+            reader=recording_reader(script),
+        )
+        try:
+            ConsoleRunner(console=front).run()
+        except SystemExit:
+            front.close()
+        except (KeyboardInterrupt, EOFError):
+            front.close()
+            return 1
+    return 0
+
+
+def serve_books(args: argparse.Namespace) -> int:
+    """Serve the storage over HTTP until interrupted."""
+    print(f"Serving books on http://{args.host}:{args.port}, Ctrl+C stops.")
+    try:
+        asyncio.run(serve(args.storage, args.path, args.host, args.port))
+    except KeyboardInterrupt:
+        logger.debug("Server stopped.")
+    return 0
+
+
+def add_storage_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add options selecting the books storage."""
+    parser.add_argument(
+        "--storage",
+        choices=STORAGES,
+        help="books storage, defaults to BOOKS_STORAGE or json",
+    )
+    parser.add_argument("--path", help="storage file, defaults to BOOKS_PATH")
+
+
+def add_output_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add option selecting format of printed books."""
+    parser.add_argument(
+        "--format",
+        choices=FORMATS,
+        default="jsonl",
+        help="output format, defaults to jsonl",
+    )
+
+
+def make_parser() -> argparse.ArgumentParser:
+    """Return parser of the command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m src", description="Book utility commands."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    migrate_parser = commands.add_parser(
+        "migrate", help="copy books.json to SQLite database"
+    )
+    migrate_parser.add_argument(
+        "--source", help="JSON catalog, defaults to the shipped books.json"
+    )
+    migrate_parser.add_argument(
+        "--target", help="SQLite database, defaults to books.db"
+    )
+    migrate_parser.set_defaults(handler=migrate)
+
+    convert_parser = commands.add_parser(
+        "convert", help="convert books.json to binary catalog and back"
+    )
+    convert_parser.add_argument(
+        "to", choices=("binary", "json"), help="target format"
+    )
+    convert_parser.add_argument(
+        "--source", help="catalog to convert, defaults to shipped one"
+    )
+    convert_parser.add_argument(
+        "--target", help="converted catalog, defaults to shipped one"
+    )
+    convert_parser.set_defaults(handler=convert)
+
+    import_parser = commands.add_parser(
+        "import", help="add books of a CSV or JSON Lines file"
+    )
+    import_parser.add_argument("file", help="file with books")
+    import_parser.add_argument(
+        "--format", choices=FORMATS, help="file format, defaults to suffix"
+    )
+    add_storage_arguments(import_parser)
+    import_parser.set_defaults(handler=import_catalog)
+
+    export_parser = commands.add_parser(
+        "export", help="write books to a CSV or JSON Lines file"
+    )
+    export_parser.add_argument("file", help="target file, - for stdout")
+    export_parser.add_argument(
+        "--format", choices=FORMATS, help="file format, defaults to suffix"
+    )
+    export_parser.add_argument(
+        "--find", help="export only books found by part info"
+    )
+    add_storage_arguments(export_parser)
+    export_parser.set_defaults(handler=export_catalog)
+
+    add_parser = commands.add_parser(
+        "add", help="add a book, or books of JSON Lines on stdin"
+    )
+    add_parser.add_argument("--title", help="title of the book")
+    add_parser.add_argument("--author", help="author of the book")
+    add_parser.add_argument("--year", help="year of the book")
+    add_storage_arguments(add_parser)
+    add_parser.set_defaults(handler=add_books)
+
+    delete_parser = commands.add_parser(
+        "delete", help="delete books by IDs, read from stdin if none"
+    )
+    delete_parser.add_argument("ids", nargs="*", help="IDs like 1,5,10-250")
+    add_storage_arguments(delete_parser)
+    delete_parser.set_defaults(handler=delete_books)
+
+    status_parser = commands.add_parser(
+        "set-status", help="set status of books by IDs, read from stdin"
+    )
+    status_parser.add_argument(
+        "status",
+        choices=PointMenuPositions.GET_STATUS.values(),
+        help="new status",
+    )
+    status_parser.add_argument("ids", nargs="*", help="IDs like 1,5,10-250")
+    add_storage_arguments(status_parser)
+    status_parser.set_defaults(handler=set_status)
+
+    find_parser = commands.add_parser(
+        "find", help="print books found by part of title, author or year"
+    )
+    find_parser.add_argument("query", help="part of title, author or year")
+    add_output_arguments(find_parser)
+    add_storage_arguments(find_parser)
+    find_parser.set_defaults(handler=find_books)
+
+    list_parser = commands.add_parser("list", help="print all books")
+    add_output_arguments(list_parser)
+    add_storage_arguments(list_parser)
+    list_parser.set_defaults(handler=list_books)
+
+    replay_parser = commands.add_parser(
+        "replay", help="run keys of a script in the console without drawing"
+    )
+    replay_parser.add_argument("script", help="file with one key per line")
+    add_storage_arguments(replay_parser)
+    replay_parser.set_defaults(handler=replay_session)
+
+    record_parser = commands.add_parser(
+        "record", help="run the console, writing keys to a script"
+    )
+    record_parser.add_argument("script", help="file for entered keys")
+    add_storage_arguments(record_parser)
+    record_parser.set_defaults(handler=record_session)
+
+    serve_parser = commands.add_parser(
+        "serve", help="serve books as JSON over HTTP on localhost"
+    )
+    serve_parser.add_argument(
+        "--host", default=HOST, help=f"address, defaults to {HOST}"
+    )
+    serve_parser.add_argument(
+        "--port", type=int, default=PORT, help=f"port, defaults to {PORT}"
+    )
+    add_storage_arguments(serve_parser)
+    serve_parser.set_defaults(handler=serve_books)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command, return exit code.
+
+    Broken catalogs and missing files are reported with one line on
+    stderr and the error exit code.
+    """
+    args = make_parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except (ValueError, OSError) as e:
+        logger.debug("Command failed.", exc_info=True)
+        print(e, file=sys.stderr)
+        return ERROR_EXIT
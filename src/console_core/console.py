@@ -45,6 +45,12 @@ class ConsoleRunner:
                 case PointMenuPositions.UPDATE_BOOK_MENU:
                     call_screen = self.console.update_book_status()
                     self.cursor = self.console.back_menu(call_screen)
+                case PointMenuPositions.BATCH_DELETE_MENU:
+                    call_screen = self.console.delete_books()
+                    self.cursor = self.console.back_menu(call_screen)
+                case PointMenuPositions.BATCH_UPDATE_MENU:
+                    call_screen = self.console.update_books_status()
+                    self.cursor = self.console.back_menu(call_screen)
                 case PointMenuPositions.EXIT_MENU:
                     self.console.exit_console()
                 case PointMenuPositions.BACK_MENU:
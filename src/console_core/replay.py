@@ -0,0 +1,138 @@
+"""Headless replay of console sessions with throughput report."""
+
+import logging
+import os
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import IO, NamedTuple
+
+from src.console_core.console import ConsoleRunner
+from src.console_core.utils.console_navigator import PointMenuPositions
+from src.console_core.utils.front import make_front_console
+from src.console_core.utils.renderer import FrameRenderer
+
+logger = logging.getLogger(__name__)
+
+SCREENS = {
+    value: name.removesuffix("_MENU").lower()
+    for name, value in vars(PointMenuPositions).items()
+    if name.endswith("_MENU")
+}
+
+
+class ScreenLatency(NamedTuple):
+    """Latency of keys entered on one screen."""
+
+    screen: str
+    keys: int
+    mean_seconds: float
+    max_seconds: float
+
+
+class ReplayReport(NamedTuple):
+    """Result of a replayed session."""
+
+    operations: int
+    seconds: float
+    latencies: dict[str, list[float]]
+
+    @property
+    def operations_per_second(self) -> float:
+        """Return count of keys handled per second of the session."""
+        return self.operations / self.seconds if self.seconds else 0.0
+
+    def screens(self) -> list[ScreenLatency]:
+        """Return latency of every screen by the screen name."""
+        return [
+            ScreenLatency(
+                screen=screen,
+                keys=len(times),
+                mean_seconds=sum(times) / len(times),
+                max_seconds=max(times),
+            )
+            for screen, times in sorted(self.latencies.items())
+        ]
+
+
+def read_script(path: str | Path) -> Iterator[str]:
+    """Yield keys of the script file, one key per line.
+
+    Spaces are kept, a line of one space enters an empty form field.
+    """
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            yield line.rstrip("\r\n")
+
+
+def recording_reader(file: IO[str]) -> Callable[[str], str]:
+    """Return input reader writing every entered key to the file."""
+
+    def read(prompt: str) -> str:
+        key = input(prompt)
+        file.write(key + "\n")
+        file.flush()
+        return key
+
+    return read
+
+
+def replay(
+    keys: Iterable[str],
+    storage: str | None = None,
+    path: str | Path | None = None,
+) -> ReplayReport:
+    """Run the console on the keys with rendering discarded.
+
+    The session ends with the exit menu or when the keys run out. The
+    latency of a key is the time from the previous key to the prompt
+    reading it, so it covers the work and the drawing of the screen.
+    The storage is closed at the end.
+
+    Args:
+        keys: Lines entered to the prompts.
+        storage: Name of the books storage, see backends.STORAGES.
+        path: Storage file, defaults to the storage default.
+
+    Returns:
+        ReplayReport: Count of keys, time and latencies by the screen.
+    """
+    source = iter(keys)
+    latencies: dict[str, list[float]] = defaultdict(list)
+    runner: ConsoleRunner | None = None
+
+    with open(os.devnull, "w") as devnull:
+        started = last = time.perf_counter()
+
+        def read(prompt: str) -> str:
+            nonlocal last
+            key = next(source, None)
+            if key is None:
+                raise EOFError("Script is over.")
+            now = time.perf_counter()
+            cursor = runner.cursor if runner else PointMenuPositions.MAIN_MENU
+            latencies[SCREENS.get(cursor, str(cursor))].append(now - last)
+            last = now
+            return key
+
+        front = make_front_console(
+            storage=storage,
+            path=path,
+            renderer=FrameRenderer(stream=devnull),
+            reader=read,
+        )
+        runner = ConsoleRunner(console=front)
+        try:
+            runner.run()
+        except (SystemExit, EOFError):
+            logger.debug("Replay is over.")
+        finally:
+            front.close()
+        seconds = time.perf_counter() - started
+
+    return ReplayReport(
+        operations=sum(map(len, latencies.values())),
+        seconds=seconds,
+        latencies=dict(latencies),
+    )
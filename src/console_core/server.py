@@ -0,0 +1,445 @@
+"""Local JSON over HTTP service of the books storage."""
+
+import asyncio
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any, NamedTuple, TypeVar
+from urllib.parse import parse_qsl, urlsplit
+
+from src.console_core.utils.backends import make_storage
+from src.console_core.utils.console_navigator import PointMenuPositions
+from src.console_core.utils.importer import import_books
+from src.console_core.utils.storage import (
+    PAGE_SIZE,
+    BookStorage,
+    VersionConflictError,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+HOST = "127.0.0.1"
+PORT = 8080
+MAX_BODY_BYTES = 1 << 20
+MAX_HEADERS = 100
+MAX_PAGE_LIMIT = 1000
+STATUSES = frozenset(PointMenuPositions.GET_STATUS.values())
+
+
+class HTTPError(Exception):
+    """Request the service refuses with the status."""
+
+    def __init__(self, status: HTTPStatus, error: str) -> None:
+        """Init error with the response status and the message."""
+        super().__init__(error)
+        self.status = status
+
+
+class Request(NamedTuple):
+    """Parsed HTTP request."""
+
+    method: str
+    path: str
+    query: dict[str, str]
+    headers: dict[str, str]
+    body: bytes
+
+    def json(self) -> Any:
+        """Return the JSON body.
+
+        Raises:
+            HTTPError: If the body is not JSON.
+        """
+        try:
+            return json.loads(self.body)
+        except (ValueError, UnicodeError):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Body is not JSON.")
+
+    @property
+    def keep_alive(self) -> bool:
+        """Return True if the client keeps the connection."""
+        return self.headers.get("connection", "").lower() != "close"
+
+
+class Response(NamedTuple):
+    """Status, JSON data and extra headers of a response."""
+
+    status: HTTPStatus
+    data: Any = None
+    headers: dict[str, str] = {}
+
+    def encode(self, keep_alive: bool) -> bytes:
+        """Return the response as bytes of HTTP/1.1."""
+        body = b""
+        if self.data is not None:
+            body = json.dumps(self.data, ensure_ascii=False).encode()
+        headers = {
+            "Content-Type": "application/json; charset=utf-8",
+            "Content-Length": str(len(body)),
+            "Connection": "keep-alive" if keep_alive else "close",
+            **self.headers,
+        }
+        head = [f"HTTP/1.1 {self.status.value} {self.status.phrase}"]
+        head.extend(f"{name}: {value}" for name, value in headers.items())
+        return ("\r\n".join(head) + "\r\n\r\n").encode() + body
+
+
+async def read_line(
+    reader: asyncio.StreamReader, status: HTTPStatus, error: str
+) -> bytes:
+    """Read one line of the request head.
+
+    Raises:
+        HTTPError: With the status if the line exceeds the stream limit.
+    """
+    try:
+        return await reader.readline()
+    except (ValueError, asyncio.LimitOverrunError):
+        raise HTTPError(status, error)
+
+
+async def read_request(reader: asyncio.StreamReader) -> Request | None:
+    """Read one request of the connection.
+
+    Returns:
+        None if the client closed the connection.
+
+    Raises:
+        HTTPError: If the request is malformed or too large.
+    """
+    line = await read_line(
+        reader, HTTPStatus.REQUEST_URI_TOO_LONG, "Request line too long."
+    )
+    if not line.strip():
+        return None
+    try:
+        method, target, _ = line.decode("latin-1").split()
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Invalid request line.")
+
+    headers: dict[str, str] = {}
+    too_large = HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE
+    while True:
+        line = await read_line(reader, too_large, "Header too long.")
+        if line in (b"\r\n", b"\n", b""):
+            break
+        if len(headers) == MAX_HEADERS:
+            raise HTTPError(too_large, "Too many headers.")
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length.")
+    if not 0 <= length <= MAX_BODY_BYTES:
+        raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Body too large.")
+
+    url = urlsplit(target)
+    return Request(
+        method=method.upper(),
+        path=url.path.rstrip("/") or "/",
+        query=dict(parse_qsl(url.query)),
+        headers=headers,
+        body=await reader.readexactly(length),
+    )
+
+
+def parse_int(value: str, name: str) -> int:
+    """Return integer of the parameter.
+
+    Raises:
+        HTTPError: If the value is not an integer.
+    """
+    try:
+        return int(value)
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"{name} must be integer.")
+
+
+def list_page(
+    storage: BookStorage, look_for_data: str | None, limit: int, after: int
+) -> dict:
+    """Return books after the ID and the ID to continue with."""
+    page = storage.page_records(after, limit + 1, look_for_data)
+    return {
+        "books": page[:limit],
+        "next": page[limit - 1]["id"] if len(page) > limit else None,
+    }
+
+
+class BookServer:
+    """HTTP service sharing one storage between concurrent clients.
+
+    Connections are served on the event loop. Storage calls run one at
+    a time on a worker thread, so disk writes never block the loop and
+    the storage is never entered by two requests at once.
+
+    Routes:
+        GET /books?find=&limit=&after=  list or find books by pages.
+        POST /books  add a book or a list of books.
+        GET /books/{id}  get a book, ETag holds its version.
+        PATCH /books/{id}  set the status of the book.
+        DELETE /books/{id}  delete the book.
+
+    PATCH and DELETE refuse with 409 if If-Match is not the version.
+    """
+
+    def __init__(
+        self,
+        storage: str | None = None,
+        path: str | Path | None = None,
+        host: str = HOST,
+        port: int = PORT,
+    ) -> None:
+        """Init service, the storage is opened by start().
+
+        Args:
+            storage: Name of the books storage, see backends.STORAGES.
+            path: Storage file, defaults to the storage default.
+            host: Address to listen, localhost by default.
+            port: Port to listen, 0 picks a free one.
+        """
+        self.host = host
+        self.port = port
+        self._open_storage = partial(make_storage, kind=storage, path=path)
+        self._storage: BookStorage | None = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="books-storage"
+        )
+        self._server: asyncio.Server | None = None
+
+    @property
+    def storage(self) -> BookStorage:
+        """Return the opened storage.
+
+        Raises:
+            RuntimeError: If the service is not started.
+        """
+        if self._storage is None:
+            raise RuntimeError("Server is not started.")
+        return self._storage
+
+    async def start(self) -> None:
+        """Open the storage and listen for clients."""
+        self._storage = await self._run(self._open_storage)
+        self._server = await asyncio.start_server(
+            self._handle, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"Serving books on http://{self.host}:{self.port}.")
+
+    async def serve_forever(self) -> None:
+        """Serve clients until cancelled, then close the service."""
+        await self.start()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        """Stop listening, persist pending changes and close storage."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._storage is not None:
+            await self._run(self._storage.close)
+            self._storage = None
+        self._executor.shutdown()
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run the blocking call on the storage thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args))
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve requests of one connection."""
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except HTTPError as e:
+                    # The rest of a malformed request can't be skipped.
+                    response = Response(e.status, {"error": str(e)})
+                    writer.write(response.encode(keep_alive=False))
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                response = await self._respond(request)
+                keep_alive = request.keep_alive
+                writer.write(response.encode(keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError) as e:
+            logger.debug(f"Client disconnected: {e!r}.")
+        finally:
+            writer.close()
+
+    async def _respond(self, request: Request) -> Response:
+        """Return response of the route or of the refused request."""
+        try:
+            return await self._dispatch(request)
+        except HTTPError as e:
+            return Response(e.status, {"error": str(e)})
+        except Exception:
+            logger.exception(f"{request.method} {request.path} failed.")
+            return Response(
+                HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Server error."}
+            )
+
+    async def _dispatch(self, request: Request) -> Response:
+        """Return response of the route.
+
+        Raises:
+            HTTPError: If the request is refused.
+        """
+        parts = request.path.strip("/").split("/")
+        if parts[0] != "books" or len(parts) > 2:
+            raise HTTPError(HTTPStatus.NOT_FOUND, "Unknown path.")
+
+        routes: dict[str, Callable[[], Awaitable[Response]]]
+        if len(parts) == 1:
+            routes = {
+                "GET": partial(self._list_books, request),
+                "POST": partial(self._add_books, request),
+            }
+        else:
+            book_id = parse_int(parts[1], "Book ID")
+            routes = {
+                "GET": partial(self._get_book, book_id),
+                "PATCH": partial(self._update_status, request, book_id),
+                "DELETE": partial(self._delete_book, request, book_id),
+            }
+        route = routes.get(request.method)
+        if route is None:
+            raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, "Unknown method.")
+        return await route()
+
+    async def _list_books(self, request: Request) -> Response:
+        """List books, or books found by part of title, author or year."""
+        limit = parse_int(request.query.get("limit", str(PAGE_SIZE)), "limit")
+        after = parse_int(request.query.get("after", "0"), "after")
+        if not 0 < limit <= MAX_PAGE_LIMIT:
+            raise HTTPError(
+                HTTPStatus.BAD_REQUEST,
+                f"limit must be from 1 to {MAX_PAGE_LIMIT}.",
+            )
+        page = await self._run(
+            list_page, self.storage, request.query.get("find"), limit, after
+        )
+        return Response(HTTPStatus.OK, page)
+
+    async def _add_books(self, request: Request) -> Response:
+        """Add the book of the body, or every book of the body list."""
+        data = request.json()
+        rows = enumerate(data if isinstance(data, list) else [data], 1)
+        report = await self._run(import_books, self.storage, rows)
+        return Response(
+            HTTPStatus.BAD_REQUEST if report.rejects else HTTPStatus.CREATED,
+            {
+                "ids": list(report.ids),
+                "rejects": [reject._asdict() for reject in report.rejects],
+            },
+        )
+
+    async def _get_book(self, book_id: int) -> Response:
+        """Return the book with its version."""
+        book, version = await self._run(self._read_book, book_id)
+        headers = {} if version is None else {"ETag": f'"{version}"'}
+        return Response(HTTPStatus.OK, book, headers)
+
+    async def _update_status(self, request: Request, book_id: int) -> Response:
+        """Set status of the book."""
+        data = request.json()
+        status = data.get("status") if isinstance(data, dict) else None
+        if status not in STATUSES:
+            raise HTTPError(
+                HTTPStatus.BAD_REQUEST,
+                f"status must be one of: {', '.join(sorted(STATUSES))}.",
+            )
+        await self._run(
+            self._change_book,
+            book_id,
+            self._expected_version(request),
+            status,
+        )
+        book, _ = await self._run(self._read_book, book_id)
+        return Response(HTTPStatus.OK, book)
+
+    async def _delete_book(self, request: Request, book_id: int) -> Response:
+        """Delete the book."""
+        await self._run(
+            self._change_book, book_id, self._expected_version(request)
+        )
+        return Response(HTTPStatus.NO_CONTENT)
+
+    @staticmethod
+    def _expected_version(request: Request) -> int | None:
+        """Return version of If-Match, None if the header is not sent.
+
+        Raises:
+            HTTPError: If the header is not a version.
+        """
+        value = request.headers.get("if-match", "").strip('"')
+        return parse_int(value, "If-Match") if value else None
+
+    def _read_book(self, book_id: int) -> tuple[dict, int | None]:
+        """Return the book and its version.
+
+        Raises:
+            HTTPError: If the book is not found.
+        """
+        book = self.storage.get_book(book_id)
+        if book is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"Book {book_id} not found.")
+        return book, self.storage.book_version(book_id)
+
+    def _change_book(
+        self,
+        book_id: int,
+        expected_version: int | None,
+        status: str | None = None,
+    ) -> None:
+        """Set status of the book, delete it if the status is None.
+
+        Raises:
+            HTTPError: If the book is not found, has not the expected
+                version or is not changed.
+        """
+        self._read_book(book_id)
+        try:
+            if status is None:
+                error = self.storage.delete_book_by_id(
+                    book_id, expected_version=expected_version
+                )
+            else:
+                error = self.storage.update_status_book(
+                    book_id, status, expected_version=expected_version
+                )
+        except VersionConflictError as e:
+            raise HTTPError(HTTPStatus.CONFLICT, str(e))
+        except ValueError as e:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, str(e))
+        if error is not None:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, error)
+
+
+async def serve(
+    storage: str | None = None,
+    path: str | Path | None = None,
+    host: str = HOST,
+    port: int = PORT,
+) -> None:
+    """Serve the books storage until cancelled."""
+    await BookServer(storage, path, host, port).serve_forever()
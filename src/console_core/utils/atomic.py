@@ -0,0 +1,69 @@
+"""Atomic replacement of catalog files."""
+
+import os
+import stat
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any
+
+# Read once, os.umask can only be read by setting it.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def fsync_dir(path: Path) -> None:
+    """Persist a rename inside the directory (POSIX only)."""
+    if os.name == "nt":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def file_mode(path: Path) -> int:
+    """Return permissions of the file, umask default for a new one."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+@contextmanager
+def atomic_open(
+    path: str | Path, mode: str = "w", durable: bool = True
+) -> Iterator[IO[Any]]:
+    """Open a temp file renamed over the target when the block ends.
+
+    The temp file gets the permissions of the replaced file, so shared
+    catalogs stay readable by other users. A crash at any moment leaves
+    either the old or the new file.
+
+    Args:
+        path: File to replace.
+        mode: "w" for text in UTF-8 or "wb" for bytes.
+        durable: Fsync the file and the directory. Caches which can be
+            rebuilt skip it.
+    """
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        if hasattr(os, "fchmod"):  # Not on Windows before 3.13.
+            os.fchmod(fd, file_mode(path))
+        encoding = None if "b" in mode else "utf-8"
+        with open(fd, mode, encoding=encoding) as file:
+            yield file
+            if durable:
+                file.flush()
+                os.fsync(file.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    if durable:
+        fsync_dir(path.parent)
@@ -0,0 +1,77 @@
+"""Books storages selectable at startup."""
+
+import os
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+from src.console_core.utils.binary_crud import BinaryBookCRUD
+from src.console_core.utils.crud import BookCRUD
+from src.console_core.utils.sharded_crud import ShardedBookCRUD
+from src.console_core.utils.sqlite_crud import SQLiteBookCRUD
+from src.console_core.utils.storage import BookStorage
+
+STORAGE_ENV = "BOOKS_STORAGE"
+PATH_ENV = "BOOKS_PATH"
+SEARCH_WORKERS_ENV = "BOOKS_SEARCH_WORKERS"
+DEFAULT_STORAGE = "json"
+
+
+def search_workers() -> int:
+    """Return count of search processes of BOOKS_SEARCH_WORKERS.
+
+    Unset means searching in this process only, "auto" means one
+    process per CPU.
+
+    Raises:
+        ValueError: If the value is not a count of processes.
+    """
+    value = os.environ.get(SEARCH_WORKERS_ENV, "").strip()
+    if not value:
+        return 0
+    if value == "auto":
+        return os.cpu_count() or 1
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        raise ValueError(
+            f"{SEARCH_WORKERS_ENV} must be a count of processes or auto."
+        )
+
+
+def make_sharded(path: str | Path | None = None) -> ShardedBookCRUD:
+    """Return sharded storage searching with BOOKS_SEARCH_WORKERS."""
+    return ShardedBookCRUD(path, search_workers=search_workers())
+
+
+STORAGES: dict[str, Callable[..., BookStorage]] = {
+    "json": BookCRUD,
+    "journal": partial(BookCRUD, journal=True),
+    "streaming": partial(BookCRUD, streaming=True),
+    "sqlite": SQLiteBookCRUD,
+    "binary": BinaryBookCRUD,
+    "sharded": make_sharded,
+}
+
+
+def make_storage(
+    kind: str | None = None, path: str | Path | None = None
+) -> BookStorage:
+    """Return books storage of the kind.
+
+    Args:
+        kind: Name of the storage, defaults to BOOKS_STORAGE or json.
+        path: Storage file, defaults to BOOKS_PATH or storage default.
+
+    Raises:
+        ValueError: If the storage kind is unknown.
+    """
+    kind = kind or os.environ.get(STORAGE_ENV) or DEFAULT_STORAGE
+    path = path or os.environ.get(PATH_ENV) or None
+    try:
+        factory = STORAGES[kind]
+    except KeyError:
+        raise ValueError(
+            f"Unknown storage {kind!r}, choose from {', '.join(STORAGES)}."
+        )
+    return factory(path)
@@ -0,0 +1,274 @@
+"""Fixed-width binary catalog of books read through mmap.
+
+Layout of the file:
+
+- header: magic, count of records and the next free book ID;
+- status table: STATUS_SLOTS zero padded UTF-8 status names;
+- records: fixed-width records sorted by book ID;
+- heap: UTF-8 titles and authors the records point to.
+
+Records are read in place, so lookups by ID are binary searches over
+the mapping and scans never parse the whole file. Status updates and
+deletes are single-byte writes of the record flags.
+"""
+
+import mmap
+import os
+import struct
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from src.console_core.utils.atomic import atomic_open
+
+MAGIC = b"BOOKCAT1"
+HEADER = struct.Struct("<8sQQ")
+STATUS_SLOTS = 16
+STATUS_SIZE = 64
+STATUS_OFFSET = HEADER.size
+RECORDS_OFFSET = STATUS_OFFSET + STATUS_SLOTS * STATUS_SIZE
+# id, year, flags, title offset, title length, author offset, length.
+RECORD = struct.Struct("<qiBxxxIIII")
+BOOK_ID = struct.Struct("<q")
+NEXT_ID = struct.Struct("<Q")
+NEXT_ID_OFFSET = 16
+FLAGS_OFFSET = 12
+DELETED = 0x80
+STATUS_MASK = 0x7F
+
+
+class BinaryCatalog:
+    """Books of the binary catalog file mapped into memory."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Map the catalog file.
+
+        Raises:
+            ValueError: If the file is not a binary catalog.
+        """
+        self.path = Path(path)
+        self._file = open(self.path, "r+b")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0)
+            magic, self._count, _ = HEADER.unpack_from(self._map)
+        except (ValueError, struct.error):
+            self._file.close()
+            raise ValueError("File brake or incorrect.")
+        if magic != MAGIC:
+            self.close()
+            raise ValueError("File brake or incorrect.")
+        self._heap = RECORDS_OFFSET + self._count * RECORD.size
+        self._statuses = self._read_statuses()
+        self.inode = os.fstat(self._file.fileno()).st_ino
+
+    def close(self) -> None:
+        """Unmap and close the file."""
+        self._map.close()
+        self._file.close()
+
+    def __len__(self) -> int:
+        """Return count of records, deleted ones included."""
+        return self._count
+
+    def __iter__(self) -> Iterator[dict]:
+        """Iterate over books by ID."""
+        return self.iter_from(0)
+
+    @property
+    def next_id(self) -> int:
+        """Return the next free book ID kept in the header."""
+        return NEXT_ID.unpack_from(self._map, NEXT_ID_OFFSET)[0]
+
+    @next_id.setter
+    def next_id(self, value: int) -> None:
+        """Write the next free book ID in place."""
+        NEXT_ID.pack_into(self._map, NEXT_ID_OFFSET, value)
+        self._map.flush()
+
+    @property
+    def max_id(self) -> int:
+        """Return the highest book ID, deleted books included."""
+        if not self._count:
+            return 0
+        return self._book_id(self._count - 1)
+
+    def _read_statuses(self) -> list[str]:
+        """Return status names of the status table."""
+        statuses = []
+        for slot in range(STATUS_SLOTS):
+            offset = STATUS_OFFSET + slot * STATUS_SIZE
+            raw = self._map[offset : offset + STATUS_SIZE]  # noqa: E203
+            name = raw.rstrip(b"\0").decode()
+            if not name:
+                break
+            statuses.append(name)
+        return statuses
+
+    def _book_id(self, index: int) -> int:
+        """Return ID of the record by its index."""
+        return BOOK_ID.unpack_from(
+            self._map, RECORDS_OFFSET + index * RECORD.size
+        )[0]
+
+    def record(self, index: int) -> dict | None:
+        """Return book of the record, None for a deleted record."""
+        book_id, year, flags, title, title_size, author, author_size = (
+            RECORD.unpack_from(self._map, RECORDS_OFFSET + index * RECORD.size)
+        )
+        if flags & DELETED:
+            return None
+        title += self._heap
+        author += self._heap
+        title_end = title + title_size
+        author_end = author + author_size
+        return {
+            "id": book_id,
+            "title": self._map[title:title_end].decode(),
+            "author": self._map[author:author_end].decode(),
+            "year": str(year),
+            "status": self._status(flags & STATUS_MASK),
+        }
+
+    def _status(self, code: int) -> str:
+        """Return status name, re-reading table grown by other writers."""
+        if code >= len(self._statuses):
+            self._statuses = self._read_statuses()
+        return self._statuses[code]
+
+    def position(self, book_id: int) -> int:
+        """Return index of the first record with ID not less than given."""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._book_id(middle) < book_id:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _find(self, book_id: int | str) -> int | None:
+        """Return index of the live record of the book."""
+        try:
+            book_id = int(book_id)
+        except ValueError:
+            return None
+        index = self.position(book_id)
+        if index == self._count or self._book_id(index) != book_id:
+            return None
+        if self._flags(index) & DELETED:
+            return None
+        return index
+
+    def _flags(self, index: int) -> int:
+        """Return flags byte of the record."""
+        return self._map[RECORDS_OFFSET + index * RECORD.size + FLAGS_OFFSET]
+
+    def get(self, book_id: int | str) -> dict | None:
+        """Return book by ID."""
+        index = self._find(book_id)
+        return None if index is None else self.record(index)
+
+    def iter_from(self, index: int) -> Iterator[dict]:
+        """Iterate over books by ID starting with the record index."""
+        for position in range(index, self._count):
+            book = self.record(position)
+            if book is not None:
+                yield book
+
+    def set_status(self, book_id: int | str, status: str) -> bool:
+        """Write status of the book in place, False if not found.
+
+        Raises:
+            ValueError: If the status table has no room for the status.
+        """
+        index = self._find(book_id)
+        if index is None:
+            return False
+        self._write_flags(index, self._status_code(status))
+        return True
+
+    def delete(self, book_id: int | str) -> bool:
+        """Mark the book deleted in place, False if not found."""
+        index = self._find(book_id)
+        if index is None:
+            return False
+        self._write_flags(index, self._flags(index) | DELETED)
+        return True
+
+    def _write_flags(self, index: int, flags: int) -> None:
+        """Write the flags byte of the record."""
+        self._map[RECORDS_OFFSET + index * RECORD.size + FLAGS_OFFSET] = flags
+
+    def flush(self) -> None:
+        """Persist in-place changes."""
+        self._map.flush()
+
+    def _status_code(self, status: str) -> int:
+        """Return index of the status, adding it to the status table."""
+        if status not in self._statuses:
+            self._statuses = self._read_statuses()
+        if status in self._statuses:
+            return self._statuses.index(status)
+        code = len(self._statuses)
+        if code == STATUS_SLOTS:
+            raise ValueError("Too many statuses for binary catalog.")
+        raw = _encode_status(status)
+        offset = STATUS_OFFSET + code * STATUS_SIZE
+        self._map[offset : offset + STATUS_SIZE] = raw  # noqa: E203
+        self._statuses.append(status)
+        return code
+
+
+def _encode_status(status: str) -> bytes:
+    """Return zero padded status name.
+
+    Raises:
+        ValueError: If the status is empty or too long.
+    """
+    raw = status.encode()
+    if not raw or len(raw) > STATUS_SIZE:
+        raise ValueError(f"Status {status!r} can't be saved.")
+    return raw.ljust(STATUS_SIZE, b"\0")
+
+
+def write_binary_catalog(
+    path: str | Path, books: Iterable[dict], next_id: int = 1
+) -> int:
+    """Write books to the binary catalog file atomically.
+
+    Returns:
+        Count of written books.
+
+    Raises:
+        ValueError: If a year is not an integer or too many statuses.
+    """
+    books = sorted(books, key=lambda book: book["id"])
+    statuses: list[str] = []
+    records = bytearray()
+    heap = bytearray()
+    for book in books:
+        if book["status"] not in statuses:
+            statuses.append(book["status"])
+        if len(statuses) > STATUS_SLOTS:
+            raise ValueError("Too many statuses for binary catalog.")
+        title = book["title"].encode()
+        author = book["author"].encode()
+        records += RECORD.pack(
+            book["id"],
+            int(book["year"]),
+            statuses.index(book["status"]),
+            len(heap),
+            len(title),
+            len(heap) + len(title),
+            len(author),
+        )
+        heap += title + author
+
+    next_id = max(next_id, books[-1]["id"] + 1 if books else 1)
+    path = Path(path)
+    with atomic_open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, len(books), next_id))
+        file.write(b"".join(map(_encode_status, statuses)))
+        file.write(bytes(STATUS_SIZE * (STATUS_SLOTS - len(statuses))))
+        file.write(records)
+        file.write(heap)
+    return len(books)
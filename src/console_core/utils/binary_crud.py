@@ -0,0 +1,304 @@
+"""Storage of books in the memory-mapped binary catalog."""
+
+import logging
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from pathlib import Path
+
+from src.console_core.utils.binary_catalog import (
+    BinaryCatalog,
+    write_binary_catalog,
+)
+from src.console_core.utils.catalog import book_matches
+from src.console_core.utils.crud import BookCRUD
+from src.console_core.utils.indexes import YearIndex
+from src.console_core.utils.storage import (
+    PAGE_SIZE,
+    BookPage,
+    BookStorage,
+    decode_cursor,
+)
+from src.models.book import Book, InvalidInputBookData
+
+logger = logging.getLogger(__name__)
+
+
+class BinaryBookCRUD(BookStorage):
+    """CRUD for books in the binary catalog.
+
+    Reads, status updates and deletes work on the mapped file in place.
+    Adding books rewrites the file, which also drops deleted records.
+    """
+
+    OUT_PATH = Path(__file__).parent.absolute()
+    FILE_PATH = OUT_PATH / "books.bin"
+
+    def __init__(self, file_path: str | Path | None = None) -> None:
+        """Map the catalog, creating an empty one if it is missing.
+
+        Args:
+            file_path: Path to the binary catalog. Defaults to FILE_PATH.
+        """
+        if file_path is not None:
+            self.FILE_PATH = Path(file_path)
+        if not self.FILE_PATH.exists():
+            write_binary_catalog(self.FILE_PATH, [])
+        self._lock = threading.RLock()
+        self._books = BinaryCatalog(self.FILE_PATH)
+
+    def close(self) -> None:
+        """Unmap the catalog."""
+        with self._lock:
+            self._books.close()
+
+    def _catalog(self) -> BinaryCatalog:
+        """Return the mapped catalog, remapping a file replaced outside."""
+        with self._lock:
+            if self.FILE_PATH.stat().st_ino != self._books.inode:
+                logger.debug("Binary catalog replaced, remap.")
+                self._books.close()
+                self._books = BinaryCatalog(self.FILE_PATH)
+            return self._books
+
+    def _rewrite(self, books: Iterable[dict], next_id: int) -> None:
+        """Write a new catalog file and map it."""
+        with self._lock:
+            self._books.close()
+            try:
+                write_binary_catalog(self.FILE_PATH, books, next_id)
+            finally:
+                self._books = BinaryCatalog(self.FILE_PATH)
+
+    def next_id(self) -> int:
+        """Return the ID the sequence gives next without reserving it."""
+        books = self._catalog()
+        return max(books.next_id, books.max_id + 1)
+
+    def allocate_ids(self, count: int = 1) -> range:
+        """Reserve a range of new book IDs, never reused."""
+        if count < 1:
+            raise ValueError("Count of IDs must be positive.")
+        with self._lock:
+            start = self.next_id()
+            self._catalog().next_id = start + count
+        return range(start, start + count)
+
+    def insert_books(self, books: Iterable[dict]) -> int:
+        """Insert trusted book records keeping their IDs in one rewrite."""
+        new_books = {book["id"]: book for book in books}
+        if not new_books:
+            return 0
+        with self._lock:
+            catalog = self._catalog()
+            merged = {book["id"]: book for book in catalog}
+            merged.update(new_books)
+            self._rewrite(merged.values(), catalog.next_id)
+        logger.debug(f"Inserted {len(new_books)} books.")
+        return len(new_books)
+
+    def add_book_input_data(self, book_data: dict) -> str | None:
+        """Add book input."""
+        try:
+            book = Book(**book_data).to_dict()
+            with self._lock:
+                book["id"] = self.allocate_ids()[0]
+                self.insert_books([book])
+            logger.debug("Books added.")
+        except InvalidInputBookData as e:
+            logger.error(e)
+            return str(e)
+        return None
+
+    def delete_book_by_id(
+        self, book_id: str | int, expected_version: int | None = None
+    ) -> str | None:
+        """Delete book by id."""
+        self._refuse_version(expected_version)
+        try:
+            with self._lock:
+                deleted = self._catalog().delete(book_id)
+                self._books.flush()
+            if not deleted:
+                logger.debug("Books not deleted.")
+                raise InvalidInputBookData(f"Book not found by ID {book_id} ")
+        except InvalidInputBookData as e:
+            logger.error(e)
+            return str(e)
+        return None
+
+    def update_status_book(
+        self,
+        book_id: str | int,
+        status: str,
+        expected_version: int | None = None,
+    ) -> str | None:
+        """Update book status."""
+        self._refuse_version(expected_version)
+        try:
+            with self._lock:
+                updated = self._catalog().set_status(book_id, status)
+                self._books.flush()
+            if not updated:
+                raise InvalidInputBookData(f"Book not found by ID {book_id}.")
+            logger.debug("Book updated status.")
+        except InvalidInputBookData as e:
+            logger.error(e)
+            return str(e)
+        return None
+
+    def delete_books(self, book_ids: Iterable[int]) -> list[int]:
+        """Delete books by IDs in place.
+
+        Returns:
+            IDs of the books which were not found.
+        """
+        return self._change_batch(
+            book_ids, lambda books, book_id: books.delete(book_id)
+        )
+
+    def update_status_books(
+        self, book_ids: Iterable[int], status: str
+    ) -> list[int]:
+        """Update status of books by IDs in place.
+
+        Returns:
+            IDs of the books which were not found.
+        """
+        return self._change_batch(
+            book_ids, lambda books, book_id: books.set_status(book_id, status)
+        )
+
+    def _change_batch(
+        self,
+        book_ids: Iterable[int],
+        change: Callable[[BinaryCatalog, int], bool],
+    ) -> list[int]:
+        """Change every book and flush once, return missing IDs."""
+        with self._lock:
+            books = self._catalog()
+            missing = [
+                book_id
+                for book_id in dict.fromkeys(book_ids)
+                if not change(books, book_id)
+            ]
+            books.flush()
+        logger.debug(f"Batch committed, {len(missing)} books not found.")
+        return missing
+
+    def get_book(self, book_id: str | int) -> dict | None:
+        """Return copy of the book record by ID."""
+        with self._lock:
+            return self._catalog().get(book_id)
+
+    def iter_books(self) -> Iterator[dict]:
+        """Iterate over book records by ID."""
+        return self._iter_from(0)
+
+    def _iter_from(self, index: int) -> Iterator[dict]:
+        """Iterate over books from the record index.
+
+        The lock is held per record only. After a rewrite the scan goes
+        on in the new mapping after the last returned book.
+        """
+        books, last_id = self._catalog(), None
+        while True:
+            with self._lock:
+                if books is not self._books:
+                    books = self._books
+                    index = (
+                        0 if last_id is None else books.position(last_id + 1)
+                    )
+                if index >= len(books):
+                    return
+                book = books.record(index)
+            index += 1
+            if book is not None:
+                last_id = book["id"]
+                yield book
+
+    def find_books(self, look_for_data: str) -> Iterator[dict]:
+        """Iterate over book records found by part info."""
+        query = look_for_data.lower()
+        return (
+            book for book in self.iter_books() if book_matches(book, query)
+        )
+
+    def _by_year(self, start: int, end: int) -> list[dict]:
+        """Return books from start to end year ordered by year."""
+        found = []
+        for book in self.iter_books():
+            key = YearIndex.key(book)
+            if key is not None and start <= key[0] <= end:
+                found.append((key, book))
+        found.sort(key=lambda item: item[0])
+        return [book for _, book in found]
+
+    def find_books_by_year_range(
+        self, start: int | str, end: int | str
+    ) -> list[str]:
+        """Find books published from start to end year inclusive.
+
+        Raises:
+            InvalidInputBookData: If a year is not an integer.
+        """
+        books = self._by_year(*self._year_range(start, end))
+        return [self._book_view(book) for book in books]
+
+    def select_all_books(self) -> Iterator[str]:
+        """Select all books."""
+        return map(self._book_view, self.iter_books())
+
+    def page_records(
+        self, after: int | None, limit: int, look_for_data: str | None = None
+    ) -> list[dict]:
+        """Read a page of books after the ID found by binary search."""
+        index = 0 if after is None else self._catalog().position(after + 1)
+        books = self._iter_from(index)
+        if look_for_data is not None:
+            query = look_for_data.lower()
+            books = (book for book in books if book_matches(book, query))
+        return list(islice(books, limit))
+
+    def find_books_by_year_page(
+        self,
+        start: int | str,
+        end: int | str,
+        limit: int = PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> BookPage:
+        """Return one page of books from start to end year by year.
+
+        Raises:
+            InvalidInputBookData: If a year or the cursor is invalid.
+        """
+        after = decode_cursor(cursor, size=2)
+        books = self._by_year(*self._year_range(start, end))
+        if after is not None:
+            books = [book for book in books if YearIndex.key(book) > after]
+        return self._make_page(books[: limit + 1], limit, key=YearIndex.key)
+
+
+def convert_json_to_binary(
+    json_path: str | Path | None = None, binary_path: str | Path | None = None
+) -> int:
+    """Write books and the ID sequence of the JSON catalog to binary."""
+    source = BookCRUD(file_path=json_path, streaming=True)
+    target = binary_path or BinaryBookCRUD.FILE_PATH
+    count = write_binary_catalog(target, source.iter_books(), source.next_id())
+    logger.info(f"Converted {count} books to {target}.")
+    return count
+
+
+def convert_binary_to_json(
+    binary_path: str | Path | None = None, json_path: str | Path | None = None
+) -> int:
+    """Write books and the ID sequence of the binary catalog to JSON."""
+    source = BinaryBookCRUD(file_path=binary_path)
+    target = BookCRUD(file_path=json_path)
+    try:
+        count = target.replace_books(source.iter_books(), source.next_id())
+    finally:
+        source.close()
+    logger.info(f"Converted {count} books to {target.FILE_PATH}.")
+    return count
@@ -0,0 +1,228 @@
+"""In-memory catalog of books with a primary key index."""
+
+import bisect
+from collections.abc import Iterator
+from itertools import islice
+
+from src.console_core.utils.indexes import TrigramIndex, YearIndex
+
+
+def book_matches(book: dict, query: str) -> bool:
+    """Check that lowercase query is a part of title, author or year."""
+    return (
+        query in book["title"].lower()
+        or query in book["author"].lower()
+        or query in book["year"]
+    )
+
+
+class BookCatalog:
+    """Books in storage order with an ID to position index.
+
+    Deleted records leave a tombstone in their slot, so deletes and
+    lookups by ID are O(1). Tombstones are squeezed out once they make
+    up half of the slots.
+    """
+
+    def __init__(
+        self,
+        books: list[dict] | None = None,
+        trigrams: TrigramIndex | None = None,
+    ) -> None:
+        """Init catalog and build the indexes.
+
+        Args:
+            books: Book records in storage order.
+            trigrams: Search index already built for the books.
+        """
+        self._records: list[dict | None] = []
+        self._positions: dict[int, int] = {}
+        self._tombstones = 0
+        for book in books or ():
+            self.add(book, index=False)
+        self._ids = sorted(self._positions)
+
+        if trigrams is None:
+            trigrams = TrigramIndex()
+            for book in self:
+                trigrams.add(book)
+        self.trigrams = trigrams
+        self.years = YearIndex(self)
+
+    def __len__(self) -> int:
+        """Return count of books."""
+        return len(self._positions)
+
+    def __contains__(self, book_id: object) -> bool:
+        """Check that the book exists."""
+        return book_id in self._positions
+
+    def __iter__(self) -> Iterator[dict]:
+        """Iterate over books in storage order."""
+        return (record for record in self._records if record is not None)
+
+    def get(self, book_id: int) -> dict | None:
+        """Return book by ID."""
+        position = self._positions.get(book_id)
+        return None if position is None else self._records[position]
+
+    def add(self, book: dict, index: bool = True) -> None:
+        """Add book or replace the book with the same ID."""
+        position = self._positions.get(book["id"])
+        if position is None:
+            self._positions[book["id"]] = len(self._records)
+            self._records.append(book)
+            if index:
+                self._add_id(book["id"])
+        else:
+            if index:
+                self._unindex(self._records[position])
+            self._records[position] = book
+        if index:
+            self.trigrams.add(book)
+            self.years.add(book)
+
+    def extend(self, books: list[dict]) -> None:
+        """Add many books, sorting the ID and year indexes once."""
+        added = []
+        for book in books:
+            if book["id"] in self._positions:
+                self.add(book)
+                continue
+            self.add(book, index=False)
+            self.trigrams.add(book)
+            added.append(book)
+        self._ids.extend(book["id"] for book in added)
+        self._ids.sort()
+        self.years.update(added)
+
+    def delete(self, book_id: int) -> dict | None:
+        """Delete book by ID and return it."""
+        position = self._positions.pop(book_id, None)
+        if position is None:
+            return None
+        book, self._records[position] = self._records[position], None
+        self._unindex(book)
+        del self._ids[bisect.bisect_left(self._ids, book_id)]
+        self._tombstones += 1
+        if self._tombstones * 2 > len(self._records):
+            self._compact()
+        return book
+
+    def set_status(self, book_id: int, status: str) -> dict | None:
+        """Change status of the book and return it."""
+        book = self.get(book_id)
+        if book is not None:
+            book["status"] = status
+        return book
+
+    def search(self, look_for_data: str) -> Iterator[dict]:
+        """Find books by part of title, author or year.
+
+        Candidates from the trigram index are verified and returned in
+        storage order, so results are the same as of a full scan.
+        """
+        query = look_for_data.lower()
+        ids = self.trigrams.candidates(query)
+        if ids is None:
+            books: Iterator[dict] = iter(self)
+        else:
+            positions = sorted(
+                self._positions[book_id]
+                for book_id in ids
+                if book_id in self._positions
+            )
+            candidates = [self._records[position] for position in positions]
+            books = iter(candidates)  # type: ignore
+
+        return (book for book in books if book_matches(book, query))
+
+    def by_year(
+        self,
+        start: int,
+        end: int,
+        after: tuple[int, int] | None = None,
+        limit: int | None = None,
+    ) -> list[dict]:
+        """Return books from start to end year inclusive by year.
+
+        Args:
+            start: First year of the range.
+            end: Last year of the range.
+            after: Return only books after this (year, id) key.
+            limit: Max count of books.
+        """
+        return [
+            self._records[self._positions[book_id]]  # type: ignore
+            for book_id in self.years.between(start, end, after, limit)
+        ]
+
+    def page(
+        self,
+        after: int | None,
+        limit: int,
+        look_for_data: str | None = None,
+    ) -> list[dict]:
+        """Return up to limit books with ID greater than after by ID.
+
+        Args:
+            after: Last ID of the previous page, None for the first page.
+            limit: Max count of books.
+            look_for_data: Return only books matching this search query.
+        """
+        if look_for_data is None:
+            ids: list[int] = self._ids
+            query = None
+        else:
+            query = look_for_data.lower()
+            candidates = self.trigrams.candidates(query)
+            ids = self._ids if candidates is None else sorted(candidates)
+
+        start = 0 if after is None else bisect.bisect_right(ids, after)
+        books: Iterator[dict] = (
+            self._records[self._positions[ids[position]]]  # type: ignore
+            for position in range(start, len(ids))
+        )
+        if query is not None:
+            books = (book for book in books if book_matches(book, query))
+        return list(islice(books, limit))
+
+    def apply(self, operation: dict) -> None:
+        """Apply one journaled mutation."""
+        match operation["op"]:
+            case "add":
+                self.add(operation["book"])
+            case "delete":
+                self.delete(operation["id"])
+            case "status":
+                self.set_status(operation["id"], operation["status"])
+            case _:
+                raise ValueError(
+                    f"Unknown journal operation {operation['op']}"
+                )
+
+    def to_list(self) -> list[dict]:
+        """Return books as a list for serialization."""
+        return list(self)
+
+    def _add_id(self, book_id: int) -> None:
+        """Keep IDs sorted, appending is the common case."""
+        if not self._ids or book_id > self._ids[-1]:
+            self._ids.append(book_id)
+        else:
+            bisect.insort(self._ids, book_id)
+
+    def _unindex(self, book: dict | None) -> None:
+        """Drop the book from secondary indexes."""
+        if book is not None:
+            self.trigrams.remove(book)
+            self.years.remove(book)
+
+    def _compact(self) -> None:
+        """Drop tombstones and rebuild positions."""
+        records = list(self)
+        self._positions = {
+            book["id"]: position for position, book in enumerate(records)
+        }
+        self._records = list(records)
+        self._tombstones = 0
@@ -11,6 +11,8 @@ class PointMenuPositions:
     FIND_BOOK_MENU = 4
     UPDATE_BOOK_MENU = 5
     SELECT_BOOK_MENU = 6
+    BATCH_DELETE_MENU = 7
+    BATCH_UPDATE_MENU = 8
 
     # Special menu actions
     EXIT_MENU = 0
@@ -35,10 +37,16 @@ class PointMenuPositions:
         "3": FIND_BOOK_MENU,
         "4": SELECT_BOOK_MENU,
         "5": UPDATE_BOOK_MENU,
+        "6": BATCH_DELETE_MENU,
+        "7": BATCH_UPDATE_MENU,
         "9": BACK_MENU,
         "0": EXIT_MENU,
     }
 
+    # Page navigation keys
+    NEXT_PAGE_KEY = "n"
+    PREVIOUS_PAGE_KEY = "p"
+
     # Book status choices
     STATUS_POSITION_CHOICES = (1, 2)
     STATUS_ACTIVE = "в наличии"
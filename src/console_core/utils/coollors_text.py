@@ -1,5 +1,8 @@
 """Console color text formatter."""
 
+from collections.abc import Iterable
+from dataclasses import dataclass
+
 COLORS = {
     "red": "\033[91m",
     "blue": "\033[94m",
@@ -10,6 +13,37 @@ COLORS = {
 }
 
 
+@dataclass(frozen=True)
+class TextStyle:
+    """Immutable color or style of text, safe to share between threads."""
+
+    code: str = COLORS["reset"]
+
+    def __call__(self, text: str) -> str:
+        """Return the text with applied color or style."""
+        return f"{self.code}{text}{COLORS['reset']}"
+
+    def lines(self, lines: Iterable[str]) -> str:
+        """Return the lines joined by newlines, each with applied color.
+
+        The color codes are joined with the lines once for the whole
+        batch instead of formatting every line.
+        """
+        lines = list(lines)
+        if not lines:
+            return ""
+        separator = f"{COLORS['reset']}\n{self.code}"
+        return f"{self.code}{separator.join(lines)}{COLORS['reset']}"
+
+
+RED = TextStyle(COLORS["red"])
+BLUE = TextStyle(COLORS["blue"])
+YELLOW = TextStyle(COLORS["yellow"])
+UNDERLINE = TextStyle(COLORS["underline"])
+BRIGHT_GREEN = TextStyle(COLORS["bright_green"])
+RESET = TextStyle()
+
+
 class FormatterColorText:
     """Formats text with colors for console output."""
 
@@ -64,10 +98,23 @@ class FormatterColorText:
         self._color_code = COLORS["reset"]
         return self
 
+    @property
+    def style(self) -> TextStyle:
+        """Return immutable copy of the current color or style."""
+        return TextStyle(self._color_code)
+
     def build_text(self) -> str:
         """Get the formatted text.
 
         Returns:
             str: The text with applied color or style.
         """
-        return f"{self._color_code}{self.text}{COLORS['reset']}"
+        return self.style(self.text)
+
+    def build_lines(self, lines: Iterable[str]) -> str:
+        """Get the lines joined by newlines, each with applied color.
+
+        Returns:
+            str: Same text as joining build_text() of every line.
+        """
+        return self.style.lines(lines)
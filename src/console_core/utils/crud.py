@@ -2,14 +2,72 @@
 
 import json
 import logging
+import os
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from itertools import islice
 from pathlib import Path
+from typing import Any, BinaryIO, NamedTuple
 
+from src.console_core.utils.atomic import atomic_open
+from src.console_core.utils.catalog import BookCatalog, book_matches
+from src.console_core.utils.indexes import TrigramIndex, YearIndex
+from src.console_core.utils.locking import FileLock, LockInfo
+from src.console_core.utils.storage import (
+    PAGE_SIZE,
+    BookPage,
+    BookStorage,
+    VersionConflictError,
+    decode_cursor,
+    record_version,
+)
+from src.console_core.utils.streaming import (
+    apply_operations,
+    iter_json_array,
+    write_json_array,
+)
 from src.models.book import Book, InvalidInputBookData
 
 logger = logging.getLogger(__name__)
 
 
-class BookCRUD:
+class CacheInfo(NamedTuple):
+    """Statistics of the in-process catalog cache."""
+
+    hits: int
+    misses: int
+    size: int
+
+
+def _stamp(stat: os.stat_result) -> tuple[int, int, int]:
+    """Return (inode, size, mtime) identifying the file version."""
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+def _atomic_dump(path: Path, data: Any, indent: int | None = None) -> None:
+    """Write JSON to the file atomically."""
+    with atomic_open(path) as file:
+        json.dump(data, file, ensure_ascii=False, indent=indent)
+
+
+def _cut_torn_tail(file: BinaryIO, block: int = 4096) -> None:
+    """Truncate the file after its last complete line."""
+    end = position = file.seek(0, os.SEEK_END)
+    while position > 0:
+        start = max(0, position - block)
+        file.seek(start)
+        newline = file.read(position - start).rfind(b"\n")
+        if newline != -1:
+            position = start + newline + 1
+            break
+        position = start
+    if position != end:
+        logger.error("Torn journal record cut off.")
+        file.truncate(position)
+
+
+class BookCRUD(BookStorage):
     """Simple CRUD for books."""
 
     OUT_PATH = Path(__file__).parent
@@ -17,36 +75,450 @@ class BookCRUD:
     OUT_PATH = OUT_PATH.absolute()
     FILE_PATH = OUT_PATH / "books.json"
 
-    def _read_books(self) -> list:
-        """Read data from JSON-file."""
+    def __init__(
+        self,
+        file_path: str | Path | None = None,
+        journal: bool = False,
+        journal_max_bytes: int = 1 << 20,
+        group_commit_window: float = 0.0,
+        streaming: bool = False,
+    ) -> None:
+        """Init CRUD with an empty catalog cache.
+
+        Args:
+            file_path: Path to the JSON catalog. Defaults to FILE_PATH.
+            journal: Append mutations to a journal instead of rewriting
+                the whole catalog on every change.
+            journal_max_bytes: Journal size that triggers compaction of
+                the journal into a new catalog snapshot.
+            group_commit_window: Seconds to collect mutations before
+                persisting them with one fsync. Zero saves every change
+                immediately.
+            streaming: Read books one at a time from the file instead
+                of keeping the catalog in memory. Mutations are always
+                journaled in this mode.
+        """
+        if file_path is not None:
+            self.FILE_PATH = Path(file_path)
+        self.JOURNAL_PATH = self.FILE_PATH.with_name(
+            f"{self.FILE_PATH.name}.journal"
+        )
+        self.META_PATH = self.FILE_PATH.with_name(
+            f"{self.FILE_PATH.name}.meta"
+        )
+        self.TRIGRAM_PATH = self.FILE_PATH.with_name(
+            f"{self.FILE_PATH.name}.trigram"
+        )
+        self.LOCK_PATH = self.FILE_PATH.with_name(
+            f"{self.FILE_PATH.name}.lock"
+        )
+        self._file_lock = FileLock(self.LOCK_PATH)
+        self._streaming = streaming
+        self._journal = journal or streaming
+        self._journal_max_bytes = journal_max_bytes
+        self._cache: BookCatalog | None = None
+        self._cache_stamp: tuple | None = None
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._group_commit_window = group_commit_window
+        self._pending: list[dict] = []
+        self._flush_timer: threading.Timer | None = None
+        self._lock = threading.RLock()
+        self._max_id = 0
+        self._next_id = 1
+        self._sequence_dirty = False
+        self._max_id_stamp: tuple | None = None
+        self._trigram_stamp: tuple | None = None
+
+    def cache_info(self) -> CacheInfo:
+        """Return hit/miss counters of the catalog cache."""
+        return CacheInfo(
+            hits=self._cache_hits,
+            misses=self._cache_misses,
+            size=len(self._cache) if self._cache is not None else 0,
+        )
+
+    def lock_info(self) -> LockInfo:
+        """Return statistics of waits for the catalog file lock."""
+        return self._file_lock.info()
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        """Hold the catalog alone for a read-modify-write cycle.
+
+        Other processes sharing the catalog wait for the cycle to end,
+        so their changes are neither lost nor given the same IDs.
+        """
+        with self._lock, self._file_lock.exclusive():
+            yield
+
+    @staticmethod
+    def _file_stamp(path: Path) -> tuple[int, int, int] | None:
+        """Return (inode, size, mtime) of the file or None."""
+        try:
+            return _stamp(os.stat(path))
+        except FileNotFoundError:
+            return None
+
+    def _stat_stamp(self) -> tuple:
+        """Return stamps of the catalog snapshot and its journal."""
+        return (
+            self._file_stamp(self.FILE_PATH),
+            self._file_stamp(self.JOURNAL_PATH),
+        )
+
+    def _load_books(self) -> BookCatalog:
+        """Return the cached catalog, re-reading it only if file changed.
+
+        Cache with not yet persisted mutations is always up to date.
+        """
+        with self._lock:
+            if self._cache is not None and (
+                self._pending or self._stat_stamp() == self._cache_stamp
+            ):
+                self._cache_hits += 1
+                return self._cache
+
+            self._cache_misses += 1
+            logger.debug("Catalog cache miss.")
+            with self._file_lock.shared():
+                stamp = self._stat_stamp()
+                self._cache = self._read_books()
+            self._cache_stamp = stamp
+            self._max_id = max((book["id"] for book in self._cache), default=0)
+            return self._cache
+
+    def _read_sequence(self) -> int:
+        """Read the next free book ID from the sidecar file."""
+        try:
+            with open(self.META_PATH, "r", encoding="utf-8") as file:
+                return int(json.load(file)["next_id"])
+        except FileNotFoundError:
+            return 1
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+            logger.error("Invalid sequence file, recovered from catalog.")
+            return 1
+
+    def allocate_ids(self, count: int = 1) -> range:
+        """Reserve a range of new book IDs.
+
+        IDs are taken from a persisted monotonic sequence, so they are
+        never reused even after the books holding them were deleted.
+        Books written by tools unaware of the sequence are respected
+        through the highest ID seen in the loaded catalog.
+
+        The sequence is saved before the lock is released, so processes
+        sharing the catalog get distinct IDs even with group commit.
+        """
+        if count < 1:
+            raise ValueError("Count of IDs must be positive.")
+        with self._exclusive():
+            start = self.next_id()
+            self._next_id = start + count
+            self._sequence_dirty = True
+            self._save_sequence()
+            return range(start, start + count)
+
+    def next_id(self) -> int:
+        """Return the ID the sequence gives next without reserving it."""
+        with self._lock:
+            self._scan_max_id()
+            if not self._sequence_dirty:
+                self._next_id = self._read_sequence()
+            return max(self._next_id, self._max_id + 1)
+
+    def _scan_max_id(self) -> None:
+        """Find the highest book ID stored in the catalog.
+
+        A streamed catalog is rescanned only if its files were changed
+        outside, own commits keep the highest ID current.
+        """
+        if not self._streaming:
+            self._load_books()
+            return
+        stamp = self._stat_stamp()
+        if stamp != self._max_id_stamp:
+            self._max_id = max(
+                (book["id"] for book in self._iter_books()), default=0
+            )
+            self._max_id_stamp = stamp
+
+    def _save_sequence(self) -> None:
+        """Persist the next free book ID."""
+        if self._sequence_dirty:
+            _atomic_dump(self.META_PATH, {"next_id": self._next_id})
+            self._sequence_dirty = False
+
+    def _read_books(self) -> BookCatalog:
+        """Read data from JSON-file and replay the journal tail.
+
+        The search index saved for this very snapshot is reused, else it
+        is built from the books and saved for the next start. The index
+        of a newer snapshot is saved on compaction or close, not on
+        every write.
+        """
         try:
             with open(self.FILE_PATH, "r", encoding="utf-8") as file:
                 logger.debug("Reading books from JSON-file.")
-                return json.load(file)
+                stamp = _stamp(os.fstat(file.fileno()))
+                trigrams = TrigramIndex.load(self.TRIGRAM_PATH, stamp)
+                books = BookCatalog(json.load(file), trigrams=trigrams)
+            if trigrams is not None:
+                self._trigram_stamp = stamp
+            elif books:
+                self._save_trigrams(books, stamp)
         except FileNotFoundError:
             logger.error(f"File {self.FILE_PATH} not found.")
-            return []
+            books = BookCatalog()
         except json.JSONDecodeError:
             logger.error("Invalid JSON file.")
             raise ValueError("File brake or incorrect.")
 
-    def _save_books(self, books: list) -> None:
-        """Save list of books in JSON-file."""
-        with open(self.FILE_PATH, "w", encoding="utf-8") as file:
-            json.dump(
-                books, file, ensure_ascii=False, indent=4  # type: ignore
-            )
+        for operation in self._read_journal():
+            books.apply(operation)
+        return books
+
+    def _iter_books(self, batch: Iterable[dict] = ()) -> Iterator[dict]:
+        """Stream books from the snapshot with the journal tail applied.
+
+        Memory use is bounded by the journal size and does not depend
+        on the number of books in the catalog.
+
+        Args:
+            batch: Mutations being flushed, applied after the pending.
+        """
+        with self._lock, self._file_lock.shared():
+            operations = [*self._read_journal(), *self._pending, *batch]
+            # Opened under the lock, so a compaction by another process
+            # can't pair the read journal with a newer snapshot.
+            try:
+                file = open(self.FILE_PATH, "r", encoding="utf-8")
+            except FileNotFoundError:
+                logger.error(f"File {self.FILE_PATH} not found.")
+                return apply_operations([], operations)
+        return apply_operations(iter_json_array(file), operations)
+
+    def iter_books(self) -> Iterator[dict]:
+        """Iterate over copies of book records in storage order."""
+        if self._streaming:
+            return self._iter_books()
+        return map(dict, iter(self._load_books()))
+
+    def _read_journal(self) -> list[dict]:
+        """Read mutations appended after the last snapshot."""
+        try:
+            with open(self.JOURNAL_PATH, "r", encoding="utf-8") as file:
+                lines = file.readlines()
+        except FileNotFoundError:
+            return []
+
+        operations = []
+        for number, line in enumerate(lines, 1):
+            try:
+                operations.append(json.loads(line))
+            except json.JSONDecodeError:
+                if number != len(lines):
+                    raise ValueError("Journal brake or incorrect.")
+                logger.error("Torn journal record skipped.")
+        logger.debug(f"Replayed {len(operations)} journal records.")
+        return operations
+
+    def _save_books(self, books: BookCatalog) -> None:
+        """Save catalog in JSON-file atomically and refresh the cache.
+
+        The snapshot contains every journaled mutation, so the journal
+        is dropped after the snapshot is written.
+        """
+        try:
+            with atomic_open(self.FILE_PATH) as file:
+                write_json_array(file, books)
+            self.JOURNAL_PATH.unlink(missing_ok=True)
+        except BaseException:
+            self._cache = None
+            raise
+        self._cache = books
+        self._cache_stamp = self._stat_stamp()
         logger.debug("Books saved.")
 
+    def _save_trigrams(self, books: BookCatalog, stamp: tuple) -> None:
+        """Save search index of the snapshot, failures are not fatal."""
+        try:
+            books.trigrams.save(self.TRIGRAM_PATH, stamp)
+        except OSError as e:
+            logger.error(f"Trigram index not saved: {e}")
+            return
+        self._trigram_stamp = stamp
+
+    def _save_current_trigrams(self) -> None:
+        """Save search index of the cached snapshot if not saved yet.
+
+        The index is saved only while the cache holds exactly the
+        snapshot, without a journal tail applied on top of it.
+        """
+        stamp = self._cache_stamp
+        if (
+            self._cache is None
+            or stamp is None
+            or stamp[1] is not None
+            or stamp[0] == self._trigram_stamp
+            or stamp != self._stat_stamp()
+        ):
+            return
+        self._save_trigrams(self._cache, stamp[0])
+
+    def _journal_records(
+        self, operations: list[dict], limited: bool = True
+    ) -> bytes | None:
+        """Return mutation records encoded one per line.
+
+        A batch which would make the journal too long is saved to a new
+        snapshot instead of being appended, read back and compacted, so
+        encoding stops and None is returned once it is known.
+
+        Args:
+            operations: Mutations of the batch.
+            limited: Stop at the journal size limit.
+        """
+        stamp = self._file_stamp(self.JOURNAL_PATH)
+        budget = self._journal_max_bytes - (0 if stamp is None else stamp[1])
+        records = []
+        for operation in operations:
+            record = json.dumps(operation, ensure_ascii=False) + "\n"
+            records.append(record.encode("utf-8"))
+            budget -= len(records[-1])
+            if limited and budget < 0:
+                return None
+        return b"".join(records)
+
+    def _append_journal(self, records: bytes) -> None:
+        """Append mutation records with one write and one fsync.
+
+        A torn record left by a crash is cut off first, else the next
+        record would be glued to it and lost.
+        """
+        with open(self.JOURNAL_PATH, "a+b") as file:
+            _cut_torn_tail(file)
+            file.write(records)
+            file.flush()
+            os.fsync(file.fileno())
+
+    def _commit(self, *operations: dict) -> None:
+        """Apply mutations to the cached catalog and schedule one save."""
+        if not operations:
+            return
+        with self._exclusive():
+            if not self._streaming:
+                books = self._load_books()
+                for operation in operations:
+                    books.apply(operation)
+            self._pending.extend(operations)
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Flush now or once the group commit window is over."""
+        if self._group_commit_window <= 0:
+            self.flush()
+        elif self._flush_timer is None:
+            self._flush_timer = threading.Timer(
+                self._group_commit_window, self.flush
+            )
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Persist all pending mutations as one batch."""
+        with self._exclusive():
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._save_sequence()
+            if self._streaming and self._pending:
+                operations, self._pending = self._pending, []
+                self._flush_stream(operations)
+                return
+            books = self._cache
+            if not self._pending or books is None:
+                return
+
+            operations, self._pending = self._pending, []
+            changed_outside = self._stat_stamp() != self._cache_stamp
+            try:
+                if self._journal:
+                    self._flush_journal(books, operations, changed_outside)
+                else:
+                    self._flush_snapshot(books, operations, changed_outside)
+            except BaseException:
+                self._cache = None
+                raise
+            logger.debug(f"Committed {len(operations)} mutations.")
+
+    def close(self) -> None:
+        """Persist pending mutations and the index, close the lock file."""
+        self.flush()
+        with self._lock:
+            with self._file_lock.shared():
+                self._save_current_trigrams()
+            self._file_lock.close()
+
+    def _flush_journal(
+        self,
+        books: BookCatalog,
+        operations: list[dict],
+        changed_outside: bool,
+    ) -> None:
+        """Append the batch to the journal, compacting it when too long."""
+        records = self._journal_records(
+            operations, limited=not changed_outside
+        )
+        if records is None:
+            logger.debug("Journal compaction.")
+            self._save_books(books)
+            self._save_current_trigrams()
+            return
+
+        self._append_journal(records)
+        if changed_outside:
+            self._cache = None
+            return
+        self._cache_stamp = self._stat_stamp()
+
+    def _flush_stream(self, operations: list[dict]) -> None:
+        """Append the batch to the journal, compacting it by streaming."""
+        scanned = self._stat_stamp() == self._max_id_stamp
+        records = self._journal_records(operations)
+        if records is None:
+            logger.debug("Streaming journal compaction.")
+            books = self._iter_books(batch=operations)
+            with atomic_open(self.FILE_PATH) as file:
+                write_json_array(file, books)
+            self.JOURNAL_PATH.unlink(missing_ok=True)
+        else:
+            self._append_journal(records)
+        if scanned:
+            self._max_id_stamp = self._stat_stamp()
+        logger.debug(f"Committed {len(operations)} mutations.")
+
+    def _flush_snapshot(
+        self,
+        books: BookCatalog,
+        operations: list[dict],
+        changed_outside: bool,
+    ) -> None:
+        """Save the batch as a new snapshot of the whole catalog."""
+        if changed_outside:
+            logger.debug("Catalog changed outside, rebase batch.")
+            books = self._read_books()
+            for operation in operations:
+                books.apply(operation)
+        self._save_books(books)
+
     def add_book_input_data(self, book_data: dict) -> str | None:
         """Add book input."""
         try:
             book = Book(**book_data).to_dict()
-            books = self._read_books()
-            book["id"] = max((book_["id"] for book_ in books), default=0) + 1
-
-            books.append(book)
-            self._save_books(books)
+            with self._exclusive():
+                book["id"] = self.allocate_ids()[0]
+                self._max_id = max(self._max_id, book["id"])
+                self._commit({"op": "add", "book": book})
             logger.debug("Books added.")
 
         except InvalidInputBookData as e:
@@ -55,73 +527,295 @@ class BookCRUD:
 
         return None
 
-    def delete_book_by_id(self, book_id: str | int) -> str | None:
-        """Delete book by id."""
-        try:
-            books = self._read_books()
-            updated_books = [book for book in books if book["id"] != book_id]
+    def insert_books(self, books: Iterable[dict]) -> int:
+        """Insert trusted book records keeping their IDs in one commit.
+
+        All records are saved with one write of the snapshot or of the
+        journal.
+        """
+        books = list(books)
+        if not books:
+            return 0
+        with self._exclusive():
+            if not self._streaming:
+                self._load_books().extend(books)
+            self._max_id = max(self._max_id, *(book["id"] for book in books))
+            self._pending.extend({"op": "add", "book": book} for book in books)
+            self._schedule_flush()
+        logger.debug(f"Inserted {len(books)} books.")
+        return len(books)
+
+    def delete_book_by_id(
+        self, book_id: str | int, expected_version: int | None = None
+    ) -> str | None:
+        """Delete book by id.
 
-            if len(books) == len(updated_books):
-                logger.debug("Books not deleted.")
-                raise InvalidInputBookData(f"Book not found by ID {book_id} ")
+        Raises:
+            VersionConflictError: If the book has not the expected version.
+        """
+        try:
+            with self._exclusive():
+                book = self.get_book(book_id)
+                if book is None:
+                    logger.debug("Books not deleted.")
+                    raise InvalidInputBookData(
+                        f"Book not found by ID {book_id} "
+                    )
 
-            self._save_books(updated_books)
+                self._check_version(book, expected_version)
+                self._commit({"op": "delete", "id": book_id})
         except InvalidInputBookData as e:
             logger.error(e)
             return str(e)
         return None
 
-    def find_book_by_part_info(self, look_for_data: str) -> list[str] | str:
-        """Find book by part info."""
-        books = self._read_books()
-        if not books:
-            return []
-        return [
-            Book(
-                _id=book["id"],
-                title=book["title"],
-                author=book["author"],
-                year=book["year"],
-                status=book["status"],
-            ).__str__()
-            for book in books
-            if look_for_data.lower() in book["title"].lower()
-            or look_for_data.lower() in book["author"].lower()
-            or look_for_data.lower() in book["year"]
+    def replace_books(self, books: Iterable[dict], next_id: int = 1) -> int:
+        """Replace the catalog with books streamed to a new snapshot.
+
+        Returns:
+            Count of written books.
+        """
+        count = 0
+
+        def counted() -> Iterator[dict]:
+            nonlocal count
+            for book in books:
+                count += 1
+                yield book
+
+        with self._exclusive():
+            self.flush()
+            with atomic_open(self.FILE_PATH) as file:
+                write_json_array(file, counted())
+            self.JOURNAL_PATH.unlink(missing_ok=True)
+            self._cache = None
+            self._max_id_stamp = None
+            self._next_id = next_id
+            self._sequence_dirty = True
+            self._save_sequence()
+        logger.debug(f"Catalog replaced with {count} books.")
+        return count
+
+    def delete_books(self, book_ids: Iterable[int]) -> list[int]:
+        """Delete books by IDs with one read and one write.
+
+        Returns:
+            IDs of the books which were not found.
+        """
+        return self._commit_batch(
+            book_ids, lambda book_id: {"op": "delete", "id": book_id}
+        )
+
+    def update_status_books(
+        self, book_ids: Iterable[int], status: str
+    ) -> list[int]:
+        """Update status of books by IDs with one read and one write.
+
+        Returns:
+            IDs of the books which were not found.
+        """
+        return self._commit_batch(
+            book_ids,
+            lambda book_id: {"op": "status", "id": book_id, "status": status},
+        )
+
+    def _commit_batch(
+        self, book_ids: Iterable[int], make_operation: Callable[[int], dict]
+    ) -> list[int]:
+        """Commit the operation for every found book, return missing IDs."""
+        book_ids = list(dict.fromkeys(book_ids))
+        with self._exclusive():
+            if self._streaming:
+                wanted = set(book_ids)
+                found = {
+                    book["id"]
+                    for book in self._iter_books()
+                    if book["id"] in wanted
+                }
+            else:
+                books = self._load_books()
+                found = {book_id for book_id in book_ids if book_id in books}
+            self._commit(
+                *(
+                    make_operation(book_id)
+                    for book_id in book_ids
+                    if book_id in found
+                )
+            )
+        logger.debug(f"Batch committed for {len(found)} books.")
+        return [book_id for book_id in book_ids if book_id not in found]
+
+    def book_version(self, book_id: str | int) -> int | None:
+        """Return version of the book record, None if not found.
+
+        A mutation given the version read before fails if the book was
+        changed in between.
+        """
+        book = self.get_book(book_id)
+        return None if book is None else record_version(book)
+
+    @staticmethod
+    def _check_version(book: dict, expected_version: int | None) -> None:
+        """Check that the book was not changed since the version read.
+
+        Raises:
+            VersionConflictError: If the book has not the expected version.
+        """
+        version = record_version(book)
+        if expected_version is not None and version != expected_version:
+            logger.debug(f"Book {book['id']} version {version} conflict.")
+            raise VersionConflictError(
+                f"Book {book['id']} was changed by another session,"
+                " try again."
+            )
+
+    def get_book(self, book_id: str | int) -> dict | None:
+        """Return copy of the book record by ID."""
+        if self._streaming:
+            return next(
+                (book for book in self._iter_books() if book["id"] == book_id),
+                None,
+            )
+        book = self._load_books().get(book_id)  # type: ignore
+        return None if book is None else dict(book)
+
+    def find_books(self, look_for_data: str) -> Iterator[dict]:
+        """Iterate over copies of book records found by part info."""
+        if self._streaming:
+            query = look_for_data.lower()
+            return (
+                book
+                for book in self._iter_books()
+                if book_matches(book, query)
+            )
+        return map(dict, self._load_books().search(look_for_data))
+
+    def find_books_by_year_range(
+        self, start: int | str, end: int | str
+    ) -> list[str]:
+        """Find books published from start to end year inclusive.
+
+        Raises:
+            InvalidInputBookData: If a year is not an integer.
+        """
+        books = self.year_records(*self._year_range(start, end))
+        return [self._book_view(book) for book in books]
+
+    def _stream_by_year(self, start: int, end: int) -> list[dict]:
+        """Read books from start to end year from the file by year."""
+        found = []
+        for book in self._iter_books():
+            key = YearIndex.key(book)
+            if key is not None and start <= key[0] <= end:
+                found.append((key, book))
+        found.sort(key=lambda item: item[0])
+        return [book for _, book in found]
+
+    def _stream_page(
+        self, after: int | None, limit: int, query: str | None = None
+    ) -> list[dict]:
+        """Read books of one page from the file in ID order."""
+        books = (
+            book
+            for book in self._iter_books()
+            if (after is None or book["id"] > after)
+            and (query is None or book_matches(book, query))
+        )
+        return list(islice(books, limit))
+
+    def page_records(
+        self,
+        after: int | None,
+        limit: int,
+        look_for_data: str | None = None,
+    ) -> list[dict]:
+        """Return copies of up to limit book records after the ID by ID.
+
+        Args:
+            after: Return only books with greater ID.
+            limit: Max count of books.
+            look_for_data: Return only books found by this part info.
+        """
+        if self._streaming:
+            query = None if look_for_data is None else look_for_data.lower()
+            return self._stream_page(after, limit, query=query)
+        with self._lock:
+            books = self._load_books().page(
+                after, limit, look_for_data=look_for_data
+            )
+            return list(map(dict, books))
+
+    def year_records(
+        self,
+        start: int,
+        end: int,
+        after: tuple[int, int] | None = None,
+        limit: int | None = None,
+    ) -> list[dict]:
+        """Return book records from start to end year by year.
+
+        Args:
+            start: First year of the range.
+            end: Last year of the range.
+            after: Return only books after this (year, id) key.
+            limit: Max count of books.
+        """
+        if not self._streaming:
+            return self._load_books().by_year(start, end, after, limit)
+        books = [
+            book
+            for book in self._stream_by_year(start, end)
+            if after is None or YearIndex.key(book) > after  # type: ignore
         ]
+        return books if limit is None else books[:limit]
 
-    def select_all_books(self) -> list[str]:
+    def find_books_by_year_page(
+        self,
+        start: int | str,
+        end: int | str,
+        limit: int = PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> BookPage:
+        """Return one page of books from start to end year by year.
+
+        Raises:
+            InvalidInputBookData: If a year or the cursor is invalid.
+        """
+        after = decode_cursor(cursor, size=2)
+        books = self.year_records(
+            *self._year_range(start, end), after=after, limit=limit + 1
+        )
+        return self._make_page(books, limit, key=YearIndex.key)
+
+    def select_all_books(self) -> Iterator[str]:
         """Select all books."""
-        books = self._read_books()
-        if not books:
-            return []
-        return [
-            Book(
-                _id=book["id"],
-                title=book["title"],
-                author=book["author"],
-                year=book["year"],
-                status=book["status"],
-            ).__str__()
-            for book in books
-        ]
+        if self._streaming:
+            return map(self._book_view, self._iter_books())
+        return map(self._book_view, iter(self._load_books()))
 
     def update_status_book(
-        self, book_id: str | int, status: str
+        self,
+        book_id: str | int,
+        status: str,
+        expected_version: int | None = None,
     ) -> str | None:
-        """Update book status."""
-        try:
-            books = self._read_books()
+        """Update book status.
 
-            for book in books:
-                if book["id"] == book_id:
-                    book["status"] = status
-                    self._save_books(books)
-                    return None
+        Raises:
+            VersionConflictError: If the book has not the expected version.
+        """
+        try:
+            with self._exclusive():
+                book = self.get_book(book_id)
+                if book is None:
+                    raise InvalidInputBookData(
+                        f"Book not found by ID {book_id}."
+                    )
 
+                self._check_version(book, expected_version)
+                self._commit({"op": "status", "id": book_id, "status": status})
             logger.debug("Book updated status.")
-
-            raise InvalidInputBookData(f"Book not found by ID {book_id}.")
+            return None
         except InvalidInputBookData as e:
             logger.error(e)
             return str(e)
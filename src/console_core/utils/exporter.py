@@ -0,0 +1,81 @@
+"""Streaming export of books to CSV and JSON Lines files."""
+
+import csv
+import json
+import logging
+import sys
+from collections.abc import Iterable
+from itertools import islice
+from pathlib import Path
+from typing import IO
+
+from src.console_core.utils.importer import detect_format
+from src.console_core.utils.storage import BookStorage
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = ("id", "title", "author", "year", "status")
+CHUNK_ROWS = 10_000
+STDOUT = "-"
+
+
+def write_books(
+    file: IO[str],
+    books: Iterable[dict],
+    file_format: str,
+    chunk_rows: int = CHUNK_ROWS,
+) -> int:
+    """Write books by chunks of rows, return count of written books.
+
+    Only one chunk of books is held in memory at a time.
+    """
+    books = iter(books)
+    if file_format == "csv":
+        writer = csv.DictWriter(
+            file, fieldnames=COLUMNS, extrasaction="ignore"
+        )
+        writer.writeheader()
+
+    count = 0
+    while chunk := list(islice(books, chunk_rows)):
+        if file_format == "csv":
+            writer.writerows(chunk)
+        else:
+            file.write(
+                "".join(
+                    json.dumps(book, ensure_ascii=False) + "\n"
+                    for book in chunk
+                )
+            )
+        count += len(chunk)
+    return count
+
+
+def export_file(
+    storage: BookStorage,
+    path: str | Path,
+    file_format: str | None = None,
+    look_for_data: str | None = None,
+) -> int:
+    """Export all books or books found by part info to the file.
+
+    Args:
+        storage: Books storage.
+        path: Target file, "-" writes to standard output.
+        file_format: csv or jsonl, defaults to the suffix of the path.
+        look_for_data: Export only books found by this part info.
+    """
+    if file_format is None:
+        file_format = "jsonl" if path == STDOUT else detect_format(path)
+    books = (
+        storage.iter_books()
+        if look_for_data is None
+        else storage.find_books(look_for_data)
+    )
+    if path == STDOUT:
+        count = write_books(sys.stdout, books, file_format)
+    else:
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            count = write_books(file, books, file_format)
+    logger.info(f"Exported {count} books.")
+    return count
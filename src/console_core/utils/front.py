@@ -1,17 +1,114 @@
 """Front module of console."""
 
 import logging
+import os
+import re
 import sys
 from collections.abc import Callable
 from functools import partial
+from pathlib import Path
 
+from src.console_core.utils.backends import make_storage
 from src.console_core.utils.console_navigator import PointMenuPositions
 from src.console_core.utils.coollors_text import FormatterColorText
-from src.console_core.utils.crud import BookCRUD
 from src.console_core.utils.ioconsole import ConsoleInput, ConsoleOutput
+from src.console_core.utils.renderer import RENDER_DIFF_ENV, FrameRenderer
+from src.console_core.utils.storage import (
+    PAGE_SIZE,
+    BookPage,
+    BookStorage,
+    VersionConflictError,
+)
 
 logger = logging.getLogger(__name__)
 
+# A number or a "start-end" range of numbers, for years and book IDs.
+NUMBER_RANGE_PATTERN = re.compile(
+    r"\s*(?P<start>\d+)\s*(?:-\s*(?P<end>\d+))?\s*"
+)
+MAX_BATCH_IDS = 1_000_000
+BOOK_IDS_ERROR = "Use IDs and ranges of IDs like 1,5,10-250."
+
+
+def parse_book_ids(text: str) -> list[int]:
+    """Return IDs of comma-separated IDs and ranges like 10-250.
+
+    Raises:
+        ValueError: If the text is not a list of IDs or has too many IDs.
+    """
+    book_ids: list[int] = []
+    for part in text.split(","):
+        match = NUMBER_RANGE_PATTERN.fullmatch(part)
+        if match is None:
+            raise ValueError(BOOK_IDS_ERROR)
+        start = int(match.group("start"))
+        end = int(match.group("end") or start)
+        if end < start or len(book_ids) + end - start >= MAX_BATCH_IDS:
+            raise ValueError(BOOK_IDS_ERROR)
+        book_ids.extend(range(start, end + 1))
+    return book_ids
+
+
+def format_book_ids(book_ids: list[int]) -> str:
+    """Return sorted IDs with runs of IDs joined into ranges."""
+    parts: list[list[int]] = []
+    for book_id in sorted(book_ids):
+        if parts and parts[-1][1] + 1 == book_id:
+            parts[-1][1] = book_id
+        else:
+            parts.append([book_id, book_id])
+    return ",".join(
+        str(start) if start == end else f"{start}-{end}"
+        for start, end in parts
+    )
+
+
+class BookPager:
+    """Pages of found books with next and previous page navigation.
+
+    Only the current page is fetched, cursors of the visited pages are
+    kept to go back.
+    """
+
+    def __init__(
+        self,
+        screener: "ConsoleOutput",
+        fetch: Callable[[str | None], BookPage],
+    ) -> None:
+        """Fetch the first page.
+
+        Args:
+            screener: Console output.
+            fetch: Function returning the page by its cursor.
+        """
+        self._screener = screener
+        self._fetch = fetch
+        self._cursors: list[str | None] = [None]
+        self._page = fetch(None)
+
+    def __call__(self) -> None:
+        """Show the current page."""
+        self._screener.find_book_successful(self._page.items)
+        self._screener.page_navigation_screen(
+            number=len(self._cursors),
+            has_previous=len(self._cursors) > 1,
+            has_next=self._page.next_cursor is not None,
+        )
+
+    def turn(self, key: str) -> bool:
+        """Turn the page by the key, False for keys of other menus."""
+        if key == PointMenuPositions.NEXT_PAGE_KEY:
+            if self._page.next_cursor is not None:
+                self._cursors.append(self._page.next_cursor)
+                self._page = self._fetch(self._page.next_cursor)
+            return True
+        if key == PointMenuPositions.PREVIOUS_PAGE_KEY:
+            if len(self._cursors) > 1:
+                self._cursors.pop()
+                self._page = self._fetch(self._cursors[-1])
+            return True
+        return False
+
 
 class ConsoleFront:
     """Main console worker."""
@@ -20,7 +117,7 @@ class ConsoleFront:
         self,
         screener: "ConsoleOutput",
         io_cls: "ConsoleInput",
-        crud: "BookCRUD",
+        crud: "BookStorage",
     ) -> None:
         """Initialize dependencies."""
         self._screener = screener
@@ -55,12 +152,16 @@ class ConsoleFront:
     def back_menu(self, call_screen: Callable | None = None) -> int | str:
         """Return to the previous menu."""
         logger.debug("event back menu screener called.")
-        self._screener.back_menu_screen(call_screen=call_screen)
+        while True:
+            self._screener.back_menu_screen(call_screen=call_screen)
+            choice = self._io.menu_input()
+            if isinstance(call_screen, BookPager) and call_screen.turn(choice):
+                continue
 
-        return PointMenuPositions.GET_MENU_BY_KEY.get(
-            self._io.menu_input(),
-            PointMenuPositions.BACK_MENU_HELPER,
-        )
+            return PointMenuPositions.GET_MENU_BY_KEY.get(
+                choice,
+                PointMenuPositions.BACK_MENU_HELPER,
+            )
 
     def delete_book(self) -> Callable:
         """Call controller to delete a book."""
@@ -111,19 +212,39 @@ class ConsoleFront:
             find_value = self._io.find_book_input_data(
                 position_form=position_key
             )
-            books_or_str_err = self._crud.find_book_by_part_info(
-                look_for_data=find_value
+            if position_key == PointMenuPositions.FORM_FIND_BOOK_YEAR:
+                return self._find_book_by_year(find_value)
+
+            return BookPager(
+                self._screener,
+                partial(self._crud.find_books_page, find_value, PAGE_SIZE),
             )
 
+    def _find_book_by_year(self, find_value: str | None) -> Callable:
+        """Call controller to find books by year or range of years."""
+        match = NUMBER_RANGE_PATTERN.fullmatch(find_value or "")
+        if match is None:
             return partial(
-                self._screener.find_book_successful, books_or_str_err
+                self._screener.find_book_failed_screen,
+                "Use year or range of years like 1950-1980.",
             )
+        start, end = match.group("start"), match.group("end")
+        return BookPager(
+            self._screener,
+            partial(
+                self._crud.find_books_by_year_page,
+                start,
+                end or start,
+                PAGE_SIZE,
+            ),
+        )
 
     def select_all_book(self) -> Callable:
         """Call controller to select all books."""
         logger.debug("event select all book called.")
-        all_books = self._crud.select_all_books()
-        return partial(self._screener.find_book_successful, all_books)
+        return BookPager(
+            self._screener, partial(self._crud.list_books_page, PAGE_SIZE)
+        )
 
     def update_book_status(self) -> Callable:
         """Call controller to update book status."""
@@ -142,6 +263,9 @@ class ConsoleFront:
                 fail_id = True
 
             else:
+                # Read before the status is chosen, so a change made by
+                # another session meanwhile is not overwritten.
+                version = self._crud.book_version(book_id_int)
                 num_status = ""
                 fail_status = None
                 not_break = True
@@ -173,9 +297,14 @@ class ConsoleFront:
                     except KeyError:
                         error = "Error switch status."
                     else:
-                        error = self._crud.update_status_book(
-                            book_id=book_id_int, status=status
-                        )
+                        try:
+                            error = self._crud.update_status_book(
+                                book_id=book_id_int,
+                                status=status,
+                                expected_version=version,
+                            )
+                        except VersionConflictError as e:
+                            error = str(e)
 
                     if not error:
                         return self._screener.update_book_successful_screen
@@ -185,10 +314,57 @@ class ConsoleFront:
                         )
                         return result_action
 
+    def delete_books(self) -> Callable:
+        """Call controller to delete books by list of IDs."""
+        logger.debug("event delete books called.")
+        book_ids = self._input_book_ids()
+        missing = self._crud.delete_books(book_ids)
+        return self._batch_result(book_ids, missing)
+
+    def update_books_status(self) -> Callable:
+        """Call controller to update status of books by list of IDs."""
+        logger.debug("event update books status called.")
+        book_ids = self._input_book_ids()
+        fail_status = None
+        while True:
+            self._screener.update_book_screen_status(msg_err=fail_status)
+            status = PointMenuPositions.GET_STATUS.get(self._io.menu_input())
+            if status is not None:
+                break
+            fail_status = "Use ony 1 or 2 position please."
+        missing = self._crud.update_status_books(book_ids, status)
+        return self._batch_result(book_ids, missing)
+
+    def _input_book_ids(self) -> list[int]:
+        """Ask list of book IDs until it is valid."""
+        fail = None
+        while True:
+            self._screener.book_ids_screen(msg_err=fail)
+            try:
+                return parse_book_ids(self._io.book_ids())
+            except ValueError as e:
+                logger.debug(e)
+                fail = str(e)
+
+    def _batch_result(
+        self, book_ids: list[int], missing: list[int]
+    ) -> Callable:
+        """Return screen with the result of the batch change."""
+        return partial(
+            self._screener.batch_result_screen,
+            len(set(book_ids)) - len(missing),
+            format_book_ids(missing),
+        )
+
+    def close(self) -> None:
+        """Persist pending changes and release the storage."""
+        self._crud.close()
+
     def exit_console(self) -> None:
         """Exit the console."""
         logger.debug("event exit called.")
         self._screener.exit_menu_screen()
+        self.close()
         sys.exit(0)
 
     def back_menu_halper_screen(self) -> Callable:
@@ -197,12 +373,28 @@ class ConsoleFront:
         return self._screener.back_menu_context_info_helper
 
 
-def make_front_console():
-    """Return console front worker."""
+def make_front_console(
+    storage: str | None = None,
+    path: str | Path | None = None,
+    renderer: FrameRenderer | None = None,
+    reader: Callable[[str], str] | None = None,
+):
+    """Return console front worker.
+
+    Args:
+        storage: Name of the books storage, see backends.STORAGES.
+        path: Storage file, defaults to the storage default.
+        renderer: Frame buffer of the screens, flushed before prompts.
+            Redraws only changed lines if BOOKS_RENDER_DIFF is 1.
+        reader: Reads a line after the prompt, defaults to input.
+    """
     printer = FormatterColorText()
-    io = ConsoleInput(printer=printer)
-    crud = BookCRUD()
-    screener = ConsoleOutput(printer=printer)
+    renderer = renderer or FrameRenderer(
+        diff=os.environ.get(RENDER_DIFF_ENV) == "1"
+    )
+    io = ConsoleInput(printer=printer, renderer=renderer, reader=reader)
+    crud = make_storage(kind=storage, path=path)
+    screener = ConsoleOutput(printer=printer, renderer=renderer)
 
     return ConsoleFront(
         screener=screener,
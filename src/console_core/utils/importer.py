@@ -0,0 +1,156 @@
+"""Bulk import of books from CSV and JSON Lines files."""
+
+import csv
+import json
+import logging
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from src.console_core.utils.console_navigator import PointMenuPositions
+from src.console_core.utils.storage import BookStorage
+from src.models.book import Book, InvalidInputBookData
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("csv", "jsonl")
+FIELDS = ("title", "author", "year", "status")
+INVALID_ROW_MSG = "Invalid row."
+INVALID_STATUS_MSG = "Invalid status."
+STATUSES = frozenset(
+    (*PointMenuPositions.GET_STATUS.values(), Book.DEFAULT_STATUS)
+)
+
+
+class ImportReject(NamedTuple):
+    """Row of the file which was not imported."""
+
+    line: int
+    error: str
+
+
+class ImportReport(NamedTuple):
+    """Result of the bulk import."""
+
+    imported: int
+    rejects: list[ImportReject]
+    seconds: float
+    ids: range = range(0)
+
+    @property
+    def rows_per_second(self) -> float:
+        """Return throughput of the import."""
+        rows = self.imported + len(self.rejects)
+        return rows / self.seconds if self.seconds else float(rows)
+
+
+def detect_format(path: str | Path) -> str:
+    """Return format of the file by its suffix.
+
+    Raises:
+        ValueError: If the suffix is not of a known format.
+    """
+    suffix = Path(path).suffix.lstrip(".").lower()
+    if suffix in ("json", "ndjson"):
+        suffix = "jsonl"
+    if suffix not in FORMATS:
+        raise ValueError(f"Unknown format of {path}, use csv or jsonl.")
+    return suffix
+
+
+def read_rows(
+    path: str | Path, file_format: str | None = None
+) -> Iterator[tuple[int, Any]]:
+    """Stream (line number, row) pairs of the file.
+
+    Lines of JSON Lines files that are not valid JSON are returned as
+    None rows, so they are rejected instead of stopping the import.
+    """
+    file_format = file_format or detect_format(path)
+    with open(path, "r", encoding="utf-8", newline="") as file:
+        if file_format == "csv":
+            reader = csv.DictReader(file)
+            for row in reader:
+                yield reader.line_num, row
+            return
+
+        yield from parse_json_lines(file)
+
+
+def parse_json_lines(lines: Iterable[str]) -> Iterator[tuple[int, Any]]:
+    """Stream (line number, row) pairs of JSON Lines skipping blanks.
+
+    Lines that are not valid JSON are returned as None rows.
+    """
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            yield number, json.loads(line)
+        except json.JSONDecodeError:
+            yield number, None
+
+
+def validate_row(row: Any) -> dict:
+    """Return book record of the row checked by Book descriptors.
+
+    Raises:
+        InvalidInputBookData: If the row is not a valid book.
+    """
+    if not isinstance(row, dict):
+        raise InvalidInputBookData(INVALID_ROW_MSG)
+    fields: dict[str, Any] = {field: row.get(field) for field in FIELDS}
+    if fields["year"] is None:
+        fields["year"] = ""
+    if fields["status"] not in (None, "") and (
+        not isinstance(fields["status"], str)
+        or fields["status"] not in STATUSES
+    ):
+        raise InvalidInputBookData(INVALID_STATUS_MSG)
+    try:
+        return Book(**fields).to_dict()
+    except TypeError:
+        raise InvalidInputBookData(INVALID_ROW_MSG)
+
+
+def import_books(
+    storage: BookStorage, rows: Iterable[tuple[int, Any]]
+) -> ImportReport:
+    """Validate rows and insert the valid books with one commit.
+
+    IDs of the rows are ignored, all valid books get new IDs allocated
+    with one call in the order of the rows.
+    """
+    started = time.perf_counter()
+    books, rejects = [], []
+    for line, row in rows:
+        try:
+            books.append(validate_row(row))
+        except InvalidInputBookData as e:
+            rejects.append(ImportReject(line=line, error=str(e)))
+
+    ids = range(0)
+    if books:
+        ids = storage.allocate_ids(len(books))
+        for book, book_id in zip(books, ids):
+            book["id"] = book_id
+        storage.insert_books(books)
+
+    report = ImportReport(
+        imported=len(books),
+        rejects=rejects,
+        seconds=time.perf_counter() - started,
+        ids=ids,
+    )
+    logger.info(
+        f"Imported {report.imported} books, rejected {len(rejects)} rows."
+    )
+    return report
+
+
+def import_file(
+    storage: BookStorage, path: str | Path, file_format: str | None = None
+) -> ImportReport:
+    """Import books of the CSV or JSON Lines file."""
+    return import_books(storage, read_rows(path, file_format))
@@ -0,0 +1,182 @@
+"""Secondary indexes of the books catalog."""
+
+import bisect
+import json
+import logging
+from collections import defaultdict
+from collections.abc import Iterable
+from pathlib import Path
+
+from src.console_core.utils.atomic import atomic_open
+
+logger = logging.getLogger(__name__)
+
+
+class TrigramIndex:
+    """Inverted index of title, author and year trigrams.
+
+    Narrows substring search to books containing every trigram of the
+    query. Candidates still have to be verified by the caller.
+    """
+
+    GRAM_SIZE = 3
+
+    def __init__(self) -> None:
+        """Init empty index."""
+        self._postings: defaultdict[str, set[int]] = defaultdict(set)
+
+    @classmethod
+    def _grams(cls, text: str) -> set[str]:
+        """Return trigrams of the text."""
+        size = cls.GRAM_SIZE
+        return {
+            text[start : start + size]  # noqa: E203
+            for start in range(len(text) - size + 1)
+        }
+
+    @classmethod
+    def _book_grams(cls, book: dict) -> set[str]:
+        """Return trigrams of every searchable field of the book."""
+        return (
+            cls._grams(book["title"].lower())
+            | cls._grams(book["author"].lower())
+            | cls._grams(book["year"])
+        )
+
+    def add(self, book: dict) -> None:
+        """Index the book."""
+        for gram in self._book_grams(book):
+            self._postings[gram].add(book["id"])
+
+    def remove(self, book: dict) -> None:
+        """Drop the book from the index."""
+        for gram in self._book_grams(book):
+            ids = self._postings.get(gram)
+            if ids is not None:
+                ids.discard(book["id"])
+                if not ids:
+                    del self._postings[gram]
+
+    def candidates(self, query: str) -> set[int] | None:
+        """Return IDs of books which may contain the query.
+
+        None means the query is too short to use the index and every
+        book is a candidate.
+        """
+        grams = self._grams(query.lower())
+        if not grams:
+            return None
+
+        postings = sorted(
+            (self._postings.get(gram, set()) for gram in grams), key=len
+        )
+        result = set(postings[0])
+        for ids in postings[1:]:
+            if not result:
+                break
+            result &= ids
+        return result
+
+    def save(self, path: Path, stamp: tuple) -> None:
+        """Persist index built for the catalog file with the stamp.
+
+        The stamp is saved on the first line and the postings as JSON
+        after it, so a stale index is found without decoding postings.
+        The file may be shared by desks and must hold nothing but data.
+        """
+        postings = {gram: sorted(ids) for gram, ids in self._postings.items()}
+        with atomic_open(path, durable=False) as file:
+            file.write(json.dumps(list(stamp)) + "\n")
+            # json.dump encodes by the pure Python encoder, dumps by C.
+            file.write(
+                json.dumps(postings, ensure_ascii=False, separators=(",", ":"))
+            )
+        logger.debug("Trigram index saved.")
+
+    @classmethod
+    def load(cls, path: Path, stamp: tuple) -> "TrigramIndex | None":
+        """Load index if it was built for the catalog with the stamp."""
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                saved_stamp = json.loads(file.readline())
+                if not isinstance(saved_stamp, list):
+                    raise TypeError("Stamp is not a list.")
+                if tuple(saved_stamp) != stamp:
+                    logger.debug("Trigram index is stale, rebuild.")
+                    return None
+                postings = {
+                    gram: set(map(int, ids))
+                    for gram, ids in json.load(file).items()
+                }
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError, AttributeError):
+            logger.error("Invalid trigram index, rebuild.")
+            return None
+
+        index = cls()
+        index._postings.update(postings)
+        return index
+
+
+class YearIndex:
+    """Sorted (year, id) pairs for exact year and range queries."""
+
+    def __init__(self, books: Iterable[dict] = ()) -> None:
+        """Init index sorted once over the books."""
+        self._keys: list[tuple[int, int]] = sorted(
+            key for key in map(self.key, books) if key is not None
+        )
+
+    @staticmethod
+    def key(book: dict) -> tuple[int, int] | None:
+        """Return sort key of the book, None for a non-numeric year."""
+        try:
+            return int(book["year"]), book["id"]
+        except (TypeError, ValueError):
+            return None
+
+    def add(self, book: dict) -> None:
+        """Index the book."""
+        key = self.key(book)
+        if key is not None:
+            bisect.insort(self._keys, key)
+
+    def update(self, books: Iterable[dict]) -> None:
+        """Index many books, sorting the keys once."""
+        self._keys.extend(
+            key for key in map(self.key, books) if key is not None
+        )
+        self._keys.sort()
+
+    def remove(self, book: dict) -> None:
+        """Drop the book from the index."""
+        key = self.key(book)
+        if key is None:
+            return
+        position = bisect.bisect_left(self._keys, key)
+        if position < len(self._keys) and self._keys[position] == key:
+            del self._keys[position]
+
+    def between(
+        self,
+        start: int,
+        end: int,
+        after: tuple[int, int] | None = None,
+        limit: int | None = None,
+    ) -> list[int]:
+        """Return IDs of books from start to end year inclusive.
+
+        Args:
+            start: First year of the range.
+            end: Last year of the range.
+            after: Return only books after this (year, id) key.
+            limit: Max count of IDs.
+        """
+        low = bisect.bisect_left(self._keys, (start,))
+        if after is not None:
+            low = max(low, bisect.bisect_right(self._keys, after))
+        high = bisect.bisect_left(self._keys, (end + 1,), lo=low)
+        if limit is not None:
+            high = min(high, low + limit)
+        return [book_id for _, book_id in self._keys[low:high]]
@@ -1,13 +1,18 @@
 """Navigation class for console interface."""
 
 import logging
-import os
+import shutil
 from dataclasses import dataclass
 from functools import partial
-from typing import Callable
+from typing import Callable, Iterable
 
 from src.console_core.utils.console_navigator import PointMenuPositions
-from src.console_core.utils.coollors_text import FormatterColorText
+from src.console_core.utils.coollors_text import (
+    BLUE,
+    YELLOW,
+    FormatterColorText,
+)
+from src.console_core.utils.renderer import FrameRenderer
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +21,10 @@ class ConsoleOutput:
     """Handles console output for navigation menus."""
 
     def __init__(
-        self, printer: FormatterColorText, version: str | None = None
+        self,
+        printer: FormatterColorText,
+        version: str | None = None,
+        renderer: FrameRenderer | None = None,
     ):
         """
         Initialize ConsoleOutput.
@@ -24,22 +32,42 @@ class ConsoleOutput:
         Args:
             printer: Formatter for colored text.
             version: Application version.
+            renderer: Frame buffer the screens are composed in, shared
+                with ConsoleInput which flushes it before prompts.
+                Without it the screens are written at once.
         """
         self._version: str = "0.0.1" if version is None else version
         self._printer = printer
-
-    @staticmethod
-    def _clear_screen():
-        """Clear the console screen."""
-        os.system("cls" if os.name == "nt" else "clear")
+        self._renderer = renderer or FrameRenderer(autoflush=True)
+        self._fragments: dict[str, str] = {}
+        self._fragments_key: tuple | None = None
+
+    def _fragment(self, name: str, render: Callable[[], str]) -> str:
+        """Return the static screen fragment rendered once."""
+        fragment = self._fragments.get(name)
+        if fragment is None:
+            fragment = self._fragments[name] = render()
+        return fragment
+
+    def _check_fragments(self) -> None:
+        """Drop cached fragments if terminal width or version changed."""
+        key = (shutil.get_terminal_size().columns, self._version)
+        if key != self._fragments_key:
+            self._fragments = {}
+            self._fragments_key = key
+
+    def _clear_screen(self):
+        """Start a new frame of the console screen."""
+        self._check_fragments()
+        self._renderer.clear()
 
     def _exit_text(self) -> str:
         """Generate exit menu text."""
-        return self._printer("0.exit").blue().build_text()
+        return BLUE("0.exit")
 
     def _back_text(self) -> str:
         """Generate back menu text."""
-        return self._printer("9.back").blue().build_text()
+        return BLUE("9.back")
 
     def _screen_footer(
         self,
@@ -57,11 +85,18 @@ class ConsoleOutput:
         if call_screen and callable(call_screen):
             call_screen()
 
-        output = self._printer(invite_text).blue().build_text()
-        print(self._under_separator())
-        print(f"{self._exit_text():^35}{self._back_text()}")
-        print(self._separator())
-        print(output)
+        self._renderer.print(self._fragment("footer", self._render_footer))
+        self._renderer.print(BLUE(invite_text))
+
+    def _render_footer(self) -> str:
+        """Render exit and back items between separators."""
+        return "\n".join(
+            (
+                self._under_separator(),
+                f"{self._exit_text():^35}{self._back_text()}",
+                self._separator(),
+            )
+        )
 
     def _full_time_screen(self) -> Callable:
         """Make decorator to clear and prepare screen."""
@@ -78,17 +113,20 @@ class ConsoleOutput:
 
     def _separator(self) -> str:
         """Generate a separator line."""
-        return self._printer("=" * 45).yellow().build_text()
+        return self._fragment("separator", lambda: YELLOW("=" * 45))
 
     def _under_separator(self) -> str:
         """Generate an underline separator."""
-        return self._printer("_" * 45).yellow().build_text()
+        return self._fragment("under_separator", lambda: YELLOW("_" * 45))
 
     def _header_screen(self) -> None:
         """Make header with application info."""
+        self._renderer.print(self._fragment("header", self._render_header))
+
+    def _render_header(self) -> str:
+        """Render application info above the separator."""
         header_text = f"Console util v:{self._version}"
-        header_view = self._printer(f"{header_text:^40}").yellow().build_text()
-        print(header_view, self._separator(), sep="\n")
+        return f"{YELLOW(f'{header_text:^40}')}\n{self._separator()}"
 
     def main_menu_screen(
         self, invite_text_miss_button: bool | None = None
@@ -103,8 +141,12 @@ class ConsoleOutput:
         @self._full_time_screen()
         def _main_menu():
             logger.debug("Call main menu")
-            menu_items = self._generate_menu_items()
-            print(self._make_menu_data(menu_items))
+            self._renderer.print(
+                self._fragment(
+                    "menu",
+                    lambda: self._make_menu_data(self._generate_menu_items()),
+                )
+            )
 
         _main_menu()
 
@@ -123,11 +165,13 @@ class ConsoleOutput:
     def _generate_menu_items(self) -> tuple:
         """Generate menu items for main menu."""
         return (
-            self._printer("1.Add book").blue().build_text(),
-            self._printer("2.Del book by ID").blue().build_text(),
-            self._printer("3.Find book").blue().build_text(),
-            self._printer("4.Select all").blue().build_text(),
-            self._printer("5.Update status book").blue().build_text(),
+            BLUE("1.Add book"),
+            BLUE("2.Del book by ID"),
+            BLUE("3.Find book"),
+            BLUE("4.Select all"),
+            BLUE("5.Update status book"),
+            BLUE("6.Del books by IDs"),
+            BLUE("7.Update status books"),
         )
 
     @staticmethod
@@ -151,7 +195,8 @@ class ConsoleOutput:
         exit_screen = (
             self._printer("Program exited successfully").blue().build_text()
         )
-        print(exit_screen)
+        self._renderer.print(exit_screen)
+        self._renderer.flush()
 
     def add_book_screen(self) -> None:
         """Make the add book screen."""
@@ -185,7 +230,7 @@ class ConsoleOutput:
             form for form in self._generate_input_instruction_forms()
         )
         output_text = f"{screen_instruction}\n{forms}"
-        print(output_text)
+        self._renderer.print(output_text)
 
     def add_book_successful_screen(self) -> None:
         """Make the success screen after adding a book."""
@@ -193,13 +238,13 @@ class ConsoleOutput:
         success_screen = (
             self._printer("Successful added book").bright_green().build_text()
         )
-        print(f"{success_screen:^45}")
+        self._renderer.print(f"{success_screen:^45}")
 
     def add_book_failed_screen(self, msg: str) -> None:
         """Make the failure screen after an unsuccessful book addition."""
         logger.debug("call add book failed screen.")
         failed_screen = self._printer(f"Failed: {msg}").red().build_text()
-        print(f"{failed_screen:^45}")
+        self._renderer.print(f"{failed_screen:^45}")
 
     def delete_book_by_id_screen(self, msg: bool | None = None) -> None:
         """Make the screen for deleting a book by ID."""
@@ -219,11 +264,11 @@ class ConsoleOutput:
                     .underline()
                     .build_text()
                 )
-            print(screen_instruction)
+            self._renderer.print(screen_instruction)
 
         _delete_book_by_id()
         if msg:
-            print(self._separator())
+            self._renderer.print(self._separator())
 
     def delete_book_successful(self) -> None:
         """Make the success screen after deleting a book."""
@@ -233,13 +278,13 @@ class ConsoleOutput:
             .bright_green()
             .build_text()
         )
-        print(f"{success_screen:^45}")
+        self._renderer.print(f"{success_screen:^45}")
 
     def delete_book_failed_screen(self, msg: str) -> None:
         """Make the failure screen after an unsuccessful book deletion."""
         logger.debug("call delete book screen")
         failed_screen = self._printer(f"Failed: {msg}").red().build_text()
-        print(f"{failed_screen:^45}")
+        self._renderer.print(f"{failed_screen:^45}")
 
     def find_book_screen(self, msg_err: str | None = None) -> None:
         """Make the screen for searching a book."""
@@ -259,32 +304,84 @@ class ConsoleOutput:
             self._form_book(screen_instruction=screen_instruction)
 
             if msg_err:
-                print(self._printer(msg_err).red().build_text())
+                self._renderer.print(self._printer(msg_err).red().build_text())
 
         _find_book()
-        print(self._separator())
+        self._renderer.print(self._separator())
 
-    def find_book_successful(self, books: list[str]) -> None:
+    def find_book_successful(self, books: Iterable[str]) -> None:
         """Make the success screen after finding a book."""
         logger.debug("call find book successful screen.")
         success_screen = self._printer("Found:").bright_green().build_text()
-        screen_books = "\n".join(
-            (self._printer(book).bright_green().build_text() for book in books)
+        screen_books = self._printer("").bright_green().build_lines(books)
+        self._renderer.print(f"{success_screen:^45}")
+        self._renderer.print(f"{screen_books:^45}")
+
+    def page_navigation_screen(
+        self, number: int, has_previous: bool, has_next: bool
+    ) -> None:
+        """Make the page navigation line under the found books."""
+        if not has_previous and not has_next:
+            return
+        logger.debug("call page navigation screen.")
+        previous_text = "p.prev" if has_previous else ""
+        next_text = "n.next" if has_next else ""
+        navigation = self._printer(
+            f"{previous_text:<15}{f'page {number}':^15}{next_text:>15}"
         )
-        print(f"{success_screen:^45}")
-        print(f"{screen_books:^45}")
+        self._renderer.print(navigation.blue().build_text())
+
+    def find_book_failed_screen(self, msg: str) -> None:
+        """Make the failure screen after an unsuccessful book search."""
+        logger.debug("call find book failed screen.")
+        failed_screen = self._printer(f"Failed: {msg}").red().build_text()
+        self._renderer.print(f"{failed_screen:^45}")
 
     def update_book_screen_id(self, msg_err: bool | None = None):
         """Make the screen for updating a book by ID."""
         logger.debug("call update book ID screen.")
         self.delete_book_by_id_screen(msg=msg_err)
 
+    def book_ids_screen(self, msg_err: str | None = None) -> None:
+        """Make the screen for entering a list of book IDs."""
+
+        @self._full_time_screen()
+        def _book_ids():
+            logger.debug("call book IDs screen")
+            if msg_err:
+                screen_instruction = self._printer(msg_err).red().build_text()
+            else:
+                screen_instruction = (
+                    self._printer("Enter book IDs like 1,5,10-250:")
+                    .underline()
+                    .build_text()
+                )
+            self._renderer.print(screen_instruction)
+
+        _book_ids()
+        if msg_err:
+            self._renderer.print(self._separator())
+
+    def batch_result_screen(self, done: int, missing: str) -> None:
+        """Make the screen with the result of a batch change."""
+        logger.debug("call batch result screen.")
+        success_screen = (
+            self._printer(f"Successful changed books: {done}")
+            .bright_green()
+            .build_text()
+        )
+        self._renderer.print(f"{success_screen:^45}")
+        if missing:
+            failed_screen = (
+                self._printer(f"Books not found by IDs: {missing}")
+                .red()
+                .build_text()
+            )
+            self._renderer.print(f"{failed_screen:^45}")
+
     def _generate_status(self) -> tuple:
         """Generate the options for book status update."""
-        return (
-            self._printer("1.в наличии").blue().build_text(),
-            self._printer("2.выдана").blue().build_text(),
-        )
+        return (BLUE("1.в наличии"), BLUE("2.выдана"))
 
     def update_book_screen_status(self, msg_err: str | None = None):
         """Make the screen for updating a book's status."""
@@ -297,7 +394,10 @@ class ConsoleOutput:
                 .underline()
                 .build_text()
             )
-            text_update_menu = self._make_menu_data(self._generate_status())
+            text_update_menu = self._fragment(
+                "statuses",
+                lambda: self._make_menu_data(self._generate_status()),
+            )
 
             msg_except = ""
 
@@ -310,11 +410,11 @@ class ConsoleOutput:
                 else f"{text_update_menu}\n{msg_except}"
             )
 
-            print(f"{screen_instruction:^45}")
-            print(f"{text_update_menu:^45}")
+            self._renderer.print(f"{screen_instruction:^45}")
+            self._renderer.print(f"{text_update_menu:^45}")
 
         _update_book_status()
-        print(self._separator())
+        self._renderer.print(self._separator())
 
     def update_book_successful_screen(self) -> None:
         """Make the screen the delete book successful."""
@@ -324,13 +424,13 @@ class ConsoleOutput:
             .bright_green()
             .build_text()
         )
-        print(f"{success_screen:^45}")
+        self._renderer.print(f"{success_screen:^45}")
 
     def update_book_failed_screen(self, msg: str) -> None:
         """Make the screen the delete book failed."""
         logger.debug("call fail update book status screen")
         failed_screen = self._printer(f"Failed: {msg}").red().build_text()
-        print(f"{failed_screen:^45}")
+        self._renderer.print(f"{failed_screen:^45}")
 
     def back_menu_context_info_helper(self) -> None:
         """Make the screen back menu context."""
@@ -346,13 +446,15 @@ class ConsoleOutput:
             self._printer("3.Find book").underline().build_text(),
             self._printer("4.Select all").underline().build_text(),
             self._printer("5.Update status book").underline().build_text(),
+            self._printer("6.Del books by IDs").underline().build_text(),
+            self._printer("7.Update status books").underline().build_text(),
         )
         points_menu = " ".join(
             self._printer(form).reset().build_text() for form in menu
         )
 
         screen_all_text = f"{instruction}\n{points_menu}"
-        print(screen_all_text)
+        self._renderer.print(screen_all_text)
 
     def back_menu_screen(
         self,
@@ -372,17 +474,36 @@ class ConsoleOutput:
 class ConsoleInput:
     """Class for handling console input operations."""
 
-    def __init__(self, printer: FormatterColorText) -> None:
+    def __init__(
+        self,
+        printer: FormatterColorText,
+        renderer: FrameRenderer | None = None,
+        reader: Callable[[str], str] | None = None,
+    ) -> None:
         """
         Init the ConsoleInput class.
 
         Args:
             printer (FormatterColorText): An object responsible for
             formatting text for console output.
+            renderer (FrameRenderer | None): Frame buffer of the screens,
+            flushed before every prompt.
+            reader (Callable[[str], str] | None): Reads a line after the
+            prompt, defaults to input.
         """
         self._printer = printer
+        self._renderer = renderer
+        self._reader = reader
         self._book_forms = self._make_book_forms()
 
+    def _input(self, prompt: str) -> str:
+        """Show the composed screen and read the input."""
+        if self._renderer is not None:
+            self._renderer.flush()
+        if self._reader is not None:
+            return self._reader(prompt)
+        return input(prompt)
+
     def _make_book_forms(self):
         """
         Create input forms for gathering book data.
@@ -395,9 +516,9 @@ class ConsoleInput:
         title_text = self._printer("Title > ").blue().build_text()
         year_text = self._printer("Year > ").blue().build_text()
 
-        author = partial(input, author_text)
-        title = partial(input, title_text)
-        year = partial(input, year_text)
+        author = partial(self._input, author_text)
+        title = partial(self._input, title_text)
+        year = partial(self._input, year_text)
 
         @dataclass()
         class InputForms:
@@ -417,7 +538,7 @@ class ConsoleInput:
             str: The user-entered menu option.
         """
         input_ = self._printer("> ").blue().build_text()
-        return input(input_)
+        return self._input(input_)
 
     def add_book_input_data(self) -> dict[str, str]:
         """
@@ -443,7 +564,17 @@ class ConsoleInput:
             str: The entered book ID.
         """
         input_ = self._printer("ID: ").blue().build_text()
-        return input(input_)
+        return self._input(input_)
+
+    def book_ids(self) -> str:
+        """
+        Prompts the user to enter a list of book IDs.
+
+        Returns:
+            str: The entered IDs and ranges of IDs.
+        """
+        input_ = self._printer("IDs: ").blue().build_text()
+        return self._input(input_)
 
     def find_book_input_data(self, position_form: int) -> str | None:
         """Give data for finding a book based on the selected form.
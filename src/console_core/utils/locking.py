@@ -0,0 +1,122 @@
+"""Reader/writer lock of a catalog shared by several processes."""
+
+import logging
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import NamedTuple
+
+try:
+    import fcntl
+except ImportError:  # Windows, processes are not synchronized.
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+
+class LockInfo(NamedTuple):
+    """Statistics of the catalog file lock."""
+
+    acquired: int
+    contended: int
+    wait_seconds: float
+
+
+class FileLock:
+    """Shared and exclusive flock of a sidecar lock file.
+
+    Shared holders do not block each other, an exclusive holder blocks
+    everyone. A lock taken while the same lock is held only nests, so
+    callers must serialize their threads themselves and take the
+    exclusive lock first when they are going to write.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Init lock, the file is opened on the first acquire."""
+        self.path = Path(path)
+        self._fd: int | None = None
+        self._exclusive = False
+        self._depth = 0
+        self._acquired = 0
+        self._contended = 0
+        self._wait_seconds = 0.0
+
+    def info(self) -> LockInfo:
+        """Return count of acquires, of waits and the time waited."""
+        return LockInfo(
+            acquired=self._acquired,
+            contended=self._contended,
+            wait_seconds=self._wait_seconds,
+        )
+
+    @contextmanager
+    def shared(self) -> Iterator[None]:
+        """Hold the lock shared with other readers."""
+        with self._hold(exclusive=False):
+            yield
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        """Hold the lock alone.
+
+        Raises:
+            RuntimeError: If the shared lock is already held.
+        """
+        with self._hold(exclusive=True):
+            yield
+
+    @contextmanager
+    def _hold(self, exclusive: bool) -> Iterator[None]:
+        """Acquire the lock unless already held and release it at exit."""
+        if self._depth:
+            if exclusive and not self._exclusive:
+                raise RuntimeError("Shared lock can't be upgraded.")
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+            return
+
+        self._acquire(exclusive)
+        self._exclusive = exclusive
+        self._depth = 1
+        try:
+            yield
+        finally:
+            self._depth = 0
+            self._release()
+
+    def _acquire(self, exclusive: bool) -> None:
+        """Take the flock, measuring the wait if it is held by others."""
+        self._acquired += 1
+        if fcntl is None:
+            return
+        if self._fd is None:
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        operation = fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+        try:
+            fcntl.flock(self._fd, operation | fcntl.LOCK_NB)
+            return
+        except BlockingIOError:
+            pass
+
+        started = time.perf_counter()
+        fcntl.flock(self._fd, operation)
+        waited = time.perf_counter() - started
+        self._contended += 1
+        self._wait_seconds += waited
+        logger.debug(f"Waited {waited:.3f} s for lock of {self.path}.")
+
+    def _release(self) -> None:
+        """Release the flock."""
+        if fcntl is not None and self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        """Close the lock file."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
@@ -0,0 +1,132 @@
+"""Frame-buffered output of console screens."""
+
+import shutil
+import sys
+import time
+from typing import IO, Any, NamedTuple
+
+RENDER_DIFF_ENV = "BOOKS_RENDER_DIFF"
+CLEAR = "\033[H\033[2J\033[3J"
+CLEAR_LINE = "\033[K"
+CLEAR_BELOW = "\033[J"
+# Prompts and echoed input may scroll the terminal, keep a margin.
+INPUT_ROWS = 4
+
+
+def move_to(row: int) -> str:
+    """Return escape moving the cursor to the start of the row."""
+    return f"\033[{row};1H"
+
+
+class FrameStats(NamedTuple):
+    """Statistics of written frames."""
+
+    frames: int
+    bytes_written: int
+    seconds: float
+
+    @property
+    def bytes_per_frame(self) -> float:
+        """Return average size of a frame."""
+        return self.bytes_written / self.frames if self.frames else 0.0
+
+    @property
+    def frames_per_second(self) -> float:
+        """Return count of frames written per second of writing."""
+        return self.frames / self.seconds if self.seconds else 0.0
+
+
+class FrameRenderer:
+    """Collects output of a screen and writes it once per frame.
+
+    clear() starts a new frame, the terminal is erased with ANSI escapes
+    when the frame is flushed, without spawning a shell. With diff only
+    the lines differing from the previous frame are rewritten.
+    """
+
+    def __init__(
+        self,
+        stream: IO[str] | None = None,
+        diff: bool = False,
+        autoflush: bool = False,
+    ):
+        """Init renderer with an empty frame.
+
+        Args:
+            stream: Terminal stream, defaults to the current stdout.
+            diff: Redraw only changed lines of the previous frame.
+            autoflush: Write every print at once, for screens which are
+                not flushed before prompts.
+        """
+        self._stream = stream
+        self._diff = diff
+        self._autoflush = autoflush
+        self._buffer: list[str] = []
+        self._clear = False
+        self._screen: list[str] | None = None
+        self._frames = 0
+        self._bytes = 0
+        self._seconds = 0.0
+
+    def stats(self) -> FrameStats:
+        """Return count of frames, written bytes and time of writing."""
+        return FrameStats(
+            frames=self._frames,
+            bytes_written=self._bytes,
+            seconds=self._seconds,
+        )
+
+    def print(self, *values: Any, sep: str = " ", end: str = "\n") -> None:
+        """Add values to the frame like print does."""
+        self._buffer.append(sep.join(map(str, values)) + end)
+        if self._autoflush:
+            self.flush()
+
+    def clear(self) -> None:
+        """Start a new frame, dropping output the clear would erase."""
+        self._buffer.clear()
+        self._clear = True
+
+    def flush(self) -> None:
+        """Write the frame with one write call."""
+        if not self._buffer and not self._clear:
+            return
+        started = time.perf_counter()
+        text = "".join(self._buffer)
+        self._buffer.clear()
+        if self._clear:
+            frame = self._redraw(text)
+            self._clear = False
+        else:
+            frame = text
+            # Appended after a prompt, the frame is unknown for diffs.
+            self._screen = None
+
+        stream = self._stream or sys.stdout
+        stream.write(frame)
+        stream.flush()
+        self._frames += 1
+        self._bytes += len(frame.encode())
+        self._seconds += time.perf_counter() - started
+
+    def _redraw(self, text: str) -> str:
+        """Return escapes and lines replacing the previous frame."""
+        lines = text.split("\n")
+        previous, self._screen = self._screen, lines
+        rows = shutil.get_terminal_size().lines
+        if (
+            not self._diff
+            or previous is None
+            or lines[-1]
+            or max(len(lines), len(previous)) + INPUT_ROWS > rows
+        ):
+            return CLEAR + text
+
+        # The last line of the previous frame holds the prompt and the
+        # input after it, so it is always rewritten.
+        changed = [
+            f"{move_to(row)}{line}{CLEAR_LINE}"
+            for row, line in enumerate(lines[:-1], 1)
+            if row >= len(previous) or line != previous[row - 1]
+        ]
+        return "".join(changed) + move_to(len(lines)) + CLEAR_BELOW
@@ -0,0 +1,470 @@
+"""Catalog of books split into JSON shards by ID range."""
+
+import bisect
+import heapq
+import json
+import logging
+import math
+import threading
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from operator import itemgetter
+from pathlib import Path
+
+from src.console_core.utils.crud import BookCRUD, _atomic_dump
+from src.console_core.utils.indexes import YearIndex
+from src.console_core.utils.storage import (
+    PAGE_SIZE,
+    BookPage,
+    BookStorage,
+    decode_cursor,
+)
+from src.models.book import Book, InvalidInputBookData
+
+logger = logging.getLogger(__name__)
+
+
+def _search_shard(
+    path: str, first_id: int, stop_id: int, look_for_data: str
+) -> list[dict]:
+    """Scan the shard file for books found by part info.
+
+    Runs in a worker process, so the shard is streamed from the file
+    instead of being loaded into memory of every worker.
+
+    Returns:
+        Found books of the shard range sorted by ID.
+    """
+    if not Path(path).exists():
+        return []
+    shard = BookCRUD(file_path=path, streaming=True)
+    books = [
+        book
+        for book in shard.find_books(look_for_data)
+        if first_id <= book["id"] < stop_id
+    ]
+    books.sort(key=itemgetter("id"))
+    return books
+
+
+class ShardedBookCRUD(BookStorage):
+    """CRUD for books kept in shards of consecutive ID ranges.
+
+    The manifest holds the first ID of every shard and the ID sequence.
+    Every shard is a JSON catalog served by its own BookCRUD, so point
+    operations read and write one shard only. A shard growing over
+    max_shard_bytes is split into equal parts by ID.
+
+    Searches of catalogs over PARALLEL_MIN_BYTES fan out to a pool of
+    search_workers processes, one task per shard.
+    """
+
+    OUT_PATH = Path(__file__).parent.absolute()
+    DIR_PATH = OUT_PATH / "books.shards"
+    MANIFEST_NAME = "manifest.json"
+    PARALLEL_MIN_BYTES = 1 << 25
+
+    def __init__(
+        self,
+        dir_path: str | Path | None = None,
+        max_shard_bytes: int = 1 << 24,
+        search_workers: int = 0,
+    ) -> None:
+        """Read the manifest, creating an empty catalog if missing.
+
+        Args:
+            dir_path: Directory of the shards. Defaults to DIR_PATH.
+            max_shard_bytes: Shard file size that triggers its split.
+            search_workers: Processes searching shards in parallel.
+                Less than two searches in this process only.
+        """
+        if dir_path is not None:
+            self.DIR_PATH = Path(dir_path)
+        self.MANIFEST_PATH = self.DIR_PATH / self.MANIFEST_NAME
+        self._max_shard_bytes = max_shard_bytes
+        self._search_workers = search_workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.RLock()
+        self._shards: dict[int, BookCRUD] = {}
+        self._starts: list[int] = [1]
+        self._next_id = 1
+        self._manifest_stamp: tuple | None = None
+        self.DIR_PATH.mkdir(parents=True, exist_ok=True)
+        if not self.MANIFEST_PATH.exists():
+            self._save_manifest()
+        self._read_manifest()
+
+    def _read_manifest(self) -> None:
+        """Read first IDs of shards and the ID sequence if file changed.
+
+        Raises:
+            ValueError: If the manifest is broken.
+        """
+        stamp = BookCRUD._file_stamp(self.MANIFEST_PATH)
+        if stamp == self._manifest_stamp:
+            return
+        self._manifest_stamp = stamp
+        try:
+            with open(self.MANIFEST_PATH, "r", encoding="utf-8") as file:
+                manifest = json.load(file)
+            self._starts = sorted(manifest["starts"])
+            self._next_id = manifest["next_id"]
+        except (json.JSONDecodeError, KeyError, TypeError):
+            raise ValueError("File brake or incorrect.")
+
+    def _save_manifest(self) -> None:
+        """Save the manifest atomically."""
+        _atomic_dump(
+            self.MANIFEST_PATH,
+            {"next_id": self._next_id, "starts": self._starts},
+            indent=4,
+        )
+        self._manifest_stamp = BookCRUD._file_stamp(self.MANIFEST_PATH)
+
+    def _shard(self, start: int) -> BookCRUD:
+        """Return CRUD of the shard by its first ID."""
+        shard = self._shards.get(start)
+        if shard is None:
+            path = self.DIR_PATH / f"books-{start}.json"
+            shard = self._shards[start] = BookCRUD(file_path=path)
+        return shard
+
+    def _start_of(self, book_id: int) -> int:
+        """Return first ID of the shard holding the book ID."""
+        index = bisect.bisect_right(self._starts, book_id) - 1
+        return self._starts[max(index, 0)]
+
+    def _range(self, start: int) -> range:
+        """Return IDs covered by the shard."""
+        index = bisect.bisect_right(self._starts, start)
+        if index == len(self._starts):
+            return range(start, 2**63)
+        return range(start, self._starts[index])
+
+    def _shard_of(self, book_id: int | str) -> BookCRUD | None:
+        """Return CRUD of the shard holding the book ID."""
+        try:
+            book_id = int(book_id)
+        except ValueError:
+            return None
+        with self._lock:
+            self._read_manifest()
+            return self._shard(self._start_of(book_id))
+
+    def _iter_shards(
+        self, first_id: int = 0
+    ) -> Iterator[tuple[range, BookCRUD]]:
+        """Iterate over ranges and shards, starting with the given ID."""
+        with self._lock:
+            self._read_manifest()
+            shards = [
+                (self._range(start), self._shard(start))
+                for start in self._starts
+                if self._range(start).stop > first_id
+            ]
+        return iter(shards)
+
+    def next_id(self) -> int:
+        """Return the ID the sequence gives next without reserving it."""
+        with self._lock:
+            self._read_manifest()
+            last = self._shard(self._starts[-1])
+            return max(self._next_id, last.next_id())
+
+    def allocate_ids(self, count: int = 1) -> range:
+        """Reserve a range of new book IDs, never reused."""
+        if count < 1:
+            raise ValueError("Count of IDs must be positive.")
+        with self._lock:
+            start = self.next_id()
+            self._next_id = start + count
+            self._save_manifest()
+        return range(start, start + count)
+
+    def insert_books(self, books: Iterable[dict]) -> int:
+        """Insert trusted book records into their shards.
+
+        Every touched shard is written once and split when too big.
+        """
+        count = 0
+        with self._lock:
+            self._read_manifest()
+            by_shard: defaultdict[int, list[dict]] = defaultdict(list)
+            for book in books:
+                by_shard[self._start_of(book["id"])].append(book)
+                count += 1
+            for start, shard_books in by_shard.items():
+                self._shard(start).insert_books(shard_books)
+                self._split_if_big(start)
+        logger.debug(f"Inserted {count} books.")
+        return count
+
+    def _split_if_big(self, start: int) -> None:
+        """Split the shard into equal parts by ID if it is too big.
+
+        The new shards are written before the manifest, and the old
+        shard is cut after it, so a crash leaves at most duplicates
+        which are ignored as out of the shard range.
+        """
+        shard = self._shard(start)
+        size = shard.FILE_PATH.stat().st_size
+        parts = math.ceil(size / self._max_shard_bytes)
+        if parts < 2:
+            return
+
+        books = sorted(
+            self._books_of(start, shard), key=lambda book: book["id"]
+        )
+        part_size = math.ceil(len(books) / parts)
+        chunks = [
+            books[index : index + part_size]  # noqa: E203
+            for index in range(0, len(books), part_size)
+        ]
+        if len(chunks) < 2:
+            return
+        for chunk in chunks[1:]:
+            self._shard(chunk[0]["id"]).replace_books(chunk)
+        self._starts = sorted(
+            {*self._starts, *(chunk[0]["id"] for chunk in chunks[1:])}
+        )
+        self._save_manifest()
+        shard.replace_books(chunks[0])
+        logger.info(f"Shard {start} split into {len(chunks)} shards.")
+
+    def _books_of(self, start: int, shard: BookCRUD) -> Iterator[dict]:
+        """Iterate over books of the shard within its ID range."""
+        ids = self._range(start)
+        return (book for book in shard.iter_books() if book["id"] in ids)
+
+    def add_book_input_data(self, book_data: dict) -> str | None:
+        """Add book input."""
+        try:
+            book = Book(**book_data).to_dict()
+            with self._lock:
+                book["id"] = self.allocate_ids()[0]
+                self.insert_books([book])
+            logger.debug("Books added.")
+        except InvalidInputBookData as e:
+            logger.error(e)
+            return str(e)
+        return None
+
+    def delete_book_by_id(
+        self, book_id: str | int, expected_version: int | None = None
+    ) -> str | None:
+        """Delete book by id."""
+        shard = self._shard_of(book_id)
+        if shard is None:
+            logger.error(f"Book not found by ID {book_id} ")
+            return f"Book not found by ID {book_id} "
+        return shard.delete_book_by_id(book_id, expected_version)
+
+    def update_status_book(
+        self,
+        book_id: str | int,
+        status: str,
+        expected_version: int | None = None,
+    ) -> str | None:
+        """Update book status."""
+        shard = self._shard_of(book_id)
+        if shard is None:
+            logger.error(f"Book not found by ID {book_id}.")
+            return f"Book not found by ID {book_id}."
+        return shard.update_status_book(book_id, status, expected_version)
+
+    def book_version(self, book_id: str | int) -> int | None:
+        """Return version of the book record, None if not found."""
+        shard = self._shard_of(book_id)
+        return None if shard is None else shard.book_version(book_id)
+
+    def delete_books(self, book_ids: Iterable[int]) -> list[int]:
+        """Delete books by IDs with one write per touched shard.
+
+        Returns:
+            IDs of the books which were not found.
+        """
+        return self._change_batch(
+            book_ids, lambda shard, ids: shard.delete_books(ids)
+        )
+
+    def update_status_books(
+        self, book_ids: Iterable[int], status: str
+    ) -> list[int]:
+        """Update status of books with one write per touched shard.
+
+        Returns:
+            IDs of the books which were not found.
+        """
+        return self._change_batch(
+            book_ids, lambda shard, ids: shard.update_status_books(ids, status)
+        )
+
+    def _change_batch(
+        self,
+        book_ids: Iterable[int],
+        change: Callable[[BookCRUD, list[int]], list[int]],
+    ) -> list[int]:
+        """Apply the change to IDs grouped by shard, return missing IDs."""
+        book_ids = list(dict.fromkeys(book_ids))
+        with self._lock:
+            self._read_manifest()
+            by_shard: defaultdict[int, list[int]] = defaultdict(list)
+            for book_id in book_ids:
+                by_shard[self._start_of(book_id)].append(book_id)
+            missing = set(
+                chain.from_iterable(
+                    change(self._shard(start), ids)
+                    for start, ids in by_shard.items()
+                )
+            )
+        return [book_id for book_id in book_ids if book_id in missing]
+
+    def get_book(self, book_id: str | int) -> dict | None:
+        """Return copy of the book record by ID."""
+        shard = self._shard_of(book_id)
+        return None if shard is None else shard.get_book(book_id)
+
+    def iter_books(self) -> Iterator[dict]:
+        """Iterate over book records shard by shard."""
+        return chain.from_iterable(
+            (book for book in shard.iter_books() if book["id"] in ids)
+            for ids, shard in self._iter_shards()
+        )
+
+    def find_books(self, look_for_data: str) -> Iterator[dict]:
+        """Iterate over book records found by part info shard by shard."""
+        shards = list(self._iter_shards())
+        if self._fan_out(shards):
+            return self._parallel_find_books(shards, look_for_data)
+        return chain.from_iterable(
+            (
+                book
+                for book in shard.find_books(look_for_data)
+                if book["id"] in ids
+            )
+            for ids, shard in shards
+        )
+
+    def _fan_out(self, shards: list[tuple[range, BookCRUD]]) -> bool:
+        """Check that the shards are worth searching in parallel.
+
+        Starting worker tasks costs more than a scan of small catalogs,
+        so only catalogs of PARALLEL_MIN_BYTES and more fan out.
+        """
+        if self._search_workers < 2 or len(shards) < 2:
+            return False
+        size = sum(
+            shard.FILE_PATH.stat().st_size
+            for _, shard in shards
+            if shard.FILE_PATH.exists()
+        )
+        return size >= self.PARALLEL_MIN_BYTES
+
+    def _parallel_find_books(
+        self, shards: list[tuple[range, BookCRUD]], look_for_data: str
+    ) -> Iterator[dict]:
+        """Search shards in worker processes, merging books in ID order."""
+        self.flush()
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._search_workers
+                )
+            futures = [
+                self._executor.submit(
+                    _search_shard,
+                    str(shard.FILE_PATH),
+                    ids.start,
+                    ids.stop,
+                    look_for_data,
+                )
+                for ids, shard in shards
+            ]
+        return heapq.merge(
+            *(future.result() for future in futures), key=itemgetter("id")
+        )
+
+    def _year_records(
+        self,
+        start: int,
+        end: int,
+        after: tuple[int, int] | None = None,
+        limit: int | None = None,
+    ) -> list[dict]:
+        """Merge books from start to end year of every shard by year."""
+        found = (
+            [
+                book
+                for book in shard.year_records(start, end, after, limit)
+                if book["id"] in ids
+            ]
+            for ids, shard in self._iter_shards()
+        )
+        books = heapq.merge(*found, key=YearIndex.key)  # type: ignore
+        return list(books) if limit is None else list(islice(books, limit))
+
+    def find_books_by_year_range(
+        self, start: int | str, end: int | str
+    ) -> list[str]:
+        """Find books published from start to end year inclusive.
+
+        Raises:
+            InvalidInputBookData: If a year is not an integer.
+        """
+        books = self._year_records(*self._year_range(start, end))
+        return [self._book_view(book) for book in books]
+
+    def select_all_books(self) -> Iterator[str]:
+        """Select all books."""
+        return map(self._book_view, self.iter_books())
+
+    def page_records(
+        self, after: int | None, limit: int, look_for_data: str | None = None
+    ) -> list[dict]:
+        """Collect a page of books from the shards after the ID."""
+        books: list[dict] = []
+        first_id = 0 if after is None else after + 1
+        for ids, shard in self._iter_shards(first_id):
+            # Books out of the range are copies left by a split and
+            # follow all books of the range in ID order.
+            found = shard.page_records(
+                after, limit - len(books), look_for_data
+            )
+            books.extend(book for book in found if book["id"] in ids)
+            if len(books) >= limit:
+                break
+        return books
+
+    def find_books_by_year_page(
+        self,
+        start: int | str,
+        end: int | str,
+        limit: int = PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> BookPage:
+        """Return one page of books from start to end year by year.
+
+        Raises:
+            InvalidInputBookData: If a year or the cursor is invalid.
+        """
+        after = decode_cursor(cursor, size=2)
+        books = self._year_records(
+            *self._year_range(start, end), after=after, limit=limit + 1
+        )
+        return self._make_page(books, limit, key=YearIndex.key)
+
+    def flush(self) -> None:
+        """Persist pending changes of every opened shard."""
+        with self._lock:
+            for shard in self._shards.values():
+                shard.flush()
+
+    def close(self) -> None:
+        """Persist pending changes and stop the search workers."""
+        self.flush()
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
@@ -0,0 +1,354 @@
+"""SQLite storage of books."""
+
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from src.console_core.utils.crud import BookCRUD
+from src.console_core.utils.indexes import YearIndex
+from src.console_core.utils.storage import (
+    PAGE_SIZE,
+    BookPage,
+    BookStorage,
+    decode_cursor,
+)
+from src.models.book import Book, InvalidInputBookData
+
+logger = logging.getLogger(__name__)
+
+MIN_KEY = -(2**63)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS books (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    author TEXT NOT NULL,
+    year TEXT NOT NULL,
+    status TEXT NOT NULL,
+    title_lower TEXT NOT NULL,
+    author_lower TEXT NOT NULL,
+    year_number INTEGER
+);
+CREATE INDEX IF NOT EXISTS books_title ON books (title_lower);
+CREATE INDEX IF NOT EXISTS books_author ON books (author_lower);
+CREATE INDEX IF NOT EXISTS books_year ON books (year_number, id);
+CREATE TABLE IF NOT EXISTS sequence (
+    name TEXT PRIMARY KEY,
+    next_id INTEGER NOT NULL
+);
+"""
+
+COLUMNS = "id, title, author, year, status"
+MATCH = (
+    "(instr(title_lower, :query) OR instr(author_lower, :query)"
+    " OR instr(year, :query))"
+)
+
+
+class SQLiteBookCRUD(BookStorage):
+    """CRUD for books stored in SQLite database.
+
+    Statements are constant SQL with parameters, so sqlite3 prepares
+    each of them once and reuses it from its statement cache.
+    """
+
+    OUT_PATH = Path(__file__).parent.absolute()
+    DB_PATH = OUT_PATH / "books.db"
+
+    INSERT_SQL = (
+        "INSERT OR REPLACE INTO books (id, title, author, year, status,"
+        " title_lower, author_lower, year_number)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+    )
+    DELETE_SQL = "DELETE FROM books WHERE id = ?"
+    STATUS_SQL = "UPDATE books SET status = ? WHERE id = ?"
+    GET_SQL = f"SELECT {COLUMNS} FROM books WHERE id = ?"
+    ALL_SQL = f"SELECT {COLUMNS} FROM books ORDER BY id"
+    FIND_SQL = f"SELECT {COLUMNS} FROM books WHERE {MATCH} ORDER BY id"
+    YEAR_SQL = (
+        f"SELECT {COLUMNS} FROM books"
+        " WHERE year_number BETWEEN ? AND ? ORDER BY year_number, id"
+    )
+    PAGE_SQL = f"SELECT {COLUMNS} FROM books WHERE id > ? ORDER BY id LIMIT ?"
+    FIND_PAGE_SQL = (
+        f"SELECT {COLUMNS} FROM books WHERE id > :after AND {MATCH}"
+        " ORDER BY id LIMIT :limit"
+    )
+    YEAR_PAGE_SQL = (
+        f"SELECT {COLUMNS} FROM books WHERE year_number BETWEEN ? AND ?"
+        " AND (year_number, id) > (?, ?)"
+        " ORDER BY year_number, id LIMIT ?"
+    )
+    NEXT_ID_SQL = (
+        "SELECT max("
+        "coalesce((SELECT next_id FROM sequence WHERE name = 'books'), 1),"
+        " coalesce((SELECT max(id) FROM books), 0) + 1)"
+    )
+    SAVE_SEQUENCE_SQL = (
+        "INSERT INTO sequence (name, next_id) VALUES ('books', ?)"
+        " ON CONFLICT (name) DO UPDATE SET next_id = excluded.next_id"
+    )
+
+    FETCH_SIZE = 1000
+    CACHE_KIB = 1 << 16
+
+    def __init__(self, db_path: str | Path | None = None) -> None:
+        """Open the database in WAL mode and create the schema.
+
+        Args:
+            db_path: Path to the database file. Defaults to DB_PATH.
+        """
+        self.DB_PATH = Path(db_path) if db_path is not None else self.DB_PATH
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(
+            self.DB_PATH, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(f"PRAGMA cache_size=-{self.CACHE_KIB}")
+        self._connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in one write transaction."""
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._connection
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    @staticmethod
+    def _row(book: dict) -> tuple:
+        """Return INSERT parameters of the book record."""
+        key = YearIndex.key(book)
+        return (
+            book["id"],
+            book["title"],
+            book["author"],
+            book["year"],
+            book["status"],
+            book["title"].lower(),
+            book["author"].lower(),
+            None if key is None else key[0],
+        )
+
+    @staticmethod
+    def _book(row: tuple) -> dict:
+        """Return book record of the selected row."""
+        return dict(zip(("id", "title", "author", "year", "status"), row))
+
+    def _select(self, sql: str, parameters: tuple | dict) -> Iterator[dict]:
+        """Stream selected books fetched by chunks."""
+        with self._lock:
+            cursor = self._connection.execute(sql, parameters)
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(self.FETCH_SIZE)
+            if not rows:
+                return
+            yield from map(self._book, rows)
+
+    def insert_books(self, books: Iterable[dict]) -> int:
+        """Insert book records in one transaction.
+
+        Records are trusted and keep their IDs, the sequence is moved
+        past the highest of them.
+        """
+        with self._transaction() as connection:
+            cursor = connection.executemany(
+                self.INSERT_SQL, map(self._row, books)
+            )
+            next_id = connection.execute(self.NEXT_ID_SQL).fetchone()[0]
+            connection.execute(self.SAVE_SEQUENCE_SQL, (next_id,))
+        logger.debug(f"Inserted {cursor.rowcount} books.")
+        return cursor.rowcount
+
+    def next_id(self) -> int:
+        """Return the ID the sequence gives next without reserving it."""
+        with self._lock:
+            return self._connection.execute(self.NEXT_ID_SQL).fetchone()[0]
+
+    def allocate_ids(self, count: int = 1) -> range:
+        """Reserve a range of new book IDs, never reused."""
+        if count < 1:
+            raise ValueError("Count of IDs must be positive.")
+        with self._transaction() as connection:
+            start = connection.execute(self.NEXT_ID_SQL).fetchone()[0]
+            connection.execute(self.SAVE_SEQUENCE_SQL, (start + count,))
+        return range(start, start + count)
+
+    def add_book_input_data(self, book_data: dict) -> str | None:
+        """Add book input."""
+        try:
+            book = Book(**book_data).to_dict()
+            with self._transaction() as connection:
+                book["id"] = connection.execute(self.NEXT_ID_SQL).fetchone()[0]
+                connection.execute(self.SAVE_SEQUENCE_SQL, (book["id"] + 1,))
+                connection.execute(self.INSERT_SQL, self._row(book))
+            logger.debug("Books added.")
+        except InvalidInputBookData as e:
+            logger.error(e)
+            return str(e)
+        return None
+
+    def delete_book_by_id(
+        self, book_id: str | int, expected_version: int | None = None
+    ) -> str | None:
+        """Delete book by id."""
+        self._refuse_version(expected_version)
+        try:
+            with self._transaction() as connection:
+                deleted = connection.execute(self.DELETE_SQL, (book_id,))
+            if not deleted.rowcount:
+                logger.debug("Books not deleted.")
+                raise InvalidInputBookData(f"Book not found by ID {book_id} ")
+        except InvalidInputBookData as e:
+            logger.error(e)
+            return str(e)
+        return None
+
+    def update_status_book(
+        self,
+        book_id: str | int,
+        status: str,
+        expected_version: int | None = None,
+    ) -> str | None:
+        """Update book status."""
+        self._refuse_version(expected_version)
+        try:
+            with self._transaction() as connection:
+                updated = connection.execute(
+                    self.STATUS_SQL, (status, book_id)
+                )
+            if not updated.rowcount:
+                raise InvalidInputBookData(f"Book not found by ID {book_id}.")
+            logger.debug("Book updated status.")
+        except InvalidInputBookData as e:
+            logger.error(e)
+            return str(e)
+        return None
+
+    def delete_books(self, book_ids: Iterable[int]) -> list[int]:
+        """Delete books by IDs in one transaction.
+
+        Returns:
+            IDs of the books which were not found.
+        """
+        return self._execute_batch(
+            self.DELETE_SQL, ((book_id,) for book_id in book_ids)
+        )
+
+    def update_status_books(
+        self, book_ids: Iterable[int], status: str
+    ) -> list[int]:
+        """Update status of books by IDs in one transaction.
+
+        Returns:
+            IDs of the books which were not found.
+        """
+        return self._execute_batch(
+            self.STATUS_SQL, ((status, book_id) for book_id in book_ids)
+        )
+
+    def _execute_batch(
+        self, sql: str, parameters: Iterable[tuple]
+    ) -> list[int]:
+        """Run the statement for every book, return missing book IDs."""
+        missing = []
+        with self._transaction() as connection:
+            for row in dict.fromkeys(parameters):
+                if not connection.execute(sql, row).rowcount:
+                    missing.append(row[-1])
+        logger.debug(f"Batch committed, {len(missing)} books not found.")
+        return missing
+
+    def get_book(self, book_id: str | int) -> dict | None:
+        """Return copy of the book record by ID."""
+        with self._lock:
+            row = self._connection.execute(self.GET_SQL, (book_id,)).fetchone()
+        return None if row is None else self._book(row)
+
+    def iter_books(self) -> Iterator[dict]:
+        """Iterate over book records by ID."""
+        return self._select(self.ALL_SQL, ())
+
+    def find_books(self, look_for_data: str) -> Iterator[dict]:
+        """Iterate over book records found by part info."""
+        return self._select(self.FIND_SQL, {"query": look_for_data.lower()})
+
+    def find_books_by_year_range(
+        self, start: int | str, end: int | str
+    ) -> list[str]:
+        """Find books published from start to end year inclusive.
+
+        Raises:
+            InvalidInputBookData: If a year is not an integer.
+        """
+        books = self._select(self.YEAR_SQL, self._year_range(start, end))
+        return [self._book_view(book) for book in books]
+
+    def select_all_books(self) -> Iterator[str]:
+        """Select all books."""
+        return map(self._book_view, self.iter_books())
+
+    def page_records(
+        self, after: int | None, limit: int, look_for_data: str | None = None
+    ) -> list[dict]:
+        """Select a page of books after the ID with the primary key."""
+        after = MIN_KEY if after is None else after
+        if look_for_data is None:
+            return list(self._select(self.PAGE_SQL, (after, limit)))
+        parameters = {
+            "after": after,
+            "query": look_for_data.lower(),
+            "limit": limit,
+        }
+        return list(self._select(self.FIND_PAGE_SQL, parameters))
+
+    def find_books_by_year_page(
+        self,
+        start: int | str,
+        end: int | str,
+        limit: int = PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> BookPage:
+        """Return one page of books from start to end year by year.
+
+        Raises:
+            InvalidInputBookData: If a year or the cursor is invalid.
+        """
+        after = decode_cursor(cursor, size=2) or (MIN_KEY, MIN_KEY)
+        parameters = (*self._year_range(start, end), *after, limit + 1)
+        books = list(self._select(self.YEAR_PAGE_SQL, parameters))
+        return self._make_page(books, limit, key=YearIndex.key)
+
+
+def migrate_json_to_sqlite(
+    json_path: str | Path | None = None, db_path: str | Path | None = None
+) -> int:
+    """Copy books and the ID sequence of the JSON catalog to SQLite.
+
+    The catalog is streamed, so it is never loaded into memory whole.
+    """
+    source = BookCRUD(file_path=json_path, streaming=True)
+    target = SQLiteBookCRUD(db_path=db_path)
+    try:
+        count = target.insert_books(source.iter_books())
+        next_id = max(source.next_id(), target.next_id())
+        with target._transaction() as connection:
+            connection.execute(target.SAVE_SEQUENCE_SQL, (next_id,))
+    finally:
+        target.close()
+    logger.info(f"Migrated {count} books to {target.DB_PATH}.")
+    return count
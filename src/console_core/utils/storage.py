@@ -0,0 +1,246 @@
+"""Common interface of the books storages."""
+
+import abc
+import base64
+import json
+import zlib
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, NamedTuple
+
+from src.models.book import Book, InvalidInputBookData, ValidYear
+
+PAGE_SIZE = 20
+
+
+class BookPage(NamedTuple):
+    """One page of formatted books and the cursor of the next one."""
+
+    items: list[str]
+    next_cursor: str | None
+
+
+def encode_cursor(key: Any) -> str:
+    """Return opaque page cursor holding the last key of the page."""
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+
+def decode_cursor(cursor: str | None, size: int = 1) -> Any:
+    """Return the key stored in the page cursor.
+
+    Raises:
+        InvalidInputBookData: If the cursor is broken.
+    """
+    if cursor is None:
+        return None
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, UnicodeError):
+        raise InvalidInputBookData("Invalid page cursor.")
+
+    keys = [key] if size == 1 else key
+    if not isinstance(keys, list) or len(keys) != size:
+        raise InvalidInputBookData("Invalid page cursor.")
+    if not all(type(item) is int for item in keys):
+        raise InvalidInputBookData("Invalid page cursor.")
+    return key if size == 1 else tuple(key)
+
+
+def record_version(book: dict) -> int:
+    """Return version of the book record.
+
+    The version is a checksum of the record, so any change of the book
+    changes it and no counters have to be stored with the records.
+    """
+    record = json.dumps(book, ensure_ascii=False, sort_keys=True)
+    return zlib.crc32(record.encode())
+
+
+class VersionConflictError(Exception):
+    """Book record was changed after its version was read."""
+
+
+class BookStorage(abc.ABC):
+    """Operations every books storage provides to the console."""
+
+    @abc.abstractmethod
+    def add_book_input_data(self, book_data: dict) -> str | None:
+        """Add book, return error message on failure."""
+
+    @abc.abstractmethod
+    def delete_book_by_id(
+        self, book_id: str | int, expected_version: int | None = None
+    ) -> str | None:
+        """Delete book by id, return error message on failure.
+
+        Raises:
+            VersionConflictError: If the book has not the expected version.
+        """
+
+    @abc.abstractmethod
+    def update_status_book(
+        self,
+        book_id: str | int,
+        status: str,
+        expected_version: int | None = None,
+    ) -> str | None:
+        """Update book status, return error message on failure.
+
+        Raises:
+            VersionConflictError: If the book has not the expected version.
+        """
+
+    @abc.abstractmethod
+    def delete_books(self, book_ids: Iterable[int]) -> list[int]:
+        """Delete books by IDs in one commit, return missing IDs."""
+
+    @abc.abstractmethod
+    def update_status_books(
+        self, book_ids: Iterable[int], status: str
+    ) -> list[int]:
+        """Update status of books in one commit, return missing IDs."""
+
+    @abc.abstractmethod
+    def get_book(self, book_id: str | int) -> dict | None:
+        """Return copy of the book record by ID."""
+
+    @abc.abstractmethod
+    def iter_books(self) -> Iterator[dict]:
+        """Iterate over book records in storage order."""
+
+    @abc.abstractmethod
+    def insert_books(self, books: Iterable[dict]) -> int:
+        """Insert trusted book records keeping their IDs in one commit."""
+
+    @abc.abstractmethod
+    def allocate_ids(self, count: int = 1) -> range:
+        """Reserve a range of new book IDs, never reused."""
+
+    @abc.abstractmethod
+    def next_id(self) -> int:
+        """Return the ID the sequence gives next without reserving it."""
+
+    @abc.abstractmethod
+    def find_books(self, look_for_data: str) -> Iterator[dict]:
+        """Iterate over book records matching part of title, author, year."""
+
+    @abc.abstractmethod
+    def find_books_by_year_range(
+        self, start: int | str, end: int | str
+    ) -> list[str]:
+        """Find books published from start to end year inclusive."""
+
+    @abc.abstractmethod
+    def select_all_books(self) -> Iterator[str]:
+        """Select all books."""
+
+    @abc.abstractmethod
+    def page_records(
+        self,
+        after: int | None,
+        limit: int,
+        look_for_data: str | None = None,
+    ) -> list[dict]:
+        """Return copies of up to limit book records after the ID by ID.
+
+        Args:
+            after: Return only books with greater ID, None from the first.
+            limit: Max count of books.
+            look_for_data: Return only books found by this part info.
+        """
+
+    def list_books_page(
+        self, limit: int = PAGE_SIZE, cursor: str | None = None
+    ) -> BookPage:
+        """Return one page of books ordered by ID.
+
+        Raises:
+            InvalidInputBookData: If the cursor is broken.
+        """
+        books = self.page_records(decode_cursor(cursor), limit + 1)
+        return self._make_page(books, limit, key=lambda book: book["id"])
+
+    def find_books_page(
+        self,
+        look_for_data: str,
+        limit: int = PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> BookPage:
+        """Return one page of books found by part info ordered by ID.
+
+        Raises:
+            InvalidInputBookData: If the cursor is broken.
+        """
+        books = self.page_records(
+            decode_cursor(cursor), limit + 1, look_for_data
+        )
+        return self._make_page(books, limit, key=lambda book: book["id"])
+
+    @abc.abstractmethod
+    def find_books_by_year_page(
+        self,
+        start: int | str,
+        end: int | str,
+        limit: int = PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> BookPage:
+        """Return one page of books from start to end year by year."""
+
+    def book_version(self, book_id: str | int) -> int | None:
+        """Return version of the book record.
+
+        Returns:
+            None if the book is not found or the storage keeps no
+            record versions.
+        """
+        return None
+
+    @staticmethod
+    def _refuse_version(expected_version: int | None) -> None:
+        """Refuse the expected version in storages keeping no versions.
+
+        Raises:
+            ValueError: If an expected version is given.
+        """
+        if expected_version is not None:
+            raise ValueError("Storage keeps no record versions.")
+
+    def flush(self) -> None:
+        """Persist pending changes, storages saving at once do nothing."""
+
+    def close(self) -> None:
+        """Persist pending changes and release the storage."""
+        self.flush()
+
+    def find_book_by_part_info(self, look_for_data: str) -> Iterator[str]:
+        """Find book by part of title, author or year."""
+        return map(self._book_view, self.find_books(look_for_data))
+
+    def find_books_by_year(self, year: int | str) -> list[str]:
+        """Find books published in the year."""
+        return self.find_books_by_year_range(start=year, end=year)
+
+    # Display string of the stored book record, formatted straight from
+    # the record with the Book template and no Book construction.
+    _book_view = staticmethod(Book.TEMPLATE.format_map)
+
+    @staticmethod
+    def _year_range(start: int | str, end: int | str) -> tuple[int, int]:
+        """Return range of years as integers.
+
+        Raises:
+            InvalidInputBookData: If a year is not an integer.
+        """
+        try:
+            return int(start), int(end)
+        except ValueError:
+            raise InvalidInputBookData(ValidYear.INCORRECT_VALUE_MSG)
+
+    def _make_page(
+        self, books: list[dict], limit: int, key: Callable[[dict], Any]
+    ) -> BookPage:
+        """Format page of books fetched with one extra look-ahead book."""
+        items = [self._book_view(book) for book in books[:limit]]
+        next_cursor = None
+        if len(books) > limit:
+            next_cursor = encode_cursor(key(books[limit - 1]))
+        return BookPage(items=items, next_cursor=next_cursor)
@@ -0,0 +1,191 @@
+"""Streaming reader of the JSON catalog."""
+
+import json
+import logging
+import textwrap
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import IO, Any
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1 << 16
+WHITESPACE = " \t\r\n"
+SCALARS = (str, int, float, bool, type(None))
+
+# C encoder of flat records, the item separator carries the indent.
+_encode_fields = json.JSONEncoder(
+    ensure_ascii=False, separators=(",\n        ", ": ")
+).encode
+
+
+class _ChunkReader:
+    """Window over a text file read by chunks."""
+
+    def __init__(self, file: IO[str], chunk_size: int) -> None:
+        """Init reader with an empty window."""
+        self._file = file
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+
+    def _read(self) -> bool:
+        """Drop the consumed part and read one more chunk."""
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            return False
+        self._buffer = self._buffer[self._position :] + chunk  # noqa: E203
+        self._position = 0
+        return True
+
+    def peek(self) -> str:
+        """Return next non-whitespace character, empty string at EOF."""
+        while True:
+            while (
+                self._position < len(self._buffer)
+                and self._buffer[self._position] in WHITESPACE
+            ):
+                self._position += 1
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._read():
+                return ""
+
+    def skip(self) -> None:
+        """Consume the character returned by peek."""
+        self._position += 1
+
+    def decode(self) -> Any:
+        """Decode next JSON value, reading chunks until it is complete."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(
+                    self._buffer, self._position
+                )
+            except json.JSONDecodeError:
+                if not self._read():
+                    raise
+                continue
+            if end == len(self._buffer) and self._read():
+                continue
+            self._position = end
+            return value
+
+
+def iter_json_array(
+    source: Path | IO[str], chunk_size: int = CHUNK_SIZE
+) -> Iterator:
+    """Yield items of a JSON array file one at a time.
+
+    Only the current chunk and the item being decoded are kept in
+    memory. A missing file is an empty array.
+
+    Args:
+        source: Path of the file, or the file opened for reading which
+            is closed once the items are read.
+        chunk_size: Count of characters read at once.
+
+    Raises:
+        ValueError: If the file is not a JSON array.
+    """
+    file: IO[str]
+    if isinstance(source, Path):
+        try:
+            file = open(source, "r", encoding="utf-8")
+        except FileNotFoundError:
+            logger.error(f"File {source} not found.")
+            return
+    else:
+        file = source
+
+    with file:
+        reader = _ChunkReader(file, chunk_size)
+        try:
+            if reader.peek() != "[":
+                raise ValueError("File brake or incorrect.")
+            reader.skip()
+            if reader.peek() == "]":
+                reader.skip()
+            else:
+                while True:
+                    yield reader.decode()
+                    separator = reader.peek()
+                    reader.skip()
+                    if separator == "]":
+                        break
+                    if separator != ",":
+                        raise ValueError("File brake or incorrect.")
+            if reader.peek():
+                raise ValueError("File brake or incorrect.")
+        except json.JSONDecodeError:
+            logger.error("Invalid JSON file.")
+            raise ValueError("File brake or incorrect.")
+
+
+def apply_operations(
+    books: Iterable[dict], operations: Iterable[dict]
+) -> Iterator[dict]:
+    """Yield books with journaled mutations applied on the fly.
+
+    Mutations are folded into per-ID changes first, so memory is
+    bounded by the journal and not by the catalog.
+    """
+    replaced: dict[int, dict | None] = {}
+    statuses: dict[int, str] = {}
+    for operation in operations:
+        match operation["op"]:
+            case "add":
+                replaced[operation["book"]["id"]] = dict(operation["book"])
+                statuses.pop(operation["book"]["id"], None)
+            case "delete":
+                replaced[operation["id"]] = None
+                statuses.pop(operation["id"], None)
+            case "status":
+                book = replaced.get(operation["id"])
+                if book is not None:
+                    book["status"] = operation["status"]
+                elif operation["id"] not in replaced:
+                    statuses[operation["id"]] = operation["status"]
+            case _:
+                raise ValueError(
+                    f"Unknown journal operation {operation['op']}"
+                )
+
+    for book in books:
+        if book["id"] in replaced:
+            book = replaced.pop(book["id"])
+            if book is None:
+                continue
+        elif book["id"] in statuses:
+            book["status"] = statuses[book["id"]]
+        yield book
+
+    yield from (book for book in replaced.values() if book is not None)
+
+
+def _format_item(item: Any) -> str:
+    """Return the array item formatted like json.dumps(indent=4).
+
+    json.dumps formats with indent by the pure Python encoder, so flat
+    records like books are formatted by the C one instead.
+    """
+    if (
+        isinstance(item, dict)
+        and item
+        and all(isinstance(value, SCALARS) for value in item.values())
+    ):
+        return "    {\n        " + _encode_fields(item)[1:-1] + "\n    }"
+    text = json.dumps(item, ensure_ascii=False, indent=4)
+    return textwrap.indent(text, "    ")
+
+
+def write_json_array(file: IO[str], items: Iterable[Any]) -> None:
+    """Write items as JSON array formatted like json.dump(indent=4)."""
+    separator = "[\n"
+    for item in items:
+        file.write(separator)
+        file.write(_format_item(item))
+        separator = ",\n"
+    file.write("[]" if separator == "[\n" else "\n]")
@@ -23,9 +23,15 @@ class ValidString(abc.ABC):
     INCORRECT_VALUE_MSG: str
     INCORRECT_LENGTH_MSG: str
 
+    def __set_name__(self, owner, name: str) -> None:
+        """Keep the value in the "_<name>" slot of every instance."""
+        self.storage_name = f"_{name}"
+
     def __get__(self, instance, owner) -> str:
-        """Return instance."""
-        return self.value
+        """Return value of the instance."""
+        if instance is None:
+            return self  # type: ignore
+        return getattr(instance, self.storage_name)
 
     def __set__(self, instance, value: str) -> None:
         """Validate common string."""
@@ -36,7 +42,7 @@ class ValidString(abc.ABC):
         if len(value) < self.MIN_LENGTH or len(value) > self.MAX_LENGTH:
             raise InvalidInputBookData(self.INCORRECT_LENGTH_MSG)
 
-        self.value = value
+        setattr(instance, self.storage_name, value)
 
 
 class ValidTitle(ValidString):
@@ -71,9 +77,15 @@ class ValidYear:
     INCORRECT_VALUE_MSG = "Year can't be integers."
     INCORRECT_YEAR_FUTURE_MSG = "Cannot exceed current year."
 
+    def __set_name__(self, owner, name: str) -> None:
+        """Keep the value in the "_<name>" slot of every instance."""
+        self.storage_name = f"_{name}"
+
     def __get__(self, instance, owner) -> str:
-        """Return year."""
-        return self.value
+        """Return year of the instance."""
+        if instance is None:
+            return self  # type: ignore
+        return getattr(instance, self.storage_name)
 
     def __set__(self, instance, value: int | str) -> None:
         """Validate year."""
@@ -87,15 +99,24 @@ class ValidYear:
             logger.debug(self.INCORRECT_YEAR_FUTURE_MSG)
             raise InvalidInputBookData(self.INCORRECT_YEAR_FUTURE_MSG)
 
-        value = str(value)
-
-        self.value = value
+        setattr(instance, self.storage_name, str(value))
 
 
 class Book:
-    """Book model."""
+    """Book model.
+
+    Validated fields are kept in slots of the instance, so books carry
+    no __dict__ and do not share values through the descriptors.
+    """
+
+    __slots__ = ("_title", "_author", "_year", "status", "_id")
+
+    _title: str
+    _author: str
+    _year: str
 
     DEFAULT_STATUS = "в наличии."
+    TEMPLATE = "{id} {title} {author} {year} {status}"
 
     title = ValidTitle()
     author = ValidAuthor()
@@ -118,10 +139,7 @@ class Book:
 
     def __str__(self):
         """Return book info."""
-        return (
-            f"{self._id} {self.title} {self.author}"
-            f" {self.year} {self.status}"
-        )
+        return self.TEMPLATE.format_map(self.to_dict())
 
     def __repr__(self):
         """Return book info."""
@@ -0,0 +1,65 @@
+# type: ignore
+"""Common fixtures."""
+
+import shutil
+
+import pytest
+
+from src.console_core.utils.backends import PATH_ENV, STORAGE_ENV
+from src.console_core.utils.binary_crud import (
+    BinaryBookCRUD,
+    convert_json_to_binary,
+)
+from src.console_core.utils.crud import BookCRUD
+from src.console_core.utils.sharded_crud import ShardedBookCRUD
+from src.console_core.utils.sqlite_crud import SQLiteBookCRUD
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_catalog(tmp_path_factory):
+    """Run the whole session against a copy of the shipped catalog."""
+    catalog = tmp_path_factory.mktemp("catalog") / "books.json"
+    shutil.copy(BookCRUD.FILE_PATH, catalog)
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(BookCRUD, "FILE_PATH", catalog)
+        patch.setattr(SQLiteBookCRUD, "DB_PATH", catalog.with_suffix(".db"))
+        patch.setattr(BinaryBookCRUD, "FILE_PATH", catalog.with_suffix(".bin"))
+        patch.setattr(
+            ShardedBookCRUD, "DIR_PATH", catalog.with_suffix(".shards")
+        )
+        patch.delenv(STORAGE_ENV, raising=False)
+        patch.delenv(PATH_ENV, raising=False)
+        yield catalog
+
+
+@pytest.fixture()
+def catalog_path(tmp_path):
+    """Return path to a fresh catalog with three books."""
+    path = tmp_path / "books.json"
+    shutil.copy(BookCRUD.OUT_PATH / "books.json", path)
+    return path
+
+
+@pytest.fixture()
+def crud(catalog_path):
+    """Return CRUD working with a fresh catalog."""
+    return BookCRUD(file_path=catalog_path)
+
+
+@pytest.fixture()
+def sqlite_crud(tmp_path, catalog_path):
+    """Return SQLite CRUD holding the books of a fresh catalog."""
+    storage = SQLiteBookCRUD(db_path=tmp_path / "books.db")
+    storage.insert_books(BookCRUD(file_path=catalog_path).iter_books())
+    yield storage
+    storage.close()
+
+
+@pytest.fixture()
+def binary_crud(tmp_path, catalog_path):
+    """Return binary catalog CRUD holding the books of a fresh catalog."""
+    path = tmp_path / "books.bin"
+    convert_json_to_binary(catalog_path, path)
+    storage = BinaryBookCRUD(file_path=path)
+    yield storage
+    storage.close()
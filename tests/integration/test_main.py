@@ -54,6 +54,11 @@ def test_main_with_input(monkeypatch) -> None:
             ["4", "0"],
             0,
         ),  # Сценарий отображения всех книг
+        (
+            "main_menu_and_select_all_pages_and_exit",
+            ["4", "n", "p", "p", "0"],
+            0,
+        ),  # Сценарий листания страниц всех книг
         (
             "main_menu_add_new_book_and_exit",
             ["1", "Иисус-младенец", "Есенин", "1918", "0"],
@@ -89,6 +94,16 @@ def test_main_with_input(monkeypatch) -> None:
             ["3", "4", "3", "1918", "9", "0"],
             0,
         ),  # Сценарий поиск книг по дате выпуска с ошибкой выбора
+        (
+            "main_menu_&&_find_book_by_year_range_&&_and_exit",
+            ["3", "3", "1900-2000", "9", "0"],
+            0,
+        ),  # Сценарий поиск книг по диапазону лет выпуска
+        (
+            "main_menu_&&_find_book_by_invalid_year_&&_and_exit",
+            ["3", "3", "nineteen", "9", "0"],
+            0,
+        ),  # Сценарий поиск книг по некорректному году
         (
             "main_menu_&&_new_status_book_by_id_&&_and_exit",
             ["5", "4", "1", "9", "0"],
@@ -129,6 +144,16 @@ def test_main_with_input(monkeypatch) -> None:
             ["2", "invalid", "9", "0"],
             0,
         ),  # Сценарий удаления книги по ID c ошибкой
+        (
+            "main_menu_&&_new_status_books_by_ids_&&_and_exit",
+            ["7", "1-2,9", "3", "2", "9", "0"],
+            0,
+        ),  # Сценарий изменения статуса книг по списку ID
+        (
+            "main_menu_&&_del_books_by_ids_err_&&_and_exit",
+            ["6", "1-", "7,8", "9", "0"],
+            0,
+        ),  # Сценарий удаления книг по списку ID c ошибкой
     ],
 )
 def test_main_with_input_and_match(
@@ -157,6 +182,8 @@ def test_main_with_input_and_match(
                 main()
             case "main_menu_and_select_all_and_exit":
                 main()
+            case "main_menu_and_select_all_pages_and_exit":
+                main()
             case "main_menu_add_new_book_and_exit":
                 main()
             case "main_menu_add_new_book_invalid_title_and_exit":
@@ -173,6 +200,10 @@ def test_main_with_input_and_match(
                 main()
             case "main_menu_&&_find_book_by_year_and_err_&&_and_exit":
                 main()
+            case "main_menu_&&_find_book_by_year_range_&&_and_exit":
+                main()
+            case "main_menu_&&_find_book_by_invalid_year_&&_and_exit":
+                main()
             case "main_menu_&&_find_book_by_title_with_error_&&_and_exit":
                 main()
             case "main_menu_&&_new_status_book_by_id_&&_and_exit":
@@ -189,6 +220,10 @@ def test_main_with_input_and_match(
                 main()
             case "main_menu_&&_del_book_by_id_err_&&_and_exit":
                 main()
+            case "main_menu_&&_new_status_books_by_ids_&&_and_exit":
+                main()
+            case "main_menu_&&_del_books_by_ids_err_&&_and_exit":
+                main()
             case _:
                 pytest.fail(f"Unknown script.: {script}")
 
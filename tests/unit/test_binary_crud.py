@@ -0,0 +1,139 @@
+# type: ignore
+"""Test binary catalog books CRUD."""
+
+import json
+from functools import partial
+
+import pytest
+
+from src.console_core.commands import main
+from src.console_core.utils.binary_catalog import STATUS_SLOTS
+from src.console_core.utils.binary_crud import BinaryBookCRUD
+from src.console_core.utils.crud import BookCRUD
+
+
+def read_pages(fetch) -> list[str]:
+    """Return books of all pages following cursors."""
+    books, cursor = [], None
+    while True:
+        page = fetch(cursor=cursor)
+        books.extend(page.items)
+        if page.next_cursor is None:
+            return books
+        cursor = page.next_cursor
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_binary_same_results_as_json(crud, binary_crud) -> None:
+    """Positive test binary storage answers like JSON storage."""
+    for storage in (crud, binary_crud):
+        assert (
+            storage.add_book_input_data(
+                {"author": "Esenin", "title": "Poems", "year": "1918"}
+            )
+            is None
+        )
+        assert (
+            storage.update_status_book(book_id=1, status="в наличии") is None
+        )
+        assert storage.delete_book_by_id(2) is None
+        assert storage.update_status_books([3, 9], "выдана") == [9]
+        assert storage.delete_book_by_id(2) == "Book not found by ID 2 "
+
+    assert list(binary_crud.iter_books()) == list(crud.iter_books())
+    assert binary_crud.get_book(4) == crud.get_book(4)
+    assert list(binary_crud.find_book_by_part_info("1999")) == list(
+        crud.find_book_by_part_info("1999")
+    )
+    assert read_pages(partial(binary_crud.list_books_page, 1)) == list(
+        crud.select_all_books()
+    )
+    assert read_pages(
+        partial(binary_crud.find_books_by_year_page, 0, 3000, 1)
+    ) == crud.find_books_by_year_range(0, 3000)
+    assert binary_crud.next_id() == crud.next_id() == 5
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_binary_status_is_single_byte_write(binary_crud) -> None:
+    """Positive test status update changes one byte of the file."""
+    binary_crud.update_status_book(1, "в наличии.")
+    before = binary_crud.FILE_PATH.read_bytes()
+
+    assert binary_crud.update_status_book(2, "в наличии.") is None
+
+    after = binary_crud.FILE_PATH.read_bytes()
+    assert len(after) == len(before)
+    assert sum(old != new for old, new in zip(before, after)) == 1
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_binary_remaps_replaced_file(binary_crud, tmp_path) -> None:
+    """Positive test catalog rewritten by another process is re-read."""
+    other = BinaryBookCRUD(file_path=binary_crud.FILE_PATH)
+    other.add_book_input_data(
+        {"author": "Esenin", "title": "Poems", "year": "1918"}
+    )
+    other.close()
+
+    assert binary_crud.get_book(4)["title"] == "Poems"
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_binary_status_table_is_limited(binary_crud) -> None:
+    """Negative test too many distinct statuses are refused."""
+    for number in range(STATUS_SLOTS - 1):
+        binary_crud.update_status_book(1, f"status {number}")
+
+    with pytest.raises(ValueError):
+        binary_crud.update_status_book(1, "one more status")
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_convert_command_round_trip(crud, catalog_path, tmp_path) -> None:
+    """Positive test catalog converted to binary and back is the same."""
+    crud.allocate_ids(5)
+    binary_path = tmp_path / "books.bin"
+    json_path = tmp_path / "copy.json"
+
+    assert (
+        main(
+            [
+                "convert",
+                "binary",
+                "--source",
+                str(catalog_path),
+                "--target",
+                str(binary_path),
+            ]
+        )
+        == 0
+    )
+    assert (
+        main(
+            [
+                "convert",
+                "json",
+                "--source",
+                str(binary_path),
+                "--target",
+                str(json_path),
+            ]
+        )
+        == 0
+    )
+
+    assert json.loads(json_path.read_text(encoding="utf-8")) == json.loads(
+        catalog_path.read_text(encoding="utf-8")
+    )
+    assert BookCRUD(file_path=json_path).next_id() == 9
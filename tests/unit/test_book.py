@@ -147,3 +147,24 @@ def test_book_from_dict() -> None:
     """Positive test from_dict method."""
     book = Book(author="Author", title="Title", year="1990")
     assert len(book.to_dict()) != 0
+
+
+@pytest.mark.all
+@pytest.mark.book
+@pytest.mark.unit
+def test_books_keep_own_values() -> None:
+    """Positive test a new book does not overwrite older books."""
+    first = Book(author="Author", title="Title", year="1990")
+    second = Book(author="Writer", title="Novel", year=2000)
+
+    assert (first.author, first.title, first.year) == (
+        "Author",
+        "Title",
+        "1990",
+    )
+    assert (second.author, second.title, second.year) == (
+        "Writer",
+        "Novel",
+        "2000",
+    )
+    assert not hasattr(first, "__dict__")
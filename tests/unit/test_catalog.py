@@ -0,0 +1,122 @@
+# type: ignore
+"""Test in-memory catalog."""
+
+import pytest
+
+from src.console_core.utils.catalog import BookCatalog
+
+
+def make_books(count: int) -> list[dict]:
+    """Return count of book records."""
+    return [
+        {
+            "id": book_id,
+            "title": f"Title {book_id}",
+            "author": "Author",
+            "year": "1990",
+            "status": "в наличии",
+        }
+        for book_id in range(1, count + 1)
+    ]
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_catalog_index_lookup_and_delete() -> None:
+    """Positive test lookups and deletes by ID use the index."""
+    catalog = BookCatalog(make_books(10))
+    assert catalog.get(7)["title"] == "Title 7"
+    assert catalog.delete(7)["id"] == 7
+    assert catalog.get(7) is None
+    assert 7 not in catalog
+    assert catalog.delete(7) is None
+    assert len(catalog) == 9
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_catalog_compaction_keeps_order() -> None:
+    """Positive test tombstones are dropped and positions rebuilt."""
+    catalog = BookCatalog(make_books(10))
+    for book_id in range(1, 10, 2):
+        catalog.delete(book_id)
+    catalog.delete(2)
+
+    assert [book["id"] for book in catalog] == [4, 6, 8, 10]
+    assert catalog.set_status(8, "выдана")["status"] == "выдана"
+    assert catalog.get(10)["id"] == 10
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_catalog_apply_journal_operations() -> None:
+    """Positive test replay of journal records is idempotent."""
+    catalog = BookCatalog(make_books(2))
+    operations = [
+        {"op": "add", "book": make_books(3)[2]},
+        {"op": "status", "id": 1, "status": "выдана"},
+        {"op": "delete", "id": 2},
+    ]
+    for _ in range(2):
+        for operation in operations:
+            catalog.apply(operation)
+
+    assert catalog.to_list() == [
+        dict(make_books(1)[0], status="выдана"),
+        make_books(3)[2],
+    ]
+    with pytest.raises(ValueError):
+        catalog.apply({"op": "drop"})
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "query", ["", " ", "it", "TITLE 1", "tle 1", "e 7", "Auth", "199", "zzz"]
+)
+def test_catalog_search_same_as_scan(query) -> None:
+    """Positive test indexed search returns results of a full scan."""
+    books = make_books(30)
+    books[4]["year"] = "1899"
+    catalog = BookCatalog(books)
+    catalog.delete(11)
+    catalog.add(dict(books[0], title="Renamed"))
+    catalog.add(
+        {
+            "id": 31,
+            "title": "Title 1 again",
+            "author": "Writer",
+            "year": "1999",
+            "status": "в наличии",
+        }
+    )
+
+    expected = [
+        book
+        for book in catalog
+        if query.lower() in book["title"].lower()
+        or query.lower() in book["author"].lower()
+        or query.lower() in book["year"]
+    ]
+    assert list(catalog.search(query)) == expected
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_catalog_year_range() -> None:
+    """Positive test year index follows adds, deletes and replaces."""
+    books = make_books(6)
+    for book, year in zip(books, ["1999", "1899", "1950", "1980", "1981"]):
+        book["year"] = year
+    catalog = BookCatalog(books)
+    catalog.delete(4)
+    catalog.add(dict(books[4], year="1960"))
+
+    assert [book["id"] for book in catalog.by_year(1950, 1980)] == [3, 5]
+    assert [book["id"] for book in catalog.by_year(1990, 1990)] == [6]
+    assert list(catalog.by_year(99, 99)) == []
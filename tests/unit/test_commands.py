@@ -0,0 +1,116 @@
+# type: ignore
+"""Test non-interactive book commands."""
+
+import io
+import json
+
+import pytest
+
+from src.console_core.commands import main
+from src.console_core.utils.crud import BookCRUD
+
+
+def run_command(capsys, *argv, stdin=None, monkeypatch=None) -> tuple:
+    """Return exit code and printed lines of the command."""
+    if stdin is not None:
+        monkeypatch.setattr("sys.stdin", io.StringIO(stdin))
+    code = main(list(argv))
+    return code, capsys.readouterr().out.splitlines()
+
+
+@pytest.mark.all
+@pytest.mark.unit
+def test_add_command(catalog_path, capsys, monkeypatch) -> None:
+    """Positive test books of options and of stdin are added."""
+    path = ["--path", str(catalog_path)]
+    code, out = run_command(
+        capsys,
+        "add",
+        "--title",
+        "Poems",
+        "--author",
+        "Esenin",
+        "--year",
+        "1918",
+        *path,
+    )
+    assert code == 0
+    assert json.loads(out[0]) == {"ids": [4], "rejects": []}
+
+    rows = (
+        '{"title": "Tales", "author": "Pushkin", "year": "1830"}\n' "broken\n"
+    )
+    code, out = run_command(
+        capsys, "add", *path, stdin=rows, monkeypatch=monkeypatch
+    )
+    assert code == 2
+    assert json.loads(out[0]) == {
+        "ids": [5],
+        "rejects": [{"line": 2, "error": "Invalid row."}],
+    }
+    assert BookCRUD(file_path=catalog_path).get_book(5)["title"] == "Tales"
+
+
+@pytest.mark.all
+@pytest.mark.unit
+def test_change_commands(catalog_path, capsys, monkeypatch) -> None:
+    """Positive test IDs of arguments and of stdin are changed."""
+    path = ["--path", str(catalog_path)]
+    code, out = run_command(
+        capsys,
+        "set-status",
+        "выдана",
+        *path,
+        stdin="1 2-3\n",
+        monkeypatch=monkeypatch,
+    )
+    assert code == 0
+    assert json.loads(out[0]) == {"updated": 3, "missing": []}
+
+    code, out = run_command(capsys, "delete", "2,9", *path)
+    assert code == 2
+    assert json.loads(out[0]) == {"deleted": 1, "missing": [9]}
+
+    code, out = run_command(capsys, "delete", "a-b", *path)
+    assert code == 2
+    assert out == []
+
+    books = list(BookCRUD(file_path=catalog_path).iter_books())
+    assert [book["id"] for book in books] == [1, 3]
+    assert {book["status"] for book in books} == {"выдана"}
+
+
+@pytest.mark.all
+@pytest.mark.unit
+def test_read_commands(catalog_path, capsys) -> None:
+    """Positive test found and all books are printed as JSON Lines."""
+    path = ["--path", str(catalog_path)]
+    books = list(BookCRUD(file_path=catalog_path).iter_books())
+
+    code, out = run_command(capsys, "list", *path)
+    assert code == 0
+    assert [json.loads(line) for line in out] == books
+
+    code, out = run_command(capsys, "find", "tolstoy", *path)
+    assert [json.loads(line)["author"] for line in out] == ["Tolstoy"]
+
+    code, out = run_command(capsys, "find", "1999", "--format", "csv", *path)
+    assert out[0] == "id,title,author,year,status"
+    assert len(out) == 3
+
+
+@pytest.mark.all
+@pytest.mark.unit
+def test_commands_report_errors(catalog_path, tmp_path, capsys) -> None:
+    """Negative test missing file and broken catalog are one stderr line."""
+    path = ["--path", str(catalog_path)]
+    code = main(["import", str(tmp_path / "missing.csv"), *path])
+    out, err = capsys.readouterr()
+    assert (code, out) == (2, "")
+    assert len(err.splitlines()) == 1
+    assert "missing.csv" in err
+
+    catalog_path.write_text("[{broken")
+    code = main(["list", *path])
+    out, err = capsys.readouterr()
+    assert (code, out, err) == (2, "", "File brake or incorrect.\n")
@@ -0,0 +1,48 @@
+# type: ignore
+"""Test console color text formatter."""
+
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from src.console_core.utils.coollors_text import (
+    COLORS,
+    RED,
+    FormatterColorText,
+)
+from src.console_core.utils.storage import BookStorage
+from src.models.book import Book
+
+
+@pytest.mark.all
+@pytest.mark.unit
+@pytest.mark.parametrize("lines", [[], [""], ["one"], ["one", "", "two"]])
+def test_build_lines_same_as_build_text(lines) -> None:
+    """Positive test batch coloring gives the same text."""
+    printer = FormatterColorText()
+    expected = "\n".join(printer(line).red().build_text() for line in lines)
+
+    assert FormatterColorText().red().build_lines(iter(lines)) == expected
+
+
+@pytest.mark.all
+@pytest.mark.unit
+def test_book_view_same_as_book() -> None:
+    """Positive test record is shown like the Book."""
+    book = Book(author="Author", title="Title", year=1990, _id=3)
+
+    assert BookStorage._book_view(book.to_dict()) == str(book)
+
+
+@pytest.mark.all
+@pytest.mark.unit
+def test_style_is_immutable() -> None:
+    """Positive test style taken from the printer is not changed by it."""
+    printer = FormatterColorText().red()
+    style = printer.style
+    printer.blue()
+
+    assert style("text") == FormatterColorText("text").red().build_text()
+    assert style == RED
+    with pytest.raises(FrozenInstanceError):
+        style.code = COLORS["blue"]
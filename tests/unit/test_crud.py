@@ -0,0 +1,603 @@
+# type: ignore
+"""Test books CRUD."""
+
+import json
+import multiprocessing
+import os
+import pickle
+from functools import partial
+
+import pytest
+
+from src.console_core.utils.crud import BookCRUD
+from src.console_core.utils.indexes import TrigramIndex
+from src.console_core.utils.storage import VersionConflictError
+from src.models.book import InvalidInputBookData
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_cache_hits_without_file_changes(crud) -> None:
+    """Positive test catalog is parsed once for many operations."""
+    list(crud.select_all_books())
+    list(crud.find_book_by_part_info("Tolstoy"))
+    crud.add_book_input_data(
+        {"author": "Esenin", "title": "Poems", "year": "1918"}
+    )
+    crud.update_status_book(book_id=4, status="выдана")
+    assert len(list(crud.select_all_books())) == 4
+
+    info = crud.cache_info()
+    assert info.misses == 1
+    assert info.hits >= 4
+    assert info.size == 4
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_cache_invalidated_by_other_process(crud, catalog_path) -> None:
+    """Positive test external change of catalog is re-read."""
+    assert len(list(crud.select_all_books())) == 3
+
+    other = BookCRUD(file_path=catalog_path)
+    other.delete_book_by_id(book_id=1)
+
+    assert len(list(crud.select_all_books())) == 2
+    assert crud.cache_info().misses == 2
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_cache_with_missing_file(tmp_path) -> None:
+    """Positive test missing catalog is cached as empty."""
+    crud = BookCRUD(file_path=tmp_path / "books.json")
+    assert list(crud.select_all_books()) == []
+    assert (
+        crud.add_book_input_data(
+            {"author": "Esenin", "title": "Poems", "year": "1918"}
+        )
+        is None
+    )
+    assert json.loads((tmp_path / "books.json").read_text())[0]["id"] == 1
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_journal_appends_without_snapshot_rewrite(catalog_path) -> None:
+    """Positive test mutations are journaled and replayed by readers."""
+    snapshot = catalog_path.read_bytes()
+    crud = BookCRUD(file_path=catalog_path, journal=True)
+    crud.add_book_input_data(
+        {"author": "Esenin", "title": "Poems", "year": "1918"}
+    )
+    crud.update_status_book(book_id=1, status="в наличии")
+    crud.delete_book_by_id(book_id=2)
+
+    assert catalog_path.read_bytes() == snapshot
+    assert len(crud.JOURNAL_PATH.read_text().splitlines()) == 3
+
+    books = list(BookCRUD(file_path=catalog_path).select_all_books())
+    assert books == list(crud.select_all_books())
+    assert [book.split()[0] for book in books] == ["1", "3", "4"]
+    assert books[0].endswith("в наличии")
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_journal_compaction(catalog_path) -> None:
+    """Positive test long journal is compacted into snapshot."""
+    crud = BookCRUD(
+        file_path=catalog_path, journal=True, journal_max_bytes=300
+    )
+    for year in range(1900, 1905):
+        crud.add_book_input_data(
+            {"author": "Esenin", "title": "Poems", "year": year}
+        )
+
+    assert len(json.loads(catalog_path.read_text())) > 3
+    assert len(list(crud.select_all_books())) == 8
+    assert len(list(BookCRUD(file_path=catalog_path).select_all_books())) == 8
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+@pytest.mark.parametrize("streaming", [False, True])
+def test_long_batch_saved_as_snapshot(catalog_path, mocker, streaming) -> None:
+    """Positive test batch longer than the journal skips the journal."""
+    crud = BookCRUD(
+        file_path=catalog_path,
+        journal=True,
+        streaming=streaming,
+        journal_max_bytes=300,
+    )
+    append = mocker.spy(BookCRUD, "_append_journal")
+    books = [
+        {"id": book_id, "title": "Poems", "author": "Esenin", "year": "1"}
+        for book_id in range(4, 14)
+    ]
+    crud.insert_books(books)
+
+    assert append.call_count == 0
+    assert not crud.JOURNAL_PATH.exists()
+    assert len(json.loads(catalog_path.read_text())) == 13
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_journal_torn_tail_is_skipped(catalog_path) -> None:
+    """Negative test unfinished journal record is ignored."""
+    crud = BookCRUD(file_path=catalog_path, journal=True)
+    crud.delete_book_by_id(book_id=1)
+    with open(crud.JOURNAL_PATH, "a", encoding="utf-8") as file:
+        file.write('{"op": "delete", "i')
+
+    assert len(list(BookCRUD(file_path=catalog_path).select_all_books())) == 2
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+@pytest.mark.parametrize("streaming", [False, True])
+def test_journal_append_after_torn_tail(catalog_path, streaming) -> None:
+    """Negative test records appended after a torn one are all kept."""
+    crud = BookCRUD(file_path=catalog_path, journal=True)
+    crud.delete_book_by_id(book_id=1)
+    with open(crud.JOURNAL_PATH, "a", encoding="utf-8") as file:
+        file.write('{"op": "delete", "i')
+
+    other = BookCRUD(file_path=catalog_path, journal=True, streaming=streaming)
+    other.update_status_book(book_id=2, status="в наличии")
+    other.delete_book_by_id(book_id=3)
+
+    books = BookCRUD(file_path=catalog_path).iter_books()
+    assert [(book["id"], book["status"]) for book in books] == [
+        (2, "в наличии")
+    ]
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_save_is_atomic(crud, catalog_path, mocker) -> None:
+    """Negative test failed save keeps the old catalog intact."""
+    snapshot = catalog_path.read_bytes()
+    list(crud.select_all_books())
+    mocker.patch("os.replace", side_effect=KeyboardInterrupt)
+
+    with pytest.raises(KeyboardInterrupt):
+        crud.delete_book_by_id(book_id=1)
+
+    assert catalog_path.read_bytes() == snapshot
+    assert not list(catalog_path.parent.glob("*.tmp"))
+    assert len(list(crud.select_all_books())) == 3
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_save_keeps_file_mode(crud, catalog_path) -> None:
+    """Positive test saved catalog keeps permissions of the old one."""
+    os.chmod(catalog_path, 0o664)
+    crud.update_status_book(book_id=1, status="в наличии")
+
+    assert os.stat(catalog_path).st_mode & 0o777 == 0o664
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_group_commit_single_fsync(catalog_path, mocker) -> None:
+    """Positive test mutations in one window are saved with one fsync."""
+    crud = BookCRUD(file_path=catalog_path, group_commit_window=60)
+    fsync = mocker.spy(os, "fsync")
+    for year in range(1900, 1905):
+        crud.add_book_input_data(
+            {"author": "Esenin", "title": "Poems", "year": year}
+        )
+    crud.update_status_book(book_id=1, status="в наличии")
+
+    assert len(list(crud.select_all_books())) == 8
+    assert len(json.loads(catalog_path.read_text())) == 3
+    assert json.loads(crud.META_PATH.read_text()) == {"next_id": 9}
+
+    fsync.reset_mock()
+    crud.flush()
+    assert len(json.loads(catalog_path.read_text())) == 8
+    assert fsync.call_count == 2  # catalog and its directory
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_group_commit_rebases_external_change(catalog_path) -> None:
+    """Positive test pending batch does not lose changes of others."""
+    crud = BookCRUD(file_path=catalog_path, group_commit_window=60)
+    crud.update_status_book(book_id=1, status="в наличии")
+    BookCRUD(file_path=catalog_path).delete_book_by_id(book_id=2)
+    crud.flush()
+
+    books = list(BookCRUD(file_path=catalog_path).select_all_books())
+    assert [book.split()[0] for book in books] == ["1", "3"]
+    assert books[0].endswith("в наличии")
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_group_commit_ids_distinct_from_others(catalog_path) -> None:
+    """Positive test pending books keep IDs other desks can't take."""
+    crud = BookCRUD(file_path=catalog_path, group_commit_window=60)
+    other = BookCRUD(file_path=catalog_path)
+    crud.add_book_input_data(
+        {"author": "Esenin", "title": "Poems", "year": "1918"}
+    )
+    other.add_book_input_data(
+        {"author": "Blok", "title": "The Twelve", "year": "1918"}
+    )
+    crud.flush()
+
+    books = BookCRUD(file_path=catalog_path).iter_books()
+    assert [(book["id"], book["author"]) for book in books][3:] == [
+        (5, "Blok"),
+        (4, "Esenin"),
+    ]
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_ids_are_not_reused_after_delete(crud, catalog_path) -> None:
+    """Positive test ID of deleted last book is never given again."""
+    crud.add_book_input_data(
+        {"author": "Esenin", "title": "Poems", "year": "1918"}
+    )
+    crud.delete_book_by_id(book_id=4)
+
+    other = BookCRUD(file_path=catalog_path)
+    other.add_book_input_data(
+        {"author": "Esenin", "title": "Poems", "year": "1918"}
+    )
+    assert list(other.select_all_books())[-1].startswith("5 ")
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_allocate_ids_range(crud) -> None:
+    """Positive test bulk allocation returns consecutive IDs."""
+    assert crud.allocate_ids(100) == range(4, 104)
+    assert crud.allocate_ids() == range(104, 105)
+    with pytest.raises(ValueError):
+        crud.allocate_ids(0)
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_trigram_index_is_persisted(crud, catalog_path, mocker) -> None:
+    """Positive test search index is not rebuilt on the next start."""
+    crud.add_book_input_data(
+        {"author": "Esenin", "title": "Poems", "year": "1918"}
+    )
+    saved = mocker.spy(TrigramIndex, "save")
+    crud.update_status_book(book_id=4, status="выдана")
+    assert saved.call_count == 0
+    crud.close()
+    assert saved.call_count == 1
+
+    build = mocker.spy(TrigramIndex, "add")
+    other = BookCRUD(file_path=catalog_path)
+    assert list(other.find_book_by_part_info("esen")) == [
+        "4 Poems Esenin 1918 выдана"
+    ]
+    assert build.call_count == 0
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_trigram_index_holds_only_data(crud, catalog_path) -> None:
+    """Negative test pickled index is never unpickled, only rebuilt."""
+    list(crud.select_all_books())
+    stamp, postings = crud.TRIGRAM_PATH.read_text().splitlines()
+    assert json.loads(stamp) and json.loads(postings)
+
+    crud.TRIGRAM_PATH.write_bytes(pickle.dumps(os.getcwd))
+    other = BookCRUD(file_path=catalog_path)
+    assert list(other.find_book_by_part_info("tolst")) == [
+        "2 W&P Tolstoy 1999 выдана"
+    ]
+    stamp, postings = crud.TRIGRAM_PATH.read_text().splitlines()
+    assert json.loads(stamp) and json.loads(postings)
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_stale_trigram_index_is_rebuilt(crud, catalog_path) -> None:
+    """Negative test index of another snapshot is not used."""
+    list(crud.select_all_books())
+    books = json.loads(catalog_path.read_text())
+    books[0]["title"] = "Eugene Onegin"
+    catalog_path.write_text(json.dumps(books, ensure_ascii=False))
+
+    other = BookCRUD(file_path=catalog_path)
+    assert list(other.find_book_by_part_info("onegin")) == [
+        "1 Eugene Onegin Pushkin 1990 выдана"
+    ]
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_stale_trigram_index_not_decoded(crud, catalog_path) -> None:
+    """Negative test postings of a stale index are not even parsed."""
+    list(crud.select_all_books())
+    stamp = json.loads(crud.TRIGRAM_PATH.read_text().splitlines()[0])
+    crud.TRIGRAM_PATH.write_text(json.dumps(stamp) + "\nbroken")
+
+    assert TrigramIndex.load(crud.TRIGRAM_PATH, (0, 0, 0)) is None
+    assert TrigramIndex.load(crud.TRIGRAM_PATH, tuple(stamp)) is None
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_find_books_by_year(crud) -> None:
+    """Positive test exact year and range queries."""
+    crud.add_book_input_data(
+        {"author": "Esenin", "title": "Poems", "year": "1918"}
+    )
+    assert crud.find_books_by_year("1999") == [
+        "2 W&P Tolstoy 1999 выдана",
+        "3 The Master and Margarita Mikhail Bulgakov 1999 выдана",
+    ]
+    assert crud.find_books_by_year(99) == []
+    assert crud.find_books_by_year_range(1900, 1990) == [
+        "4 Poems Esenin 1918 в наличии.",
+        "1 Collection Pushkin 1990 выдана",
+    ]
+    with pytest.raises(InvalidInputBookData):
+        crud.find_books_by_year_range("1900", "now")
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_streaming_mode(catalog_path, mocker) -> None:
+    """Positive test streaming mode never loads the whole catalog."""
+    load = mocker.spy(BookCRUD, "_load_books")
+    crud = BookCRUD(file_path=catalog_path, streaming=True)
+    crud.add_book_input_data(
+        {"author": "Esenin", "title": "Poems", "year": "1918"}
+    )
+    crud.update_status_book(book_id=1, status="в наличии")
+    assert crud.delete_book_by_id(book_id=2) is None
+    assert crud.delete_book_by_id(book_id=2)
+
+    assert load.call_count == 0
+    assert list(crud.select_all_books()) == list(
+        BookCRUD(file_path=catalog_path).select_all_books()
+    )
+    assert list(crud.find_book_by_part_info("ESEN")) == [
+        "4 Poems Esenin 1918 в наличии."
+    ]
+    assert crud.find_books_by_year_range(1900, 2000) == [
+        "4 Poems Esenin 1918 в наличии.",
+        "1 Collection Pushkin 1990 в наличии",
+        "3 The Master and Margarita Mikhail Bulgakov 1999 выдана",
+    ]
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_streaming_compaction(catalog_path) -> None:
+    """Positive test journal is compacted into snapshot by streaming."""
+    crud = BookCRUD(
+        file_path=catalog_path, streaming=True, journal_max_bytes=300
+    )
+    for year in range(1900, 1905):
+        crud.add_book_input_data(
+            {"author": "Esenin", "title": "Poems", "year": year}
+        )
+
+    books = json.loads(catalog_path.read_text())
+    assert catalog_path.read_text() == json.dumps(
+        books, ensure_ascii=False, indent=4
+    )
+    assert len(list(crud.select_all_books())) == 8
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_streaming_reads_consistent_snapshot(catalog_path) -> None:
+    """Positive test compaction after the read starts is not mixed in."""
+    crud = BookCRUD(file_path=catalog_path, streaming=True)
+    crud.update_status_book(book_id=1, status="в наличии")
+    books = crud.iter_books()
+
+    other = BookCRUD(file_path=catalog_path)
+    other.update_status_book(book_id=1, status="выдана")
+    other.update_status_book(book_id=2, status="в наличии")
+
+    assert {book["id"]: book["status"] for book in books} == {
+        1: "в наличии",
+        2: "выдана",
+        3: "выдана",
+    }
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_streaming_ids_without_rescan(catalog_path, mocker) -> None:
+    """Positive test own adds do not rescan, outside changes do."""
+    crud = BookCRUD(file_path=catalog_path, streaming=True)
+    book = {"author": "Esenin", "title": "Poems", "year": "1918"}
+    crud.add_book_input_data(book)
+    scan = mocker.spy(BookCRUD, "_iter_books")
+    for _ in range(3):
+        crud.add_book_input_data(book)
+    assert scan.call_count == 0
+
+    BookCRUD(file_path=catalog_path).insert_books([{**book, "id": 20}])
+    crud.add_book_input_data(book)
+    assert scan.call_count == 1
+    assert crud.get_book(21)["title"] == "Poems"
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_page_records(crud, mocker) -> None:
+    """Positive test page is found by ID without a scan, as copies."""
+    scan = mocker.spy(BookCRUD, "iter_books")
+    page = crud.page_records(after=1, limit=1)
+    assert [book["id"] for book in page] == [2]
+    assert crud.page_records(after=1, limit=5, look_for_data="master") == [
+        crud.get_book(3)
+    ]
+    assert scan.call_count == 0
+
+    page[0]["status"] = "lost"
+    assert crud.get_book(2)["status"] == "выдана"
+
+
+def read_pages(fetch) -> list[list[str]]:
+    """Return all pages following cursors."""
+    pages, cursor = [], None
+    while True:
+        page = fetch(cursor=cursor)
+        pages.append(page.items)
+        if page.next_cursor is None:
+            return pages
+        cursor = page.next_cursor
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+@pytest.mark.parametrize("streaming", [False, True])
+def test_pagination(catalog_path, streaming) -> None:
+    """Positive test keyset pages cover results without repeats."""
+    crud = BookCRUD(file_path=catalog_path, streaming=streaming)
+    for year in range(1900, 1910):
+        crud.add_book_input_data(
+            {"author": "Esenin", "title": "Poems", "year": year}
+        )
+    crud.delete_book_by_id(book_id=6)
+
+    pages = read_pages(partial(crud.list_books_page, 5))
+    assert [len(page) for page in pages] == [5, 5, 2]
+    assert sum(pages, []) == list(crud.select_all_books())
+
+    pages = read_pages(partial(crud.find_books_page, "esenin", 4))
+    assert sum(pages, []) == list(crud.find_book_by_part_info("esenin"))
+    assert [len(page) for page in pages] == [4, 4, 1]
+
+    pages = read_pages(partial(crud.find_books_by_year_page, 1905, 1999, 3))
+    assert sum(pages, []) == crud.find_books_by_year_range(1905, 1999)
+    assert [len(page) for page in pages] == [3, 3, 2]
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+@pytest.mark.parametrize("cursor", ["", "not base64!", "WzEsIDJd", "InMi"])
+def test_pagination_invalid_cursor(crud, cursor) -> None:
+    """Negative test broken cursor is rejected."""
+    with pytest.raises(InvalidInputBookData):
+        crud.list_books_page(cursor=cursor)
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+@pytest.mark.parametrize("streaming", [False, True])
+def test_batch_changes_single_write(catalog_path, mocker, streaming) -> None:
+    """Positive test batch changes are saved with one write."""
+    crud = BookCRUD(file_path=catalog_path, streaming=streaming)
+    list(crud.iter_books())
+    write = mocker.spy(
+        BookCRUD, "_append_journal" if streaming else "_save_books"
+    )
+
+    assert crud.update_status_books([1, 3, 7, 1], "выдана") == [7]
+    assert crud.delete_books(range(2, 6)) == [4, 5]
+
+    assert write.call_count == 2
+    books = list(BookCRUD(file_path=catalog_path).iter_books())
+    assert [(book["id"], book["status"]) for book in books] == [
+        (1, "выдана"),
+    ]
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_batch_without_found_books_does_not_write(crud, mocker) -> None:
+    """Negative test nothing is saved when no book is found."""
+    list(crud.iter_books())
+    write = mocker.spy(BookCRUD, "_save_books")
+
+    assert crud.delete_books([10, 11]) == [10, 11]
+    assert write.call_count == 0
+
+
+def add_books(path, count) -> None:
+    """Add books to the catalog from a separate process."""
+    crud = BookCRUD(file_path=path)
+    for number in range(count):
+        crud.add_book_input_data(
+            {"author": "Esenin", "title": f"Poem {number}", "year": "1918"}
+        )
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_concurrent_processes_keep_all_books(catalog_path) -> None:
+    """Positive test adds of processes are not lost nor get same IDs."""
+    processes = [
+        multiprocessing.Process(target=add_books, args=(catalog_path, 15))
+        for _ in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    ids = [
+        book["id"] for book in BookCRUD(file_path=catalog_path).iter_books()
+    ]
+    assert sorted(ids) == list(range(1, 64))
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_stale_version_conflicts(crud, catalog_path) -> None:
+    """Negative test change of a book changed since read is refused."""
+    version = crud.book_version(1)
+    BookCRUD(file_path=catalog_path).update_status_book(1, "списана")
+
+    with pytest.raises(VersionConflictError):
+        crud.update_status_book(1, "в наличии", expected_version=version)
+    with pytest.raises(VersionConflictError):
+        crud.delete_book_by_id(1, expected_version=version)
+    assert crud.get_book(1)["status"] == "списана"
+
+    version = crud.book_version(1)
+    assert crud.book_version(2) == crud.book_version(2)
+    assert crud.update_status_book(1, "в наличии", version) is None
+    assert crud.book_version(1) != version
+    assert crud.book_version(99) is None
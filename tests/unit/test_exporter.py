@@ -0,0 +1,72 @@
+# type: ignore
+"""Test streaming export of books."""
+
+import csv
+import io
+import json
+
+import pytest
+
+from src.console_core.commands import main
+from src.console_core.utils.crud import BookCRUD
+from src.console_core.utils.exporter import export_file, write_books
+from src.console_core.utils.importer import import_file
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_export_jsonl(crud, tmp_path) -> None:
+    """Positive test JSON Lines export holds the book records."""
+    target = tmp_path / "books.jsonl"
+
+    assert export_file(crud, target) == 3
+
+    lines = target.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == list(crud.iter_books())
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_export_csv_found_books_round_trip(sqlite_crud, tmp_path) -> None:
+    """Positive test exported search result is imported back."""
+    target = tmp_path / "books.csv"
+
+    assert export_file(sqlite_crud, target, look_for_data="1999") == 2
+
+    with open(target, encoding="utf-8", newline="") as file:
+        rows = list(csv.DictReader(file))
+    assert [row["id"] for row in rows] == ["2", "3"]
+    report = import_file(sqlite_crud, target)
+    assert report.imported == 2
+    assert len(list(sqlite_crud.find_books("1999"))) == 4
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_export_writes_by_chunks(mocker) -> None:
+    """Positive test books are written with one write per chunk."""
+    books = ({"id": number, "title": "T"} for number in range(5))
+    file = io.StringIO()
+    write = mocker.spy(file, "write")
+
+    assert write_books(file, books, "jsonl", chunk_rows=2) == 5
+
+    assert write.call_count == 3
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_export_command_streaming(catalog_path, capsys) -> None:
+    """Positive test export command writes to stdout."""
+    code = main(
+        ["export", "-", "--storage", "streaming", "--path", str(catalog_path)]
+    )
+
+    assert code == 0
+    lines = capsys.readouterr().out.splitlines()
+    books = list(BookCRUD(file_path=catalog_path).iter_books())
+    assert [json.loads(line) for line in lines] == books
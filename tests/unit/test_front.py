@@ -0,0 +1,63 @@
+# type: ignore
+"""Test helpers of the console front."""
+
+import json
+
+import pytest
+
+from src.console_core.utils.crud import BookCRUD
+from src.console_core.utils.front import (
+    ConsoleFront,
+    format_book_ids,
+    parse_book_ids,
+)
+
+
+@pytest.mark.all
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "text, book_ids",
+    [
+        ("4", [4]),
+        (" 1, 5 ,10-12", [1, 5, 10, 11, 12]),
+        ("3 - 3", [3]),
+    ],
+)
+def test_parse_book_ids(text, book_ids) -> None:
+    """Positive test IDs and ranges of IDs are parsed."""
+    assert parse_book_ids(text) == book_ids
+
+
+@pytest.mark.all
+@pytest.mark.unit
+@pytest.mark.parametrize("text", ["", "1,,2", "a", "5-1", "-3", "1-9999999"])
+def test_parse_book_ids_invalid(text) -> None:
+    """Negative test invalid lists of IDs are rejected."""
+    with pytest.raises(ValueError):
+        parse_book_ids(text)
+
+
+@pytest.mark.all
+@pytest.mark.unit
+def test_format_book_ids() -> None:
+    """Positive test runs of IDs are shown as ranges."""
+    assert format_book_ids([9, 1, 2, 3, 5, 8]) == "1-3,5,8-9"
+    assert format_book_ids([]) == ""
+
+
+@pytest.mark.all
+@pytest.mark.unit
+def test_exit_console_closes_storage(catalog_path, mocker) -> None:
+    """Positive test pending group commit is saved on exit."""
+    crud = BookCRUD(file_path=catalog_path, group_commit_window=60)
+    front = ConsoleFront(
+        screener=mocker.Mock(), io_cls=mocker.Mock(), crud=crud
+    )
+    crud.delete_book_by_id(book_id=1)
+
+    with pytest.raises(SystemExit):
+        front.exit_console()
+    assert [book["id"] for book in json.loads(catalog_path.read_text())] == [
+        2,
+        3,
+    ]
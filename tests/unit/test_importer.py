@@ -0,0 +1,112 @@
+# type: ignore
+"""Test bulk import of books."""
+
+import json
+
+import pytest
+
+from src.console_core.commands import main
+from src.console_core.utils.crud import BookCRUD
+from src.console_core.utils.importer import (
+    ImportReject,
+    import_books,
+    import_file,
+)
+
+CSV_ROWS = (
+    "title,author,year,status\n"
+    "Poems,Esenin,1918,\n"
+    "No,Esenin,1918,\n"
+    "Dead Souls,Gogol,1842,выдана\n"
+    "Future,Author,3000,\n"
+)
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+@pytest.mark.parametrize("journal", [False, True])
+def test_import_csv(catalog_path, tmp_path, mocker, journal) -> None:
+    """Positive test valid rows are added with one write."""
+    source = tmp_path / "books.csv"
+    source.write_text(CSV_ROWS, encoding="utf-8")
+    crud = BookCRUD(file_path=catalog_path, journal=journal)
+    crud.select_all_books()
+    write = mocker.spy(
+        BookCRUD, "_save_books" if not journal else "_append_journal"
+    )
+
+    report = import_file(crud, source)
+
+    assert report.imported == 2
+    assert [reject.line for reject in report.rejects] == [3, 5]
+    assert write.call_count == 1
+    books = list(BookCRUD(file_path=catalog_path).iter_books())
+    assert [(book["id"], book["title"]) for book in books[3:]] == [
+        (4, "Poems"),
+        (5, "Dead Souls"),
+    ]
+    assert books[4]["status"] == "выдана"
+    assert books[3]["status"] == "в наличии."
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_import_jsonl_rejects(sqlite_crud, tmp_path) -> None:
+    """Negative test broken JSON Lines rows are reported by line."""
+    source = tmp_path / "books.jsonl"
+    lines = [
+        json.dumps({"title": "Poems", "author": "Esenin", "year": 1918}),
+        "{broken",
+        "",
+        json.dumps(["Poems", "Esenin"]),
+        json.dumps({"title": "Poems", "author": "Esenin"}),
+        json.dumps({"title": "Poems", "author": "Esenin", "year": [1]}),
+    ]
+    source.write_text("\n".join(lines), encoding="utf-8")
+
+    report = import_file(sqlite_crud, source)
+
+    assert report.imported == 1
+    assert [reject.line for reject in report.rejects] == [2, 4, 5, 6]
+    assert sqlite_crud.get_book(4)["year"] == "1918"
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_import_rejects_unknown_status(binary_crud) -> None:
+    """Negative test statuses out of the known set are rejected."""
+    book = {"title": "Poems", "author": "Esenin", "year": 1918}
+    rows = [
+        {**book, "status": ["x", 1]},
+        {**book, "status": 1},
+        {**book, "status": "lost"},
+        {**book, "status": "выдана"},
+    ]
+
+    report = import_books(binary_crud, enumerate(rows, 1))
+
+    assert report.imported == 1
+    assert report.rejects == [
+        ImportReject(line=line, error="Invalid status.") for line in (1, 2, 3)
+    ]
+    assert binary_crud.get_book(4)["status"] == "выдана"
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_import_command(catalog_path, tmp_path, capsys) -> None:
+    """Positive test import command reports rejected rows."""
+    source = tmp_path / "books.csv"
+    source.write_text(CSV_ROWS, encoding="utf-8")
+
+    code = main(["import", str(source), "--path", str(catalog_path)])
+
+    assert code == 0
+    output = capsys.readouterr().out
+    assert "Line 3: Title length" in output
+    assert "Imported 2 books, rejected 2 rows" in output
+    assert len(list(BookCRUD(file_path=catalog_path).iter_books())) == 5
@@ -0,0 +1,48 @@
+# type: ignore
+"""Test console screens output."""
+
+import io
+import os
+
+import pytest
+
+from src.console_core.utils.coollors_text import FormatterColorText
+from src.console_core.utils.ioconsole import ConsoleInput, ConsoleOutput
+from src.console_core.utils.renderer import FrameRenderer
+
+
+@pytest.mark.all
+@pytest.mark.unit
+def test_static_fragments_cached(monkeypatch, mocker) -> None:
+    """Positive test menu is rendered once until the terminal resizes."""
+    size = os.terminal_size((80, 24))
+    monkeypatch.setattr("shutil.get_terminal_size", lambda: size)
+    renderer = FrameRenderer(stream=io.StringIO())
+    screener = ConsoleOutput(FormatterColorText(), renderer=renderer)
+    generate = mocker.spy(screener, "_generate_menu_items")
+
+    screener.main_menu_screen()
+    renderer.flush()
+    first = renderer._stream.getvalue()
+    screener.main_menu_screen()
+    renderer.flush()
+
+    assert generate.call_count == 1
+    assert renderer._stream.getvalue() == first * 2
+
+    size = os.terminal_size((100, 24))
+    screener.main_menu_screen()
+
+    assert generate.call_count == 2
+
+
+@pytest.mark.all
+@pytest.mark.unit
+def test_screens_without_shared_renderer(capsys) -> None:
+    """Positive test screens are shown when built without a renderer."""
+    printer = FormatterColorText()
+    screener = ConsoleOutput(printer)
+    ConsoleInput(printer)
+
+    screener.main_menu_screen()
+    assert "1.Add book" in capsys.readouterr().out
@@ -0,0 +1,67 @@
+# type: ignore
+"""Test reader/writer lock of the catalog file."""
+
+import threading
+import time
+
+import pytest
+
+from src.console_core.utils.locking import FileLock
+
+
+@pytest.fixture()
+def lock_path(tmp_path):
+    """Return path to the lock file."""
+    return tmp_path / "books.json.lock"
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_readers_do_not_wait(lock_path) -> None:
+    """Positive test shared lock is taken while others read."""
+    reader, other = FileLock(lock_path), FileLock(lock_path)
+    with reader.shared(), other.shared():
+        pass
+
+    assert other.info().acquired == 1
+    assert other.info().contended == 0
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_writer_waits_for_readers(lock_path) -> None:
+    """Positive test exclusive lock waits and the wait is measured."""
+    reader, writer = FileLock(lock_path), FileLock(lock_path)
+    written = threading.Event()
+
+    def write() -> None:
+        with writer.exclusive():
+            written.set()
+
+    with reader.shared():
+        thread = threading.Thread(target=write)
+        thread.start()
+        time.sleep(0.1)
+        assert not written.is_set()
+    thread.join()
+
+    assert written.is_set()
+    assert writer.info().contended == 1
+    assert writer.info().wait_seconds >= 0.05
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_nested_locks(lock_path) -> None:
+    """Positive test locks nest and shared one can't be upgraded."""
+    lock = FileLock(lock_path)
+    with lock.exclusive(), lock.shared(), lock.exclusive():
+        pass
+    with lock.shared(), pytest.raises(RuntimeError):
+        with lock.exclusive():
+            pass
+
+    assert lock.info().acquired == 2
@@ -0,0 +1,72 @@
+# type: ignore
+"""Test frame-buffered console renderer."""
+
+import io
+import os
+
+import pytest
+
+from src.console_core.utils.renderer import CLEAR, FrameRenderer, move_to
+
+
+@pytest.fixture()
+def terminal(monkeypatch):
+    """Return stream of a 40 rows terminal."""
+    monkeypatch.setattr(
+        "shutil.get_terminal_size", lambda: os.terminal_size((80, 40))
+    )
+    return io.StringIO()
+
+
+@pytest.mark.all
+@pytest.mark.unit
+def test_frame_is_one_write(terminal, mocker) -> None:
+    """Positive test screen is cleared and written with one write."""
+    renderer = FrameRenderer(stream=terminal)
+    write = mocker.spy(terminal, "write")
+    renderer.print("old screen")
+    renderer.clear()
+    renderer.print("header", "v1", sep=":")
+    renderer.print("menu")
+    renderer.flush()
+    renderer.flush()
+
+    assert write.call_count == 1
+    assert terminal.getvalue() == f"{CLEAR}header:v1\nmenu\n"
+    stats = renderer.stats()
+    assert stats.frames == 1
+    assert stats.bytes_per_frame == len(terminal.getvalue())
+
+
+@pytest.mark.all
+@pytest.mark.unit
+def test_diff_redraws_changed_lines(terminal) -> None:
+    """Positive test only lines differing from last frame are written."""
+    renderer = FrameRenderer(stream=terminal, diff=True)
+    for screen in (("header", "menu", "footer"), ("header", "found")):
+        renderer.clear()
+        for line in screen:
+            renderer.print(line)
+        renderer.flush()
+    frame = terminal.getvalue().split("footer\n", 1)[1]
+
+    assert "header" not in frame
+    assert frame.startswith(move_to(2) + "found")
+    assert frame.endswith(move_to(3) + "\033[J")
+
+
+@pytest.mark.all
+@pytest.mark.unit
+def test_diff_after_appended_output(terminal) -> None:
+    """Positive test screen appended after a prompt is redrawn whole."""
+    renderer = FrameRenderer(stream=terminal, diff=True)
+    renderer.clear()
+    renderer.print("header")
+    renderer.flush()
+    renderer.print("result")
+    renderer.flush()
+    renderer.clear()
+    renderer.print("header")
+    renderer.flush()
+
+    assert terminal.getvalue().endswith(f"{CLEAR}header\n")
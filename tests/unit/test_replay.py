@@ -0,0 +1,70 @@
+# type: ignore
+"""Test headless replay of console sessions."""
+
+import io
+
+import pytest
+
+from src.console_core.commands import main
+from src.console_core.replay import read_script, recording_reader, replay
+from src.console_core.utils.crud import BookCRUD
+
+SESSION = ["1", "Есенин", "Иисус-младенец", "1918", "9", "4", "0"]
+
+
+@pytest.mark.all
+@pytest.mark.unit
+def test_replay_session(catalog_path, capsys) -> None:
+    """Positive test keys run the console without drawing."""
+    report = replay(SESSION, path=catalog_path)
+
+    assert report.operations == len(SESSION)
+    assert report.operations_per_second > 0
+    screens = {screen.screen: screen.keys for screen in report.screens()}
+    assert screens == {"main": 2, "add_book": 4, "select_book": 1}
+    assert capsys.readouterr().out == ""
+    assert BookCRUD(file_path=catalog_path).get_book(4)["author"] == "Есенин"
+
+
+@pytest.mark.all
+@pytest.mark.unit
+def test_replay_ends_with_script(catalog_path) -> None:
+    """Positive test session without exit ends with the keys."""
+    report = replay(["4", "n"], path=catalog_path)
+    assert report.operations == 2
+
+
+@pytest.mark.all
+@pytest.mark.unit
+def test_record_and_replay_command(
+    catalog_path, tmp_path, capsys, monkeypatch
+) -> None:
+    """Positive test recorded keys are replayed by the command."""
+    keys = iter(SESSION)
+    monkeypatch.setattr("builtins.input", lambda _: next(keys))
+    script = tmp_path / "session.txt"
+    path = ["--path", str(catalog_path)]
+
+    assert main(["record", str(script), *path]) == 0
+    assert list(read_script(script)) == SESSION
+
+    capsys.readouterr()
+    assert main(["replay", str(script), *path]) == 0
+    out = capsys.readouterr().out.splitlines()
+    assert out[0].startswith(f"Replayed {len(SESSION)} keys in")
+    assert [line.split()[0] for line in out[1:]] == [
+        "add_book",
+        "main",
+        "select_book",
+    ]
+    assert BookCRUD(file_path=catalog_path).get_book(5)["year"] == "1918"
+
+
+@pytest.mark.all
+@pytest.mark.unit
+def test_recording_reader(monkeypatch) -> None:
+    """Positive test entered keys are written line by line."""
+    monkeypatch.setattr("builtins.input", lambda _: " ")
+    file = io.StringIO()
+    assert recording_reader(file)("> ") == " "
+    assert file.getvalue() == " \n"
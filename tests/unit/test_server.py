@@ -0,0 +1,184 @@
+# type: ignore
+"""Test JSON over HTTP service of the books storage."""
+
+import asyncio
+import json
+
+import pytest
+
+from src.console_core.server import BookServer
+from src.console_core.utils.crud import BookCRUD
+
+
+class Client:
+    """HTTP/1.1 client keeping one connection."""
+
+    def __init__(self, port):
+        """Init client of the local port."""
+        self.port = port
+        self.reader = self.writer = None
+
+    async def request(self, method, path, data=None, headers=None):
+        """Return status, headers and JSON body of the response."""
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(
+                "127.0.0.1", self.port
+            )
+        body = b"" if data is None else json.dumps(data).encode()
+        head = [f"{method} {path} HTTP/1.1", f"Content-Length: {len(body)}"]
+        head.extend(f"{k}: {v}" for k, v in (headers or {}).items())
+        self.writer.write(("\r\n".join(head) + "\r\n\r\n").encode() + body)
+        await self.writer.drain()
+
+        status = int((await self.reader.readline()).split()[1])
+        response_headers = {}
+        while (line := await self.reader.readline()) != b"\r\n":
+            name, _, value = line.decode().partition(":")
+            response_headers[name.lower()] = value.strip()
+        length = int(response_headers["content-length"])
+        body = await self.reader.readexactly(length)
+        return status, response_headers, json.loads(body) if body else None
+
+    async def close(self):
+        """Close the connection."""
+        if self.writer is not None:
+            self.writer.close()
+            await self.writer.wait_closed()
+
+
+def run_server(path, scenario):
+    """Run the scenario with a client of the started server."""
+
+    async def main():
+        server = BookServer(path=path, port=0)
+        await server.start()
+        client = Client(server.port)
+        try:
+            return await scenario(client, server)
+        finally:
+            await client.close()
+            await server.close()
+
+    return asyncio.run(main())
+
+
+@pytest.mark.all
+@pytest.mark.unit
+def test_server_books(catalog_path) -> None:
+    """Positive test books are listed, added, updated and deleted."""
+
+    async def scenario(client, server):
+        status, _, page = await client.request("GET", "/books?limit=2")
+        assert status == 200
+        assert [book["id"] for book in page["books"]] == [1, 2]
+        status, _, page = await client.request("GET", "/books?after=2")
+        assert page == {"books": [page["books"][0]], "next": None}
+        assert page["books"][0]["id"] == 3
+
+        status, _, page = await client.request("GET", "/books?find=Tolstoy")
+        assert [book["title"] for book in page["books"]] == ["W&P"]
+
+        book = {"title": "Poems", "author": "Esenin", "year": "1918"}
+        status, _, added = await client.request("POST", "/books", book)
+        assert (status, added) == (201, {"ids": [4], "rejects": []})
+
+        status, headers, book = await client.request("GET", "/books/4")
+        assert (status, book["status"]) == (200, "в наличии.")
+        version = headers["etag"]
+
+        status, _, book = await client.request(
+            "PATCH", "/books/4", {"status": "выдана"}, {"If-Match": version}
+        )
+        assert (status, book["status"]) == (200, "выдана")
+        status, _, error = await client.request(
+            "DELETE", "/books/4", headers={"If-Match": version}
+        )
+        assert status == 409
+        assert "changed by another session" in error["error"]
+
+        status, _, _ = await client.request("DELETE", "/books/4")
+        assert status == 204
+        status, _, _ = await client.request("GET", "/books/4")
+        assert status == 404
+
+    run_server(catalog_path, scenario)
+    assert BookCRUD(file_path=catalog_path).get_book(4) is None
+
+
+@pytest.mark.all
+@pytest.mark.unit
+def test_server_refuses_requests(catalog_path) -> None:
+    """Negative test invalid requests are refused, the connection kept."""
+
+    async def scenario(client, server):
+        requests = [
+            ("GET", "/authors", None, 404),
+            ("PUT", "/books", None, 405),
+            ("GET", "/books/one", None, 400),
+            ("GET", "/books?limit=0", None, 400),
+            ("PATCH", "/books/1", {"status": "lost"}, 400),
+            ("PATCH", "/books/9", {"status": "выдана"}, 404),
+            ("POST", "/books", [{"title": "Poems"}, "broken"], 400),
+        ]
+        for method, path, data, expected in requests:
+            status, _, body = await client.request(method, path, data)
+            assert status == expected, path
+            assert body
+
+    run_server(catalog_path, scenario)
+    assert BookCRUD(file_path=catalog_path).next_id() == 4
+
+
+@pytest.mark.all
+@pytest.mark.unit
+def test_server_concurrent_clients(catalog_path) -> None:
+    """Positive test concurrent clients get distinct IDs, all persisted."""
+
+    async def add(port, number):
+        client = Client(port)
+        try:
+            book = {"title": f"Book {number}", "author": "Author", "year": 1}
+            for _ in range(5):
+                status, _, added = await client.request("POST", "/books", book)
+                assert status == 201
+                yield added["ids"][0]
+        finally:
+            await client.close()
+
+    async def scenario(client, server):
+        async def collect(number):
+            return [book_id async for book_id in add(server.port, number)]
+
+        results = await asyncio.gather(*(collect(n) for n in range(20)))
+        return [book_id for ids in results for book_id in ids]
+
+    ids = run_server(catalog_path, scenario)
+    assert sorted(ids) == list(range(4, 104))
+    assert sum(1 for _ in BookCRUD(file_path=catalog_path).iter_books()) == 103
+
+
+@pytest.mark.all
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "head, expected",
+    [
+        (f"GET /books?find={'x' * 70_000} HTTP/1.1\r\n", 414),
+        (f"GET /books HTTP/1.1\r\nX-Long: {'x' * 70_000}\r\n", 431),
+    ],
+    ids=["request-line", "header"],
+)
+def test_server_refuses_long_head(catalog_path, head, expected) -> None:
+    """Negative test too long request head is answered and closed."""
+
+    async def scenario(client, server):
+        reader, writer = await asyncio.open_connection(
+            "127.0.0.1", server.port
+        )
+        writer.write(head.encode() + b"\r\n")
+        response = await reader.read()
+        writer.close()
+        return response
+
+    response = run_server(catalog_path, scenario)
+    assert response.startswith(f"HTTP/1.1 {expected} ".encode())
+    assert b"Connection: close" in response
@@ -0,0 +1,185 @@
+# type: ignore
+"""Test sharded books CRUD."""
+
+from functools import partial
+
+import pytest
+
+from src.console_core.commands import main
+from src.console_core.utils.backends import make_storage
+from src.console_core.utils.crud import BookCRUD
+from src.console_core.utils.sharded_crud import ShardedBookCRUD
+
+
+def make_books(first_id, count) -> list[dict]:
+    """Return book records with consecutive IDs."""
+    return [
+        {
+            "id": book_id,
+            "title": f"Title {book_id}",
+            "author": f"Author {book_id % 7}",
+            "year": str(1900 + book_id % 50),
+            "status": "в наличии.",
+        }
+        for book_id in range(first_id, first_id + count)
+    ]
+
+
+def read_pages(fetch) -> list[str]:
+    """Return books of all pages following cursors."""
+    books, cursor = [], None
+    while True:
+        page = fetch(cursor=cursor)
+        books.extend(page.items)
+        if page.next_cursor is None:
+            return books
+        cursor = page.next_cursor
+
+
+@pytest.fixture()
+def sharded(tmp_path):
+    """Return sharded CRUD holding 60 books in several shards."""
+    storage = ShardedBookCRUD(tmp_path / "shards", max_shard_bytes=2048)
+    storage.insert_books(make_books(1, 60))
+    return storage
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_shard_is_split_by_size(sharded) -> None:
+    """Positive test big shard is split into parts by ID."""
+    files = sorted(sharded.DIR_PATH.glob("books-*.json"))
+
+    assert len(files) > 2
+    assert all(file.stat().st_size <= 2048 for file in files)
+    assert [book["id"] for book in sharded.iter_books()] == list(range(1, 61))
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_sharded_same_results_as_json(sharded, tmp_path) -> None:
+    """Positive test sharded storage answers like one JSON catalog."""
+    crud = BookCRUD(file_path=tmp_path / "books.json")
+    crud.insert_books(make_books(1, 60))
+    for storage in (crud, sharded):
+        storage.allocate_ids(60)
+        assert storage.update_status_books([5, 40, 99], "выдана") == [99]
+        assert storage.delete_books([6, 41]) == []
+        assert storage.delete_book_by_id(6) == "Book not found by ID 6 "
+        assert (
+            storage.add_book_input_data(
+                {"author": "Esenin", "title": "Poems", "year": "1918"}
+            )
+            is None
+        )
+
+    assert list(sharded.iter_books()) == list(crud.iter_books())
+    assert sharded.get_book(121) == crud.get_book(121)
+    assert list(sharded.find_book_by_part_info("author 3")) == list(
+        crud.find_book_by_part_info("author 3")
+    )
+    assert read_pages(partial(sharded.list_books_page, 7)) == list(
+        crud.select_all_books()
+    )
+    assert read_pages(partial(sharded.find_books_page, "title 1", 4)) == list(
+        crud.find_book_by_part_info("title 1")
+    )
+    assert read_pages(
+        partial(sharded.find_books_by_year_page, 1910, 1920, 5)
+    ) == crud.find_books_by_year_range(1910, 1920)
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_point_operation_writes_one_shard(sharded, mocker) -> None:
+    """Positive test status update touches one shard file."""
+    stamps = {
+        file: file.stat().st_mtime_ns
+        for file in sharded.DIR_PATH.glob("books-*.json")
+    }
+    save = mocker.spy(BookCRUD, "_save_books")
+
+    assert sharded.update_status_book(30, "выдана") is None
+
+    assert save.call_count == 1
+    changed = [
+        file
+        for file, mtime in stamps.items()
+        if file.stat().st_mtime_ns != mtime
+    ]
+    assert len(changed) == 1
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_split_leftovers_are_ignored(sharded) -> None:
+    """Negative test copies left by an interrupted split are skipped."""
+    first = BookCRUD(file_path=sharded.DIR_PATH / "books-1.json")
+    first.insert_books(make_books(55, 3))
+
+    reopened = ShardedBookCRUD(sharded.DIR_PATH, max_shard_bytes=1 << 20)
+
+    ids = [book["id"] for book in reopened.iter_books()]
+    assert ids == list(range(1, 61))
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_parallel_search_same_results(sharded, mocker) -> None:
+    """Positive test shards searched by workers give books in ID order."""
+    mocker.patch.object(ShardedBookCRUD, "PARALLEL_MIN_BYTES", 0)
+    parallel = ShardedBookCRUD(sharded.DIR_PATH, search_workers=2)
+    parallel.update_status_book(5, "выдана.")
+    try:
+        for query in ("title 1", "author 3", "19", "missing"):
+            found = list(parallel.find_books(query))
+
+            assert found == sorted(
+                sharded.find_books(query), key=lambda book: book["id"]
+            )
+            assert parallel._executor is not None
+        assert next(parallel.find_books("title 5"))["status"] == "выдана."
+    finally:
+        parallel.close()
+
+    assert parallel._executor is None
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_search_workers_setting(sharded, capsys, mocker, monkeypatch) -> None:
+    """Positive test find command fans out with BOOKS_SEARCH_WORKERS."""
+    mocker.patch.object(ShardedBookCRUD, "PARALLEL_MIN_BYTES", 0)
+    search = mocker.spy(ShardedBookCRUD, "_parallel_find_books")
+    argv = ["find", "title 1", "--storage", "sharded"]
+    argv += ["--path", str(sharded.DIR_PATH)]
+
+    assert main(argv) == 0
+    assert search.call_count == 0
+    serial = capsys.readouterr().out
+
+    monkeypatch.setenv("BOOKS_SEARCH_WORKERS", "2")
+    assert main(argv) == 0
+    assert search.call_count == 1
+    assert capsys.readouterr().out == serial
+
+    monkeypatch.setenv("BOOKS_SEARCH_WORKERS", "many")
+    with pytest.raises(ValueError):
+        make_storage("sharded", sharded.DIR_PATH)
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_small_catalog_searched_in_process(sharded) -> None:
+    """Positive test catalog under the threshold does not fan out."""
+    parallel = ShardedBookCRUD(sharded.DIR_PATH, search_workers=2)
+
+    assert len(list(parallel.find_books("title"))) == 60
+    assert parallel._executor is None
@@ -0,0 +1,156 @@
+# type: ignore
+"""Test SQLite books CRUD."""
+
+from functools import partial
+
+import pytest
+
+from src.__main__ import run
+from src.console_core.utils.backends import make_storage
+from src.console_core.utils.crud import BookCRUD
+from src.console_core.utils.sqlite_crud import (
+    SQLiteBookCRUD,
+    migrate_json_to_sqlite,
+)
+from src.models.book import InvalidInputBookData
+
+
+def read_pages(fetch) -> list[str]:
+    """Return books of all pages following cursors."""
+    books, cursor = [], None
+    while True:
+        page = fetch(cursor=cursor)
+        books.extend(page.items)
+        if page.next_cursor is None:
+            return books
+        cursor = page.next_cursor
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_sqlite_same_results_as_json(crud, sqlite_crud) -> None:
+    """Positive test SQLite storage answers like JSON storage."""
+    for storage in (crud, sqlite_crud):
+        assert (
+            storage.add_book_input_data(
+                {"author": "Esenin", "title": "Poems", "year": "1918"}
+            )
+            is None
+        )
+        assert storage.update_status_book(book_id=1, status="выдана") is None
+        assert storage.delete_book_by_id(2) is None
+
+    assert list(sqlite_crud.iter_books()) == list(crud.iter_books())
+    assert sqlite_crud.get_book(4) == crud.get_book(4)
+    for query in ("tol", "1918", "", "missing"):
+        assert list(sqlite_crud.find_book_by_part_info(query)) == list(
+            crud.find_book_by_part_info(query)
+        )
+    assert sqlite_crud.find_books_by_year_range(
+        1900, 1995
+    ) == crud.find_books_by_year_range(1900, 1995)
+    assert read_pages(partial(sqlite_crud.list_books_page, 2)) == list(
+        crud.select_all_books()
+    )
+    assert read_pages(
+        partial(sqlite_crud.find_books_by_year_page, 0, 3000, 1)
+    ) == crud.find_books_by_year_range(0, 3000)
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_sqlite_batch_changes(crud, sqlite_crud) -> None:
+    """Positive test SQLite batch changes match JSON storage."""
+    for storage in (crud, sqlite_crud):
+        assert storage.update_status_books([1, 3, 7], "выдана") == [7]
+        assert storage.delete_books([2, 2, 5]) == [5]
+
+    assert list(sqlite_crud.iter_books()) == list(crud.iter_books())
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_sqlite_errors(crud, sqlite_crud) -> None:
+    """Negative test SQLite storage returns the same error messages."""
+    assert sqlite_crud.delete_book_by_id(100) == crud.delete_book_by_id(100)
+    assert sqlite_crud.update_status_book(
+        100, "выдана"
+    ) == crud.update_status_book(100, "выдана")
+    assert sqlite_crud.add_book_input_data(
+        {"author": "", "title": "Poems", "year": "1918"}
+    ) == crud.add_book_input_data(
+        {"author": "", "title": "Poems", "year": "1918"}
+    )
+    with pytest.raises(InvalidInputBookData):
+        sqlite_crud.list_books_page(cursor="broken")
+    assert sqlite_crud.book_version(1) is None
+    with pytest.raises(ValueError):
+        sqlite_crud.update_status_book(1, "выдана", expected_version=0)
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_sqlite_ids_are_not_reused(sqlite_crud) -> None:
+    """Positive test sequence survives deleting the last book."""
+    assert sqlite_crud.delete_book_by_id(3) is None
+    assert sqlite_crud.allocate_ids(2) == range(4, 6)
+    sqlite_crud.add_book_input_data(
+        {"author": "Esenin", "title": "Poems", "year": "1918"}
+    )
+    assert sqlite_crud.get_book(6)["title"] == "Poems"
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_migrate_json_to_sqlite(crud, catalog_path, tmp_path) -> None:
+    """Positive test migration copies books and the ID sequence."""
+    crud.allocate_ids(5)
+    db_path = tmp_path / "migrated.db"
+
+    assert migrate_json_to_sqlite(catalog_path, db_path) == 3
+
+    storage = SQLiteBookCRUD(db_path=db_path)
+    assert list(storage.iter_books()) == list(crud.iter_books())
+    assert storage.next_id() == crud.next_id()
+    storage.close()
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_migrate_command(catalog_path, tmp_path, monkeypatch) -> None:
+    """Positive test migrate command of the command line."""
+    db_path = tmp_path / "migrated.db"
+    monkeypatch.setattr(
+        "sys.argv",
+        [
+            "src",
+            "migrate",
+            "--source",
+            str(catalog_path),
+            "--target",
+            str(db_path),
+        ],
+    )
+    with pytest.raises(SystemExit) as exc_info:
+        run()
+    assert exc_info.value.code == 0
+    assert len(list(SQLiteBookCRUD(db_path=db_path).iter_books())) == 3
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_make_storage(catalog_path, tmp_path, monkeypatch) -> None:
+    """Positive test storage is selected by name or environment."""
+    assert isinstance(make_storage("json", catalog_path), BookCRUD)
+    monkeypatch.setenv("BOOKS_STORAGE", "sqlite")
+    monkeypatch.setenv("BOOKS_PATH", str(tmp_path / "env.db"))
+    assert isinstance(make_storage(), SQLiteBookCRUD)
+    with pytest.raises(ValueError):
+        make_storage("csv")
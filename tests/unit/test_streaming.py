@@ -0,0 +1,85 @@
+# type: ignore
+"""Test streaming reader of the catalog."""
+
+import io
+import json
+
+import pytest
+
+from src.console_core.utils.streaming import (
+    apply_operations,
+    iter_json_array,
+    write_json_array,
+)
+
+BOOKS = [
+    {"id": 1, "title": "Мастер [и] Маргарита", "author": "A, B", "year": "1"},
+    {"id": 2, "title": 'Quote " {', "author": "C", "year": "2"},
+]
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+@pytest.mark.parametrize("chunk_size", [1, 5, 1 << 16])
+@pytest.mark.parametrize("indent", [None, 4])
+def test_iter_json_array(tmp_path, chunk_size, indent) -> None:
+    """Positive test items are decoded for any chunk size."""
+    path = tmp_path / "books.json"
+    for books in ([], BOOKS):
+        path.write_text(json.dumps(books, indent=indent, ensure_ascii=False))
+        assert list(iter_json_array(path, chunk_size=chunk_size)) == books
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+@pytest.mark.parametrize("text", ["", "{}", "[1, 2", "[1 2]", "[1,]", "[] 1"])
+def test_iter_json_array_invalid(tmp_path, text) -> None:
+    """Negative test broken file raises like json.load."""
+    path = tmp_path / "books.json"
+    path.write_text(text)
+    with pytest.raises(ValueError):
+        list(iter_json_array(path, chunk_size=2))
+
+
+@pytest.mark.all
+@pytest.mark.crud
+@pytest.mark.unit
+def test_apply_operations_and_write() -> None:
+    """Positive test journal overlay and formatting of the snapshot."""
+    operations = [
+        {"op": "status", "id": 1, "status": "выдана"},
+        {"op": "add", "book": dict(BOOKS[1], id=3)},
+        {"op": "delete", "id": 2},
+        {"op": "status", "id": 3, "status": "выдана"},
+    ]
+    books = list(apply_operations(json.loads(json.dumps(BOOKS)), operations))
+    assert books == [
+        dict(BOOKS[0], status="выдана"),
+        dict(BOOKS[1], id=3, status="выдана"),
+    ]
+
+    file = io.StringIO()
+    write_json_array(file, iter(books))
+    assert file.getvalue() == json.dumps(books, ensure_ascii=False, indent=4)
+
+
+@pytest.mark.all
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "items",
+    [
+        [],
+        [{}],
+        BOOKS,
+        [{"id": 1, "tags": ["a", "b"]}, {"a": {"b": None}}, 1.5, "s"],
+        [{"id": 1, "title": 'Say ",\n" and go', "year": None, "ok": True}],
+    ],
+    ids=["empty", "empty-item", "books", "nested", "escaped"],
+)
+def test_write_json_array_format(items) -> None:
+    """Positive test every item is formatted like json.dumps(indent=4)."""
+    file = io.StringIO()
+    write_json_array(file, iter(items))
+    assert file.getvalue() == json.dumps(items, ensure_ascii=False, indent=4)